@@ -92,16 +92,7 @@ class AcademicPerformanceAdmin(ChildCrfModelAdminMixin, admin.ModelAdmin):
             previous_appointment=True)
         ]
 
-    @property
-    def quarterly_schedules(self):
-        schedules = self.cohort_schedules_cls.objects.filter(
-            schedule_type__icontains='quarterly',
-            onschedule_model__startswith='flourish_child').values_list(
-                'schedule_name', flat=True)
-        return schedules
-
-    @property
-    def conditional_fieldlists(self):
+    def get_conditional_fieldlists(self):
         conditional_fieldlists = {
             'primary': Insert('mathematics_marks',
                               'science_marks',
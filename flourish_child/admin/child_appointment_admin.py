@@ -18,6 +18,7 @@ from ..admin_site import flourish_child_admin
 from ..forms import AppointmentForm
 from ..models import Appointment
 from .exportaction_mixin import ExportActionMixin
+from .keyset_changelist import FastChangeListMixin
 
 
 @admin.register(Appointment, site=flourish_child_admin)
@@ -25,7 +26,7 @@ class AppointmentAdmin(ModelAdminFormInstructionsMixin, ModelAdminNextUrlRedirec
                        ModelAdminFormAutoNumberMixin, ModelAdminRevisionMixin,
                        ModelAdminAuditFieldsMixin, ModelAdminRedirectOnDeleteMixin,
                        ModelAdminReadOnlyMixin, ModelAdminSiteMixin,
-                       ExportActionMixin, admin.ModelAdmin):
+                       ExportActionMixin, FastChangeListMixin, admin.ModelAdmin):
 
     post_url_on_delete_name = settings.DASHBOARD_URL_NAMES.get(
         'child_dashboard_url')
@@ -35,6 +36,7 @@ class AppointmentAdmin(ModelAdminFormInstructionsMixin, ModelAdminNextUrlRedirec
     model = Appointment
 
     form = AppointmentForm
+    fast_changelist = True
     date_hierarchy = 'appt_datetime'
     list_display = ('subject_identifier', '__str__',
                     'appt_datetime', 'appt_type', 'appt_status')
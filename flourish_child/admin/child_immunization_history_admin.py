@@ -1,6 +1,6 @@
 from django.apps import apps as django_apps
 from django.contrib import admin
-from django.db.models import Q
+from django.db.models import F, Subquery
 
 from edc_fieldsets.fieldlist import Fieldlist
 from edc_fieldsets.fieldsets_modeladmin_mixin import FormLabel
@@ -9,7 +9,9 @@ from edc_model_admin import TabularInlineMixin, audit_fieldset_tuple
 from ..admin_site import flourish_child_admin
 from ..forms import (
     ChildImmunizationHistoryForm, VaccinesReceivedForm, VaccinesMissedForm)
-from ..models import ChildImmunizationHistory, VaccinesMissed, VaccinesReceived, BirthFeedingVaccine
+from ..models import (
+    BirthFeedingVaccine, BirthVaccines, ChildImmunizationHistory, VaccinesMissed,
+    VaccinesReceived)
 from .model_admin_mixins import ChildCrfModelAdminMixin
 
 
@@ -91,16 +93,7 @@ class ChildImmunizationHistoryAdmin(ChildCrfModelAdminMixin, admin.ModelAdmin):
             previous_appointment=True)
     ]
 
-    @property
-    def quarterly_and_fu_schedules(self):
-        schedules = self.cohort_schedules_cls.objects.filter(
-            Q(schedule_type__icontains='quarterly') | Q(schedule_name__icontains='_fu_'),
-            onschedule_model__startswith='flourish_child').values_list(
-            'schedule_name', flat=True)
-        return schedules
-
-    @property
-    def conditional_fieldlists(self):
+    def get_conditional_fieldlists(self):
         conditional_fieldlists = {}
         for schedule in self.quarterly_and_fu_schedules:
             conditional_fieldlists.update(
@@ -133,36 +126,32 @@ class ChildImmunizationHistoryAdmin(ChildCrfModelAdminMixin, admin.ModelAdmin):
 
     def get_model_data_per_visit(self, subject_identifier=None,
                                  child_visit=None):
+        """Returns a dict of model name to the previous vaccine rows grouped
+        by visit code. Each model is read with one query projecting the
+        vaccine fields and the visit code of its parent CRF.
+        """
         model_dict = {}
         for model_name in self.extra_context_models:
-            data_dict = {}
-
             if model_name == 'birthvaccines':
-
-                try:
-                    birth_feeding_obj = BirthFeedingVaccine.objects.filter(
-                        child_visit__subject_identifier=subject_identifier).earliest('report_datetime')
-
-                except BirthFeedingVaccine.DoesNotExist:
-                    pass
-                else:
-                    model_objs = birth_feeding_obj.birthvaccines_set.all()
-                    for model_obj in model_objs:
-                        visit_code = birth_feeding_obj.visit.visit_code
-                        data_dict.setdefault(visit_code, [])
-                        data_dict[visit_code].append(model_obj)
-                model_dict.update({model_name: data_dict})
-
+                birth_feeding_vaccine = BirthFeedingVaccine.objects.filter(
+                    child_visit__subject_identifier=subject_identifier).order_by(
+                        'report_datetime').values('id')[:1]
+                rows = BirthVaccines.objects.filter(
+                    birth_feed_vaccine=Subquery(birth_feeding_vaccine)).values(
+                        'vaccination', 'vaccine_date',
+                        visit_code=F('birth_feed_vaccine__child_visit__visit_code'))
             else:
-
                 model_cls = django_apps.get_model(f'flourish_child.{model_name}')
-                model_objs = model_cls.objects.filter(
+                field_names = [field.name for field in model_cls._meta.concrete_fields]
+                rows = model_cls.objects.filter(
                     child_immunization_history__child_visit__subject_identifier=subject_identifier).exclude(
-                    child_immunization_history__child_visit=child_visit)
-                for model_obj in model_objs:
-                    visit_code = model_obj.child_immunization_history.visit_code
-                    data_dict.setdefault(visit_code, [])
-                    data_dict[visit_code].append(model_obj)
+                    child_immunization_history__child_visit=child_visit).order_by(
+                        'child_immunization_history__report_datetime').values(
+                            *field_names,
+                            visit_code=F('child_immunization_history__child_visit__visit_code'))
 
-                model_dict.update({model_name: data_dict})
+            data_dict = {}
+            for row in rows:
+                data_dict.setdefault(row.get('visit_code'), []).append(row)
+            model_dict.update({model_name: data_dict})
         return model_dict
@@ -1,5 +1,4 @@
 from django.contrib import admin
-from django.db.models import Q
 from edc_fieldsets.fieldlist import Insert
 from edc_fieldsets.fieldsets_modeladmin_mixin import FormLabel
 from edc_model_admin import (StackedInlineMixin, ModelAdminFormAutoNumberMixin,
@@ -100,16 +99,7 @@ class ChildMedicalHistoryAdmin(ChildCrfModelAdminMixin, admin.ModelAdmin):
             previous_appointment=True)
     ]
 
-    @property
-    def quarterly_and_fu_schedules(self):
-        schedules = self.cohort_schedules_cls.objects.filter(
-            Q(schedule_type__icontains='quarterly') | Q(schedule_name__icontains='_fu_'),
-            onschedule_model__startswith='flourish_child').values_list(
-            'schedule_name', flat=True)
-        return schedules
-
-    @property
-    def conditional_fieldlists(self):
+    def get_conditional_fieldlists(self):
         conditional_fieldlists = {}
         for schedule in self.quarterly_and_fu_schedules:
             conditional_fieldlists.update(
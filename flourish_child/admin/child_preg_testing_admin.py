@@ -40,25 +40,7 @@ class ChildPregTestingAdmin(ChildCrfModelAdminMixin, admin.ModelAdmin):
                       'child_c_sec_qt_schedule1',
                       'child_c_quart_schedule1', ]
         
-    @property
-    def quarterly_schedules(self):
-        schedules = self.cohort_schedules_cls.objects.filter(
-            schedule_type__icontains='quarterly',
-            onschedule_model__startswith='flourish_child').values_list(
-                'schedule_name', flat=True)
-        return schedules
-
-    @property
-    def fu_schedules(self):
-        schedules = self.cohort_schedules_cls.objects.filter(
-            schedule_type__icontains='followup',
-            onschedule_model__startswith='flourish_child').exclude(
-                schedule_type__icontains='quarterly').values_list(
-                'schedule_name', flat=True)
-        return schedules
-
-    @property
-    def conditional_fieldlists(self):
+    def get_conditional_fieldlists(self):
         conditional_fieldlists = {}
         for schedule in self.quarterly_schedules:
             conditional_fieldlists.update(
@@ -1,6 +1,5 @@
 from django.apps import apps as django_apps
 from django.contrib import admin
-from django.db.models import Q
 from edc_fieldsets import Fieldlist
 from edc_model_admin import StackedInlineMixin
 from edc_model_admin import audit_fieldset_tuple
@@ -70,16 +69,7 @@ class ChildPreviousHospitalizationAdmin(ChildCrfModelAdminMixin,
             schedule_name = model_obj.schedule_name if model_obj else None
         return schedule_name
 
-    @property
-    def quarterly_and_fu_schedules(self):
-        schedules = self.cohort_schedules_cls.objects.filter(
-            Q(schedule_type__icontains='quarterly') | Q(schedule_name__icontains='_fu_'),
-            onschedule_model__startswith='flourish_child').values_list(
-            'schedule_name', flat=True)
-        return schedules
-
-    @property
-    def conditional_fieldlists(self):
+    def get_conditional_fieldlists(self):
         conditional_fieldlists = {}
         for schedule in self.quarterly_and_fu_schedules:
             conditional_fieldlists.update(
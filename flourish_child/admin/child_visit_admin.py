@@ -17,6 +17,7 @@ from ..admin_site import flourish_child_admin
 from ..forms import ChildVisitForm
 from ..models import ChildVisit
 from .exportaction_mixin import ExportActionMixin
+from .keyset_changelist import FastChangeListMixin
 
 
 class ModelAdminMixin(ModelAdminNextUrlRedirectMixin, ModelAdminFormAutoNumberMixin,
@@ -50,10 +51,12 @@ class ModelAdminMixin(ModelAdminNextUrlRedirectMixin, ModelAdminFormAutoNumberMi
 
 @admin.register(ChildVisit, site=flourish_child_admin)
 class ChildVisitAdmin(
-        ModelAdminMixin, VisitModelAdminMixin, admin.ModelAdmin):
+        ModelAdminMixin, FastChangeListMixin, VisitModelAdminMixin, admin.ModelAdmin):
 
     form = ChildVisitForm
 
+    fast_changelist = True
+
     fieldsets = (
         (None, {
             'fields': [
@@ -0,0 +1,175 @@
+from django.contrib.admin.views.main import ChangeList, ORDER_VAR
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from django.utils.functional import cached_property
+from django.utils.http import urlencode
+
+CURSOR_VAR = 'after'
+BEFORE_VAR = 'before'
+
+
+class EstimatedCountPaginator(Paginator):
+    """ Paginator that does not run a full `COUNT(*)`.
+
+    * Unfiltered querysets use the table's row estimate from the database
+      statistics (PostgreSQL `pg_class`, MySQL `information_schema`).
+    * Otherwise rows are counted up to `count_cap` only, larger results
+      report the estimate or the cap.
+    """
+
+    count_cap = 10000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        estimate = None
+        if not queryset.query.where:
+            estimate = self.estimated_count(queryset.model)
+            if estimate and estimate > self.count_cap:
+                return estimate
+        capped = queryset.order_by().values('pk')[:self.count_cap].count()
+        if capped < self.count_cap:
+            return capped
+        return max(estimate or 0, self.count_cap)
+
+    def estimated_count(self, model):
+        connection = connections[model.objects.db]
+        table = model._meta.db_table
+        if connection.vendor == 'postgresql':
+            sql = 'SELECT reltuples::bigint FROM pg_class WHERE relname = %s'
+        elif connection.vendor == 'mysql':
+            sql = ('SELECT TABLE_ROWS FROM information_schema.TABLES '
+                   'WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s')
+        else:
+            return None
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [table])
+            row = cursor.fetchone()
+        return int(row[0]) if row and row[0] and row[0] > 0 else None
+
+
+class KeysetChangeList(ChangeList):
+    """ Changelist that pages by seeking on (`modified`, `id`) instead of
+        by offset, while the default ordering is in use.
+
+    The first page is the usual first page ordered by -modified, -id. Its
+    `next_cursor_url` links to the rows after the last one shown, read
+    with `WHERE (modified, id) < (last modified, last id) LIMIT n`, and
+    `previous_cursor_url` to the rows before the first one shown, read
+    the other way round, so every page costs the same however deep.
+    Sorting by a column falls back to offset pages. No date hierarchy
+    aggregates are run.
+    """
+
+    keyset_ordering = ['-modified', '-id']
+
+    def __init__(self, request, *args, **kwargs):
+        super().__init__(request, *args, **kwargs)
+        self.date_hierarchy = None
+
+    @property
+    def keyset_paging(self):
+        return ORDER_VAR not in self.params and not self.show_all
+
+    def get_ordering(self, request, queryset):
+        if ORDER_VAR not in self.params:
+            return list(self.keyset_ordering)
+        return super().get_ordering(request, queryset)
+
+    def get_results(self, request):
+        direction, cursor = getattr(request, 'keyset_cursor', None) or (None, None)
+        cursor = self.parse_cursor(cursor)
+        self.next_cursor_url = None
+        self.previous_cursor_url = None
+        if not (self.keyset_paging and cursor):
+            super().get_results(request)
+            if self.keyset_paging and self.multi_page:
+                self.set_cursors(list(self.result_list), more_after=True)
+            return
+
+        modified, pk = cursor
+        if direction == BEFORE_VAR:
+            rows = list(self.queryset.filter(
+                Q(modified__gt=modified) | Q(modified=modified, id__gt=pk)).order_by(
+                    'modified', 'id')[:self.list_per_page + 1])
+            more_before = len(rows) > self.list_per_page
+            rows = rows[:self.list_per_page][::-1]
+            more_after = True
+        else:
+            rows = list(self.queryset.filter(
+                Q(modified__lt=modified) | Q(modified=modified, id__lt=pk)).order_by(
+                    *self.keyset_ordering)[:self.list_per_page + 1])
+            more_after = len(rows) > self.list_per_page
+            rows = rows[:self.list_per_page]
+            more_before = True
+
+        paginator = self.model_admin.get_paginator(
+            request, self.queryset, self.list_per_page)
+        self.result_count = paginator.count
+        self.show_full_result_count = False
+        self.show_admin_actions = True
+        self.full_result_count = None
+        self.result_list = rows
+        self.can_show_all = False
+        self.multi_page = True
+        self.paginator = paginator
+        self.set_cursors(rows, more_after=more_after, more_before=more_before)
+
+    def set_cursors(self, rows, more_after=False, more_before=False):
+        if more_after and rows:
+            self.next_cursor_url = self.cursor_url(CURSOR_VAR, rows[-1])
+        if more_before and rows:
+            self.previous_cursor_url = self.cursor_url(BEFORE_VAR, rows[0])
+
+    def cursor_url(self, var=None, row=None):
+        params = dict(self.params)
+        if var:
+            params.update({var: f'{row.modified.isoformat()}|{row.pk}'})
+        return '?' + urlencode(sorted(params.items()))
+
+    def parse_cursor(self, cursor=None):
+        try:
+            modified, pk = cursor.rsplit('|', 1)
+        except (AttributeError, ValueError):
+            return None
+        modified = parse_datetime(modified)
+        return (modified, pk) if modified and pk else None
+
+
+class FastChangeListMixin:
+    """ Model admin mixin for an optional constant time changelist on large
+        tables; estimated counts, keyset pagination on (modified, id) and
+        no date hierarchy. Enable with `fast_changelist = True`.
+    """
+
+    # Set True on admins of large tables for estimated counts and keyset
+    # pagination on (modified, id), see `KeysetChangeList`. The model needs
+    # a `models.Index(fields=['modified', 'id'])` for the seek.
+    fast_changelist = False
+
+    @property
+    def show_full_result_count(self):
+        return not self.fast_changelist
+
+    def get_paginator(self, request, queryset, per_page, orphans=0,
+                      allow_empty_first_page=True):
+        if self.fast_changelist:
+            return EstimatedCountPaginator(
+                queryset, per_page, orphans, allow_empty_first_page)
+        return super().get_paginator(
+            request, queryset, per_page, orphans, allow_empty_first_page)
+
+    def get_changelist(self, request, **kwargs):
+        if self.fast_changelist:
+            return KeysetChangeList
+        return super().get_changelist(request, **kwargs)
+
+    def get_changelist_instance(self, request):
+        if self.fast_changelist:
+            for var in (CURSOR_VAR, BEFORE_VAR):
+                if var in request.GET:
+                    request.GET = request.GET.copy()
+                    request.keyset_cursor = (var, request.GET.pop(var)[0])
+        return super().get_changelist_instance(request)
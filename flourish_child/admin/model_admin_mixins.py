@@ -3,7 +3,9 @@ import datetime
 from django.apps import apps as django_apps
 from django.conf import settings
 from django.contrib import admin
-from django.core.exceptions import ObjectDoesNotExist
+from django.contrib.admin.views.main import ChangeList
+from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from django.db.models import Q
 from django.urls.base import reverse
 from django.urls.exceptions import NoReverseMatch
 from django.utils import timezone
@@ -21,6 +23,8 @@ from edc_visit_tracking.modeladmin_mixins import (
 from simple_history.admin import SimpleHistoryAdmin
 
 from .exportaction_mixin import ExportActionMixin
+from .keyset_changelist import FastChangeListMixin, KeysetChangeList
+from ..helper_classes.cohort_schedule_types import cohort_schedule_types
 from ..helper_classes.utils import child_utils
 
 
@@ -31,7 +35,8 @@ class ModelAdminMixin(ModelAdminNextUrlRedirectMixin,
                       ModelAdminInstitutionMixin,
                       ModelAdminRedirectOnDeleteMixin,
                       ModelAdminSiteMixin,
-                      ExportActionMixin):
+                      ExportActionMixin,
+                      FastChangeListMixin):
 
     list_per_page = 10
     date_hierarchy = 'modified'
@@ -39,6 +44,27 @@ class ModelAdminMixin(ModelAdminNextUrlRedirectMixin,
     next_form_getter_cls = NextFormGetter
 
 
+class ListOnlyFieldsChangeListMixin:
+    """ Changelist mixin that loads only the model admin's
+        `get_list_only_fields` for the rows of the page. Admin actions
+        read `get_queryset` and still get whole rows.
+    """
+
+    def get_results(self, request):
+        only_fields = self.model_admin.get_list_only_fields(request)
+        if only_fields:
+            self.queryset = self.queryset.only(*only_fields)
+        super().get_results(request)
+
+
+class CrfChangeList(ListOnlyFieldsChangeListMixin, ChangeList):
+    pass
+
+
+class CrfKeysetChangeList(ListOnlyFieldsChangeListMixin, KeysetChangeList):
+    pass
+
+
 class ExportRequisitionCsvMixin:
 
     def fix_date_format(self, obj_dict=None):
@@ -89,11 +115,98 @@ class ChildCrfModelAdminMixin(
         model_name = 'flourish_caregiver.cohortschedules'
         return django_apps.get_model(model_name)
 
+    @property
+    def quarterly_schedules(self):
+        return cohort_schedule_types.quarterly
+
+    @property
+    def fu_schedules(self):
+        return cohort_schedule_types.followup
+
+    @property
+    def quarterly_and_fu_schedules(self):
+        return cohort_schedule_types.quarterly_and_fu
+
+    @property
+    def conditional_fieldlists(self):
+        """Returns the schedule dependent fieldlists, built once per admin
+        class and rebuilt only when the cohort schedules change.
+        """
+        admin_cls = type(self)
+        cached = admin_cls.__dict__.get('_conditional_fieldlists')
+        if not cached or cached[0] != cohort_schedule_types.version:
+            cached = (cohort_schedule_types.version,
+                      self.get_conditional_fieldlists())
+            admin_cls._conditional_fieldlists = cached
+        return cached[1]
+
+    def get_conditional_fieldlists(self):
+        return {}
+
     def post_url_on_delete_kwargs(self, request, obj):
         return dict(
             subject_identifier=obj.child_visit.subject_identifier,
             appointment=str(obj.child_visit.appointment.id))
 
+    def get_list_select_related(self, request):
+        """Joins the visit and its appointment, read per row by the visit
+        column and `view_on_site`, onto the changelist query.
+        """
+        list_select_related = super().get_list_select_related(request)
+        if list_select_related is True:
+            return list_select_related
+        visit_attr = self.model.visit_model_attr()
+        return list(dict.fromkeys(
+            [visit_attr, f'{visit_attr}__appointment']
+            + list(list_select_related or [])))
+
+    def get_list_only_fields(self, request):
+        """Returns the CRF fields the changelist needs, or None to load all
+        fields if a list column is not a plain model field.
+        """
+        field_names = [field.name for field in self.model._meta.concrete_fields]
+        list_display = [name for name in self.get_list_display(request)
+                        if name != 'action_checkbox']
+        if any(name not in field_names for name in list_display):
+            return None
+        ordering = [name.lstrip('-') for name in self.get_ordering(request) or []]
+        required = ['id', self.model.visit_model_attr(), 'modified', 'created',
+                    'report_datetime', self.date_hierarchy]
+        return [name for name in field_names
+                if name in list_display + ordering + required]
+
+    def get_changelist(self, request, **kwargs):
+        if self.fast_changelist:
+            return CrfKeysetChangeList
+        return CrfChangeList
+
+    def get_search_results(self, request, queryset, search_term):
+        """Searches by subject identifier, optionally followed by a visit
+        code, as a prefix lookup on the indexed visit columns. Other
+        search terms fall back to the `search_fields` search.
+        """
+        visits = self.search_visits(search_term)
+        if visits is not None:
+            visit_attr = self.model.visit_model_attr()
+            return queryset.filter(**{f'{visit_attr}__in': visits}), False
+        return super().get_search_results(request, queryset, search_term)
+
+    def search_visits(self, search_term):
+        """Returns a queryset of the ids of the visits whose subject
+        identifier (and visit code) start with the search term, or None if
+        no visit matches.
+        """
+        bits = search_term.split()
+        if not 0 < len(bits) < 3:
+            return None
+        visit_model_cls = self.model._meta.get_field(
+            self.model.visit_model_attr()).related_model
+        options = {'subject_identifier__startswith': bits[0]}
+        if len(bits) == 2:
+            options.update(visit_code__startswith=bits[1])
+        visits = visit_model_cls.objects.filter(**options)
+        return visits.values('id') if visits.exists() else None
+
     def view_on_site(self, obj):
         dashboard_url_name = settings.DASHBOARD_URL_NAMES.get(
             'child_dashboard_url')
@@ -114,34 +227,74 @@ class ChildCrfModelAdminMixin(
             pk=request.GET.get('appointment'))
         return None
 
+    def request_cache(self, request):
+        """Returns a dict cached on the request, shared by the fieldset,
+        form and key lookups of this request.
+        """
+        if not hasattr(request, '_child_crf_admin_cache'):
+            request._child_crf_admin_cache = {}
+        return request._child_crf_admin_cache
+
     def get_previous_instance(self, request, instance=None, **kwargs):
         """Returns a model instance that is the first occurrence of a previous
         instance relative to this object's appointment.
+
+        The latest instance of this model for the subject with an appointment
+        before this one, on the subject's (non TB/FACET) schedules, is loaded
+        with one query and memoized per request. If there is none, the walk
+        back continues from the earliest of those appointments by
+        `previous_by_timepoint`, as `child_utils.get_previous_appt_instance`
+        does, e.g. into a schedule the subject was on before.
         """
-        obj = None
         appointment = instance or self.get_instance(request)
+        if not appointment:
+            return None
+
+        cache = self.request_cache(request)
+        key = ('previous_instance', self.model._meta.label_lower, appointment.pk)
+        if key not in cache:
+            schedule_names = child_utils.subject_schedule_history_cls.objects.filter(
+                subject_identifier=appointment.subject_identifier).exclude(
+                Q(schedule_name__icontains='tb') | Q(
+                    schedule_name__icontains='facet')).values('schedule_name')
+            previous_appointments = appointment.__class__.objects.filter(
+                subject_identifier=appointment.subject_identifier,
+                appt_datetime__lt=appointment.appt_datetime,
+                schedule_name__in=schedule_names,
+                visit_code_sequence=0)
+            appointment_attr = f'{self.model.visit_model_attr()}__appointment'
+            obj = self.model.objects.filter(**{
+                f'{appointment_attr}__in': previous_appointments}).order_by(
+                    f'-{appointment_attr}__appt_datetime').first()
+            if not obj:
+                obj = self.get_previous_instance_by_timepoint(
+                    previous_appointments.order_by('appt_datetime').first()
+                    or appointment)
+            cache[key] = obj
+        return cache[key]
 
-        if appointment:
-            while appointment:
-                options = {
-                    '{}__appointment'.format(self.model.visit_model_attr()):
-                    child_utils.get_previous_appt_instance(appointment)}
-                try:
-                    obj = self.model.objects.get(**options)
-                except ObjectDoesNotExist:
-                    pass
-                else:
-                    break
+    def get_previous_instance_by_timepoint(self, appointment):
+        """Returns the first instance of this model walking back from
+        `appointment` with `child_utils.get_previous_appt_instance`.
+        """
+        appointment_attr = f'{self.model.visit_model_attr()}__appointment'
+        appointment = child_utils.get_previous_appt_instance(appointment)
+        while appointment:
+            try:
+                return self.model.objects.get(**{appointment_attr: appointment})
+            except ObjectDoesNotExist:
                 appointment = child_utils.get_previous_appt_instance(appointment)
-        return obj
+        return None
 
     def get_instance(self, request):
-        try:
-            appointment = self.get_appointment(request)
-        except ObjectDoesNotExist:
-            return None
-        else:
-            return appointment
+        cache = self.request_cache(request)
+        key = ('appointment', request.GET.get('appointment'))
+        if key not in cache:
+            try:
+                cache[key] = self.get_appointment(request)
+            except (ObjectDoesNotExist, ValueError, ValidationError):
+                cache[key] = None
+        return cache[key]
 
     def get_key(self, request, obj=None):
 
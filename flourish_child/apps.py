@@ -18,6 +18,8 @@ class AppConfig(DjangoAppConfig):
 
     def ready(self):
         from .models import child_consent_on_post_save
+        from .helper_classes.cohort_schedule_registry import cohort_schedule_registry
+        cohort_schedule_registry.populate()
 
 
 if settings.APP_NAME == 'flourish_child':
@@ -33,10 +33,8 @@ class AcademicPerformanceForm(ChildModelFormMixin):
         child_visit_id = initial.get(
             'child_visit', args[0]['child_visit'] if args else None)
 
-        try:
-            child_visit_obj = self.visit_model.objects.get(id=child_visit_id)
-        except self.visit_model.DoesNotExist:
-            child_visit_obj = None
+        self.prefill_resolver = self.prefill_resolver_cls(visit_id=child_visit_id)
+        child_visit_obj = self.prefill_resolver.visit
 
         if not instance and previous_instance:
             for key in self.base_fields.keys():
@@ -64,20 +62,23 @@ class AcademicPerformanceForm(ChildModelFormMixin):
 
     def child_social_education_level(self, child_visit):
         """
-        Get the child demographics from the same visit
+        Get the child demographics from the same visit, otherwise the latest
+        before it
         """
+        resolver = self.visit_prefill_resolver(child_visit)
+        child_socio_demographic = resolver.at_visit_or_latest(
+            self.child_socio_demographic_cls)
+        return getattr(child_socio_demographic, 'education_level', None)
 
-        try:
-            child_socio_demographic = self.child_socio_demographic_cls.objects.get(
-                child_visit=child_visit)
-        except self.child_socio_demographic_cls.DoesNotExist:
-            try:
-                child_socio_demographic = self.child_socio_demographic_cls.objects.filter(
-                    child_visit__subject_identifier=child_visit.subject_identifier,
-                    report_datetime__lte=child_visit.report_datetime).latest('report_datetime')
-            except self.child_socio_demographic_cls.DoesNotExist:
-                return None
-        return child_socio_demographic.education_level
+    def visit_prefill_resolver(self, child_visit):
+        """
+        Returns the form's prefill resolver if it is for this visit
+        """
+        resolver = getattr(self, 'prefill_resolver', None)
+        if not resolver or resolver.visit != child_visit:
+            resolver = self.prefill_resolver_cls(visit=child_visit)
+            self.prefill_resolver = resolver
+        return resolver
 
     def clean(self):
         previous_instance = getattr(self, 'previous_instance', None)
@@ -106,10 +107,11 @@ class AcademicPerformanceForm(ChildModelFormMixin):
                 }
                 raise forms.ValidationError(message)
 
-        try:
-            self.child_socio_demographic_cls.objects.get(
-                child_visit=child_visit)
-        except self.child_socio_demographic_cls.DoesNotExist:
+        socio_demographic = None
+        if child_visit:
+            socio_demographic = self.visit_prefill_resolver(child_visit).at_visit(
+                self.child_socio_demographic_cls)
+        if not socio_demographic:
             message = {
                     "education_level": ("Participant's socio demographic information "
                                         "is missing. Kindly complete the form first.")
@@ -8,6 +8,7 @@ from edc_visit_tracking.crf_date_validator import (
 from edc_visit_tracking.crf_date_validator import CrfReportDateIsFuture
 from edc_visit_tracking.modelform_mixins import VisitTrackingModelFormMixin
 
+from ..helper_classes.previous_crf_resolver import PreviousCrfResolver
 from ..models import ChildVisit
 
 
@@ -15,6 +16,7 @@ class ChildModelFormMixin(
     SiteModelFormMixin, VisitTrackingModelFormMixin,
     FormValidatorMixin, forms.ModelForm):
     visit_model = ChildVisit
+    prefill_resolver_cls = PreviousCrfResolver
 
     def clean(self):
         cleaned_data = super().clean()
@@ -55,6 +55,8 @@ class InfantFeedingForm(ChildModelFormMixin, forms.ModelForm):
                     initial[key] = getattr(previous_instance, key)
 
         subject_identifier = initial.get('subject_identifier', None)
+        self.prefill_resolver = self.prefill_resolver_cls(
+            subject_identifier=subject_identifier)
         for key in ['bf_start_dt', 'bf_start_dt_est', 'dt_formula_introduced', 'dt_formula_est']:
             key_value, _exists = self.prefill_bf_dates(key, subject_identifier)
             if _exists:
@@ -142,14 +144,13 @@ class InfantFeedingForm(ChildModelFormMixin, forms.ModelForm):
                    'dt_formula_introduced': 'formulafeed_start_dt',
                    'dt_formula_est': 'formulafeed_start_est'}
 
-        feeding_n_vaccine_objs = self.birth_feeding_and_vaccine_model_cls.objects.filter(
-            child_visit__subject_identifier=subject_identifier)
-        key_value = None
-        if feeding_n_vaccine_objs.exists():
-            feeding_n_vaccine_obj = feeding_n_vaccine_objs.latest(
-                'report_datetime')
-            key_value = getattr(feeding_n_vaccine_obj,
-                                key_map.get(key, key), None)
+        resolver = getattr(self, 'prefill_resolver', None)
+        if not resolver or resolver.subject_identifier != subject_identifier:
+            resolver = self.prefill_resolver_cls(
+                subject_identifier=subject_identifier)
+        feeding_n_vaccine_obj = resolver.latest(
+            self.birth_feeding_and_vaccine_model_cls)
+        key_value = getattr(feeding_n_vaccine_obj, key_map.get(key, key), None)
 
         return (key_value, True) if key_value else (key_value, False)
 
@@ -1,2 +1,3 @@
+from .bulk_onschedule_helper import BulkChildOnScheduleHelper
 from .child_fu_booking_helper import ChildFollowUpBookingHelper
 from .child_onschedule_helper import ChildOnScheduleHelper
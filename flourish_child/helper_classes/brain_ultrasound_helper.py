@@ -1,4 +1,3 @@
-import json
 import logging
 
 import requests
@@ -7,6 +6,7 @@ from django.conf import settings
 from edc_base import get_utcnow
 from edc_visit_schedule import site_visit_schedules
 
+from flourish_child.helper_classes.redcap_client import redcap_client, TTLCache
 from flourish_child.helper_classes.utils import child_utils
 
 logger = logging.getLogger(__name__)
@@ -16,6 +16,13 @@ class BrainUltrasoundHelper:
 
     child_bu_onschedule_model = 'flourish_child.onschedulechildbrainultrasound'
     child_bu_schedule_name = 'child_bu_schedule'
+    consent_form = 'ultrasound_consent_form_version_40'
+    consent_event = 'reconsent_arm_1'
+    consent_fields = ['reviewed_v4', 'answered_v4', 'asked_v4', 'verified_v4', 'copy_v4']
+    consent_mirror_model = 'flourish_child.ultrasoundconsentmirror'
+    consent_cache = TTLCache(ttl=getattr(settings, 'REDCAP_CACHE_TTL', 300))
+    redcap_client = redcap_client
+
     def __init__(self, child_subject_identifier, caregiver_subject_identifier):
         self.child_subject_identifier = child_subject_identifier
         self.caregiver_subject_identifier = caregiver_subject_identifier
@@ -89,36 +96,49 @@ class BrainUltrasoundHelper:
 
     def is_enrolled_brain_ultrasound(self):
         """Returns True if the child is enrolled on the brain ultrasound schedule."""
-
-        data = {
-            'token': getattr(settings, 'REDCAP_API_TOKEN', None),
-            'content': 'record',
-            'action': 'export',
-            'format': 'json',
-            'type': 'flat',
-            'csvDelimiter': '',
-            'records[0]': self.caregiver_subject_identifier,
-            'forms[0]': 'ultrasound_consent_form_version_40',
-            'events[0]': 'reconsent_arm_1',
-            'rawOrLabel': 'raw',
-            'rawOrLabelHeaders': 'raw',
-            'exportCheckboxLabel': 'false',
-            'exportSurveyFields': 'false',
-            'exportDataAccessGroups': 'false',
-            'returnFormat': 'json',
-        }
+        return self.consent_completed(
+            [self.caregiver_subject_identifier]).get(
+                self.caregiver_subject_identifier, False)
+
+    @classmethod
+    def consent_completed(cls, caregiver_subject_identifiers=[]):
+        """Returns a dict of caregiver subject identifier to True if the
+        ultrasound consent is complete. Reads the local consent mirror first,
+        caregivers not yet mirrored are exported from REDCap with one batched
+        request and cached for `REDCAP_CACHE_TTL` seconds. Failed exports are
+        logged, not cached.
+        """
+        completed = django_apps.get_model(
+            cls.consent_mirror_model).objects.consent_completed(
+                caregiver_subject_identifiers)
+        completed.update(cls.consent_cache.get_many([
+            subject_identifier for subject_identifier
+            in caregiver_subject_identifiers if subject_identifier not in completed]))
+        missing = [subject_identifier for subject_identifier
+                   in caregiver_subject_identifiers if subject_identifier not in completed]
+        if not missing:
+            return completed
 
         try:
-            results = requests.post(getattr(settings, 'REDCAP_API_URL', ''), data=data)
-            results.raise_for_status()
+            rows = cls.redcap_client.export_records(
+                records=missing,
+                forms=[cls.consent_form],
+                events=[cls.consent_event])
         except (requests.exceptions.RequestException, ValueError) as e:
             logger.error(f'Error: {e}')
-        else:
-            fields = ['reviewed_v4', 'answered_v4', 'asked_v4', 'verified_v4', 'copy_v4']
-            try:
-                json_result = results.json()
-                if json_result and isinstance(json_result[0], dict):
-                    return all(json_result[0].get(field) == '1' for field in fields)
-            except json.JSONDecodeError:
-                logger.error('Invalid JSON response: {}'.format(results.text))
-        return False
+            return completed
+
+        record_id_field = getattr(settings, 'REDCAP_RECORD_ID_FIELD', 'record_id')
+        fetched = {subject_identifier: False for subject_identifier in missing}
+        for row in rows:
+            if not isinstance(row, dict):
+                continue
+            subject_identifier = row.get(record_id_field)
+            if subject_identifier is None and len(missing) == 1:
+                subject_identifier = missing[0]
+            if subject_identifier in fetched:
+                fetched[subject_identifier] = all(
+                    row.get(field) == '1' for field in cls.consent_fields)
+        cls.consent_cache.set_many(fetched)
+        completed.update(fetched)
+        return completed
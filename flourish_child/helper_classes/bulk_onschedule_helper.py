@@ -0,0 +1,112 @@
+import logging
+from collections import namedtuple
+
+from dateutil.relativedelta import relativedelta
+from django.apps import apps as django_apps
+from django.db import transaction
+
+from .child_fu_booking_helper import ChildFollowUpBookingHelper
+from .child_onschedule_helper import ChildOnScheduleHelper
+from .cohort_schedule_registry import cohort_schedule_registry
+
+logger = logging.getLogger(__name__)
+
+Enrolment = namedtuple(
+    'Enrolment', ['subject_identifier', 'cohort', 'base_appt_datetime'])
+
+
+class BulkChildOnScheduleHelper(object):
+    """A helper class that puts many children on a schedule at once, e.g.
+    when a protocol amendment adds schedules for an existing cohort.
+
+    * Accepts a list of (subject_identifier, cohort, base_appt_datetime).
+    * Children already on the schedule and children without a dummy
+      consent are found with one query each per chunk.
+    * Each child is put on schedule through the schedule's
+      `put_on_schedule`, as in `ChildOnScheduleHelper`, so on-schedule,
+      history and appointment rows are exactly those of the normal path.
+    * Chunks are committed one transaction each, so a failed run can be
+      resumed by re-running it or by passing `resume_from`.
+    """
+
+    child_consent_model = 'flourish_child.childdummysubjectconsent'
+
+    def __init__(self, enrolments=None, chunk_size=500):
+        self.enrolments = [Enrolment(*enrolment) for enrolment in enrolments or []]
+        self.chunk_size = chunk_size
+        self.onschedule_helper = ChildOnScheduleHelper()
+        self.booking_helper = ChildFollowUpBookingHelper()
+
+    @property
+    def child_consent_model_cls(self):
+        return django_apps.get_model(self.child_consent_model)
+
+    def put_on_schedule(self, resume_from=0):
+        """ Puts the enrolments on schedule chunk by chunk, returns a dict of
+            the number created, skipped and failed, and the index to resume
+            from should a later chunk fail.
+        """
+        summary = dict(created=0, skipped=0, failed=[], resume_from=resume_from)
+        for start in range(resume_from, len(self.enrolments), self.chunk_size):
+            chunk = self.enrolments[start:start + self.chunk_size]
+            with transaction.atomic():
+                created, skipped, failed = self.put_chunk_on_schedule(chunk)
+            summary['created'] += created
+            summary['skipped'] += skipped
+            summary['failed'] += failed
+            summary['resume_from'] = start + len(chunk)
+            logger.info(
+                f'Bulk onschedule: {summary["resume_from"]} of '
+                f'{len(self.enrolments)} processed.')
+        return summary
+
+    def put_chunk_on_schedule(self, enrolments=[]):
+        created, skipped, failed = 0, 0, []
+        consented = self.consented(
+            [enrolment.subject_identifier for enrolment in enrolments])
+
+        by_cohort = {}
+        for enrolment in enrolments:
+            by_cohort.setdefault(enrolment.cohort, []).append(enrolment)
+
+        for cohort, cohort_enrolments in by_cohort.items():
+            cohort_schedule = cohort_schedule_registry.get(cohort)
+            schedule = cohort_schedule.schedule
+            schedule_name = cohort_schedule.schedule_name
+
+            onschedule = set(cohort_schedule.onschedule_model_cls.objects.filter(
+                subject_identifier__in=[
+                    enrolment.subject_identifier for enrolment in cohort_enrolments],
+                schedule_name=schedule_name).values_list(
+                    'subject_identifier', flat=True))
+
+            for enrolment in cohort_enrolments:
+                subject_identifier = enrolment.subject_identifier
+                if subject_identifier in onschedule:
+                    skipped += 1
+                    continue
+                if subject_identifier not in consented:
+                    failed.append((subject_identifier, 'Missing dummy consent obj.'))
+                    continue
+                onschedule.add(subject_identifier)
+                schedule.put_on_schedule(
+                    subject_identifier=subject_identifier,
+                    onschedule_datetime=enrolment.base_appt_datetime,
+                    schedule_name=schedule_name,
+                    base_appt_datetime=enrolment.base_appt_datetime)
+                created += 1
+
+                if (self.onschedule_helper.requires_fu_booking(cohort)
+                        and not self.onschedule_helper.aging_out(subject_identifier)):
+                    self.booking_helper.schedule_fu_booking(
+                        subject_identifier,
+                        enrolment.base_appt_datetime + relativedelta(years=1))
+        return created, skipped, failed
+
+    def consented(self, subject_identifiers=[]):
+        """ Returns the set of subject identifiers with a dummy consent,
+            loaded with one query.
+        """
+        return set(self.child_consent_model_cls.objects.filter(
+            subject_identifier__in=subject_identifiers).values_list(
+                'subject_identifier', flat=True))
@@ -1,16 +1,99 @@
+from collections import defaultdict, namedtuple
+
 from django.apps import apps as django_apps
 from datetime import date
 from dateutil.relativedelta import relativedelta
+from django.db import transaction
 from edc_base.utils import age
 
+from .clinic_calendar import clinic_calendar
+
+ChildData = namedtuple(
+    'ChildData', ['subject_identifier', 'child_dob', 'cohort', 'preg_enroll'])
+
+
+class FollowUpCalendar(object):
+    """ In-memory view of the follow up bookings over a booking horizon,
+        loaded with one query, on top of a snapshot of the clinic calendar.
+        Bookings and removals are recorded and written back in one
+        transaction by `save`.
+    """
+
+    title = 'Follow Up Schedule'
+
+    def __init__(self, participant_note_cls=None, start_date=None, end_date=None):
+        self.participant_note_cls = participant_note_cls
+        self.start_date = start_date
+        self.end_date = end_date
+        self.clinic_calendar = clinic_calendar.snapshot()
+        self.booked = defaultdict(list)
+        self.created = []
+        self.removed = []
+
+        notes = self.participant_note_cls.objects.filter(
+            title=self.title, date__gte=start_date, date__lt=end_date).values_list(
+                'subject_identifier', 'date')
+        for subject_identifier, booking_date in notes:
+            self.booked[booking_date].append(subject_identifier)
+
+    def is_holiday_or_weekend(self, booking_date):
+        return not self.clinic_calendar.is_working_day(booking_date)
+
+    def bookings(self, booking_date):
+        return list(self.booked[booking_date])
+
+    @property
+    def subject_identifiers(self):
+        return [subject_identifier for subject_identifiers in self.booked.values()
+                for subject_identifier in subject_identifiers]
+
+    def book(self, subject_identifier, booking_date):
+        self.booked[booking_date].append(subject_identifier)
+        if (subject_identifier, booking_date) in self.removed:
+            self.removed.remove((subject_identifier, booking_date))
+        else:
+            self.created.append((subject_identifier, booking_date))
+
+    def remove(self, subject_identifier, booking_date):
+        if subject_identifier in self.booked[booking_date]:
+            self.booked[booking_date].remove(subject_identifier)
+            if (subject_identifier, booking_date) in self.created:
+                self.created.remove((subject_identifier, booking_date))
+            else:
+                self.removed.append((subject_identifier, booking_date))
+
+    def save(self):
+        with transaction.atomic():
+            for subject_identifier, booking_date in self.removed:
+                self.participant_note_cls.objects.filter(
+                    subject_identifier=subject_identifier,
+                    date=booking_date,
+                    title=self.title).delete()
+            for subject_identifier, booking_date in self.created:
+                self.participant_note_cls.objects.create(
+                    subject_identifier=subject_identifier,
+                    title=self.title,
+                    date=booking_date)
+        self.created, self.removed = [], []
+
 
 class ChildFollowUpBookingHelper(object):
     """Class that creates a follow up booking for participant on the calendar
     """
 
+    calendar_cls = FollowUpCalendar
+    child_consent_model = 'flourish_caregiver.caregiverchildconsent'
+    cutoff_date = date(2025, 4, 30)
+    max_possible = 3
+
     def __init__(self, subject_identifier=None, ):
         self.subject_identifier = subject_identifier
         self.participant_note_cls = django_apps.get_model('flourish_calendar.participantnote')
+        self.child_data = {}
+
+    @property
+    def child_consent_model_cls(self):
+        return django_apps.get_model(self.child_consent_model)
 
     def schedule_fu_booking(self, subject_identifier, booking_dt=None):
         """ Schedule participant for follow up booking, a year after their enrollment,
@@ -23,19 +106,30 @@ class ChildFollowUpBookingHelper(object):
         # Check participant is not already scheduled for FU
         if self.is_scheduled(subject_identifier):
             return
-        cutoff_date = date(2025, 4, 30)
 
-        while booking_dt.date() < cutoff_date:
+        if booking_dt.date() >= self.cutoff_date:
+            return
+
+        calendar = self.calendar_cls(
+            participant_note_cls=self.participant_note_cls,
+            start_date=booking_dt.date(),
+            end_date=self.cutoff_date)
+
+        # Load the consent data of every child that may be compared against
+        # on this run, priorities are then worked out in memory.
+        self.child_data = {}
+        self.preload_child_data([subject_identifier] + calendar.subject_identifiers)
+
+        while booking_dt.date() < self.cutoff_date:
             # Check booking date does not fall on holiday or weekend before scheduling.
             # If falls on weekend push date to next day.
-            is_holiday_or_weekend = self.check_date(booking_dt)
-            if is_holiday_or_weekend:
+            if calendar.is_holiday_or_weekend(booking_dt.date()):
                 booking_dt = booking_dt + relativedelta(days=1)
                 continue
 
-            slots_available, scheduled_sidx = self.check_availability(booking_dt, max_possible=3)
-            if slots_available:
-                self.create_booking(subject_identifier, booking_dt)
+            scheduled_sidx = calendar.bookings(booking_dt.date())
+            if self.max_possible > len(scheduled_sidx):
+                calendar.book(subject_identifier, booking_dt.date())
                 break
             else:
                 priorities = self.assign_priority(subject_identifier, scheduled_sidx, booking_dt)
@@ -54,62 +148,27 @@ class ChildFollowUpBookingHelper(object):
                         if child2_dob > child1_dob:
                             reschedule = idx
                     # Remove participant with lower priority from booking date.
-                    self.remove_booking(reschedule, booking_dt)
+                    calendar.remove(reschedule, booking_dt.date())
                     # Add the high priority participant against date.
-                    self.create_booking(subject_identifier, booking_dt)
+                    calendar.book(subject_identifier, booking_dt.date())
                     # Assign the subject_identifier to participant to be rescheduled
                     # for the next day of week.
                     subject_identifier = reschedule
                 # Update booking date, to next day of week
                 booking_dt = booking_dt + relativedelta(days=1)
+        calendar.save()
 
     def check_date(self, booking_date):
         """ Check if booking date falls within a holiday or weekend
             @param booking_date: Date to schedule
             @return: True if holiday or weekend else False
         """
-        facility_app_config = django_apps.get_app_config('edc_facility')
-
-        facility = facility_app_config.get_facility('5-day clinic')
-
-        is_holiday = facility.holidays.holidays.filter(local_date=booking_date.date())
-        is_weekend = booking_date.weekday() >= 5
-
-        return is_holiday or is_weekend
-
-    def check_availability(self, booking_date, max_possible):
-        """ Confirm date to be booked does not have the max possible participant booked
-            against the date already.
-            @param booking_date: Date to schedule
-            @param max_possible: Maximum number of participant's booked per day.
-            @return: True if slots available else False, and list of scheduled participants on a date. 
-        """
-        fu_notes = self.participant_note_cls.objects.filter(
-            title='Follow Up Schedule', date=booking_date.date()).values_list('subject_identifier', flat=True)
-        return max_possible > fu_notes.count(), fu_notes
+        return not clinic_calendar.is_working_day(booking_date.date())
 
     def is_scheduled(self, subject_identifier):
         return self.participant_note_cls.objects.filter(
             subject_identifier=subject_identifier,
             title='Follow Up Schedule').exists()
-            
-
-    def create_booking(self, subject_identifier, booking_date):
-        self.participant_note_cls.objects.create(
-            subject_identifier=subject_identifier,
-            title='Follow Up Schedule',
-            date=booking_date.date())
-
-    def remove_booking(self, subject_identifier, booking_date):
-        try:
-            booking = self.participant_note_cls.objects.get(
-                subject_identifier=subject_identifier,
-                date=booking_date.date(),
-                title='Follow Up Schedule')
-        except self.participant_note_cls.DoesNotExist:
-            pass
-        else:
-            booking.delete()
 
     def assign_priority(self, subject_identifier, scheduled_sidx, booking_dt):
         priorities = {}
@@ -138,12 +197,26 @@ class ChildFollowUpBookingHelper(object):
                 priorities.update({f'{child_sid}': True})
         return priorities
 
+    def preload_child_data(self, subject_identifiers=[]):
+        """ Loads the latest consent's dob, cohort and preg_enroll for the
+            children not already loaded with one query.
+            @param subject_identifiers: Child subject identifiers
+            @return: dict of subject_identifier to `ChildData`
+        """
+        missing = set(subject_identifiers) - set(self.child_data)
+        if missing:
+            consents = self.child_consent_model_cls.objects.filter(
+                subject_identifier__in=missing).order_by(
+                    'consent_datetime').values_list(
+                        'subject_identifier', 'child_dob', 'cohort', 'preg_enroll')
+            for consent in consents:
+                self.child_data[consent[0]] = ChildData(*consent)
+        return self.child_data
+
     def get_child_data(self, subject_identifier):
-        child_consent_cls = django_apps.get_model('flourish_caregiver.caregiverchildconsent')
-        consents = child_consent_cls.objects.filter(
-            subject_identifier=subject_identifier).only(
-                'subject_identifier', 'cohort', 'child_dob')
-        return consents[0]
+        if subject_identifier not in self.child_data:
+            self.preload_child_data([subject_identifier])
+        return self.child_data[subject_identifier]
 
     def age_in_years(self, age_rdelta):
         return (age_rdelta.years + age_rdelta.months/12)
@@ -0,0 +1,251 @@
+import heapq
+from collections import namedtuple
+
+from dateutil.relativedelta import relativedelta
+from django.apps import apps as django_apps
+from edc_base.utils import get_utcnow
+from edc_visit_schedule.constants import OFF_SCHEDULE
+
+from .child_fu_booking_helper import (
+    ChildData, ChildFollowUpBookingHelper, FollowUpCalendar)
+from .child_onschedule_helper import ChildOnScheduleHelper
+from .cohort_schedule_registry import cohort_schedule_registry
+from .cohort_schedule_types import cohort_schedule_types
+
+BookingCandidate = namedtuple('BookingCandidate', [
+    'subject_identifier', 'release_date', 'window_start', 'window_end', 'child_dob'])
+
+
+class ChildFollowUpBookingOptimizer(object):
+    """ Assigns follow up booking dates for all unbooked (and optionally all
+        movable) children at once, instead of greedily one child at a time.
+
+    * A child is released for booking a year after enrolment.
+    * Children off study, off the enrolment schedule, already on a follow
+      up schedule or aging out are not booked, as on the enrolment path.
+    * A child has priority on the days falling in the priority window of the
+      `assign_priority` age rules; cohort A 4y5m-5y, cohort B 5y-10y5m and
+      the 18 month (+/- 45 days) visit for antenatal enrolments.
+    * Clinic days are swept in order, filling each day's free capacity from
+      two priority queues; children in their priority window by earliest
+      window end, then the rest by earliest release date and older first.
+    """
+
+    calendar_cls = FollowUpCalendar
+    enrolment_cohorts = ['cohort_a_enrol', 'cohort_b_enrol', 'cohort_c_enrol',
+                         'child_cohort_a_birth']
+    child_offstudy_model = 'flourish_prn.childoffstudy'
+    subject_schedule_history_model = 'edc_visit_schedule.subjectschedulehistory'
+
+    def __init__(self, start_date=None, end_date=None, max_possible=None,
+                 include_booked=False):
+        self.booking_helper = ChildFollowUpBookingHelper()
+        self.participant_note_cls = self.booking_helper.participant_note_cls
+        self.start_date = start_date or get_utcnow().date()
+        self.end_date = end_date or self.booking_helper.cutoff_date
+        self.max_possible = max_possible or self.booking_helper.max_possible
+        self.include_booked = include_booked
+        self._enrolment_dates = None
+        self.onschedule_helper = ChildOnScheduleHelper()
+        self.calendar = self.calendar_cls(
+            participant_note_cls=self.participant_note_cls,
+            start_date=self.start_date,
+            end_date=self.end_date)
+
+    def enrolment_dates(self):
+        """ Returns a dict of subject_identifier to enrolment date of the
+            children eligible for booking, one query per enrolment schedule.
+        """
+        if self._enrolment_dates is not None:
+            return self._enrolment_dates
+        enrolment_dates = {}
+        for cohort in self.enrolment_cohorts:
+            cohort_schedule = cohort_schedule_registry.get(cohort)
+            onschedules = cohort_schedule.onschedule_model_cls.objects.filter(
+                schedule_name=cohort_schedule.schedule_name).values_list(
+                    'subject_identifier', 'onschedule_datetime')
+            for subject_identifier, onschedule_datetime in onschedules:
+                enrolment_dates.setdefault(
+                    subject_identifier, onschedule_datetime.date())
+        ineligible = self.ineligible(enrolment_dates)
+        child_data = self.booking_helper.preload_child_data(
+            [subject_identifier for subject_identifier in enrolment_dates
+             if subject_identifier not in ineligible])
+        ineligible.update(
+            subject_identifier for subject_identifier, data in child_data.items()
+            if self.onschedule_helper.dob_aging_out(data.child_dob))
+        enrolment_dates = {
+            subject_identifier: enrolment_date
+            for subject_identifier, enrolment_date in enrolment_dates.items()
+            if subject_identifier not in ineligible}
+        self._enrolment_dates = enrolment_dates
+        return enrolment_dates
+
+    def ineligible(self, subject_identifiers):
+        """ Returns the set of subject identifiers taken off study, off
+            their enrolment schedule or put on a follow up schedule, with
+            one query each. Aging out is checked in `enrolment_dates`.
+        """
+        subject_identifiers = list(subject_identifiers)
+        schedule_names = [
+            cohort_schedule_registry.get(cohort).schedule_name
+            for cohort in self.enrolment_cohorts]
+        history = django_apps.get_model(
+            self.subject_schedule_history_model).objects.filter(
+                subject_identifier__in=subject_identifiers)
+        ineligible = set(history.filter(
+            schedule_name__in=schedule_names,
+            schedule_status=OFF_SCHEDULE).values_list('subject_identifier', flat=True))
+        ineligible.update(history.filter(
+            schedule_name__in=cohort_schedule_types.followup).values_list(
+                'subject_identifier', flat=True))
+        ineligible.update(django_apps.get_model(
+            self.child_offstudy_model).objects.filter(
+                subject_identifier__in=subject_identifiers).values_list(
+                    'subject_identifier', flat=True))
+        return ineligible
+
+    def priority_window(self, child_dob=None, cohort=None, preg_enroll=None):
+        if not child_dob:
+            return None, None
+        if preg_enroll:
+            anc_date = child_dob + relativedelta(months=18)
+            return (anc_date - relativedelta(days=45),
+                    anc_date + relativedelta(days=45))
+        elif cohort == 'cohort_a':
+            return (child_dob + relativedelta(years=4, months=5),
+                    child_dob + relativedelta(years=5))
+        elif cohort == 'cohort_b':
+            return (child_dob + relativedelta(years=5),
+                    child_dob + relativedelta(years=10, months=5)
+                    - relativedelta(days=1))
+        return None, None
+
+    def movable_bookings(self):
+        """ Returns a dict of subject_identifier to the currently booked date
+            for bookings that may be moved by this run, i.e. those of
+            candidates. Any other booking stays where it is.
+        """
+        movable = {}
+        if self.include_booked:
+            enrolment_dates = self.enrolment_dates()
+            for booking_date, subject_identifiers in self.calendar.booked.items():
+                for subject_identifier in subject_identifiers:
+                    if subject_identifier in enrolment_dates:
+                        movable[subject_identifier] = booking_date
+        return movable
+
+    def candidates(self):
+        enrolment_dates = self.enrolment_dates()
+        movable = self.movable_bookings()
+        booked = set(self.participant_note_cls.objects.filter(
+            title=self.calendar.title).values_list('subject_identifier', flat=True))
+        subject_identifiers = [
+            subject_identifier for subject_identifier in enrolment_dates
+            if subject_identifier not in booked or subject_identifier in movable]
+        child_data = self.booking_helper.preload_child_data(subject_identifiers)
+
+        candidates = []
+        for subject_identifier in subject_identifiers:
+            child_dob, cohort, preg_enroll = child_data.get(
+                subject_identifier, ChildData(subject_identifier, None, None, None))[1:]
+            window_start, window_end = self.priority_window(
+                child_dob=child_dob, cohort=cohort, preg_enroll=preg_enroll)
+            release_date = max(
+                enrolment_dates.get(subject_identifier) + relativedelta(years=1),
+                self.start_date)
+            candidates.append(BookingCandidate(
+                subject_identifier=subject_identifier,
+                release_date=release_date,
+                window_start=window_start,
+                window_end=window_end,
+                child_dob=child_dob))
+        return candidates
+
+    def optimize(self):
+        """ Returns a dict of subject_identifier to assigned booking date.
+
+            A movable booking only frees its day once the child has been
+            assigned an earlier one; a child not assigned by then keeps it.
+        """
+        movable = self.movable_bookings()
+        candidates = self.candidates()
+        by_release = sorted(candidates, key=lambda c: c.release_date)
+        by_window = sorted(
+            [c for c in candidates if c.window_start],
+            key=lambda c: max(c.release_date, c.window_start))
+        dob_key = (lambda c: c.child_dob.toordinal() if c.child_dob else 0)
+
+        assignments = {}
+        released, windowed = 0, 0
+        normal_queue, priority_queue = [], []
+        day = self.start_date
+        while day < self.end_date and len(assignments) < len(candidates):
+            while (released < len(by_release)
+                   and by_release[released].release_date <= day):
+                candidate = by_release[released]
+                heapq.heappush(normal_queue, (
+                    candidate.release_date.toordinal(), dob_key(candidate),
+                    candidate.subject_identifier, candidate))
+                released += 1
+            while (windowed < len(by_window)
+                   and max(by_window[windowed].release_date,
+                           by_window[windowed].window_start) <= day):
+                candidate = by_window[windowed]
+                heapq.heappush(priority_queue, (
+                    candidate.window_end.toordinal(), dob_key(candidate),
+                    candidate.subject_identifier, candidate))
+                windowed += 1
+
+            booked = self.calendar.bookings(day)
+            for subject_identifier in booked:
+                if subject_identifier in movable:
+                    assignments.setdefault(subject_identifier, day)
+
+            if not self.calendar.is_holiday_or_weekend(day):
+                kept = [subject_identifier for subject_identifier in booked
+                        if assignments.get(subject_identifier, day) == day]
+                capacity = self.max_possible - len(kept)
+                for queue, in_window in [(priority_queue, True), (normal_queue, False)]:
+                    while capacity > 0 and queue:
+                        *_, candidate = heapq.heappop(queue)
+                        if candidate.subject_identifier in assignments:
+                            continue
+                        if in_window and candidate.window_end < day:
+                            continue
+                        assignments[candidate.subject_identifier] = day
+                        capacity -= 1
+            day = day + relativedelta(days=1)
+        return assignments
+
+    def diff(self, assignments=None):
+        """ Returns the dry-run diff of assignments against current bookings
+            as lists of (subject_identifier, current date, new date).
+        """
+        assignments = self.optimize() if assignments is None else assignments
+        movable = self.movable_bookings()
+        diff = dict(created=[], moved=[], unchanged=[])
+        for subject_identifier, booking_date in sorted(
+                assignments.items(), key=lambda item: item[1]):
+            current_date = movable.get(subject_identifier)
+            if not current_date:
+                diff['created'].append((subject_identifier, None, booking_date))
+            elif current_date != booking_date:
+                diff['moved'].append((subject_identifier, current_date, booking_date))
+            else:
+                diff['unchanged'].append(
+                    (subject_identifier, current_date, booking_date))
+        return diff
+
+    def apply(self, diff=None):
+        """ Writes the created and moved bookings through the calendar, in
+            one transaction.
+        """
+        diff = diff or self.diff()
+        for subject_identifier, current_date, _ in diff.get('moved'):
+            self.calendar.remove(subject_identifier, current_date)
+        for subject_identifier, _, booking_date in (
+                diff.get('created') + diff.get('moved')):
+            self.calendar.book(subject_identifier, booking_date)
+        self.calendar.save()
+        return diff
@@ -1,9 +1,9 @@
 from dateutil.relativedelta import relativedelta
 from django.apps import apps as django_apps
 from edc_base.utils import get_utcnow, age
-from edc_visit_schedule.site_visit_schedules import site_visit_schedules
 
 from .child_fu_booking_helper import ChildFollowUpBookingHelper
+from .cohort_schedule_registry import cohort_schedule_registry
 
 
 class ChildOnScheduleHelper(object):
@@ -38,52 +38,28 @@ class ChildOnScheduleHelper(object):
         cohort = cohort or self.cohort
         if instance:
             subject_identifier = self.subject_identifier or instance.subject_identifier
-    
-            cohort_label_lower = ''.join(cohort.split('_'))
-    
-            if 'fuqt' in cohort_label_lower:
-                cohort_label_lower = cohort_label_lower.replace('fuqt', 'fuquart')
-    
-            if 'enrol' in cohort:
-                cohort_label_lower = cohort_label_lower.replace(
-                    'enrol', 'enrollment')
-    
-            elif 'sec' in cohort:
-                cohort_label_lower = cohort_label_lower.replace('qt', 'quart')
-    
-            if 'birth' in cohort:
-                onschedule_model = 'flourish_child.onschedule' + cohort_label_lower
-                schedule_name = cohort.replace('cohort_', '') + '_schedule1'
-            else:
-                onschedule_model = 'flourish_child.onschedulechild' + cohort_label_lower
-    
-                schedule_name = cohort.replace('cohort', 'child') + '_schedule1'
-    
-            if 'quarterly' in cohort:
-                schedule_name = schedule_name.replace('quarterly', 'quart')
-    
-            if 'tb_adol' in cohort:
-                schedule_name = 'tb_adol_schedule'
-                onschedule_model = 'flourish_child.onschedulechildtbadolschedule'
-    
-            _, schedule = site_visit_schedules.get_by_onschedule_model_schedule_name(
-                onschedule_model=onschedule_model, name=schedule_name)
+
+            cohort_schedule = cohort_schedule_registry.get(cohort)
+            schedule = cohort_schedule.schedule
+            schedule_name = cohort_schedule.schedule_name
 
             if not schedule.is_onschedule(subject_identifier=subject_identifier,
-                                          report_datetime=self.base_appt_datetime):    
+                                          report_datetime=self.base_appt_datetime):
                 schedule.put_on_schedule(
                     subject_identifier=subject_identifier,
                     onschedule_datetime=self.base_appt_datetime,
                     schedule_name=schedule_name,
                     base_appt_datetime=self.base_appt_datetime)
-    
-            if 'enrol' in cohort and 'sec' not in cohort:
+
+            if self.requires_fu_booking(cohort):
                 # book participant for followup
                 booking_helper = ChildFollowUpBookingHelper()
                 if not self.aging_out(subject_identifier):
                     booking_dt = self.base_appt_datetime + relativedelta(years=1)
                     booking_helper.schedule_fu_booking(subject_identifier, booking_dt)
 
+    def requires_fu_booking(self, cohort):
+        return 'enrol' in cohort and 'sec' not in cohort
 
     def get_onschedule_model_obj(self, schedule, query_key='subject_identifier',
                                  query_value=None):
@@ -122,12 +98,17 @@ class ChildOnScheduleHelper(object):
         except child_consent_cls.DoesNotExist:
             return False
         else:
-            child_dob = latest_consent.child_dob
-            if child_dob:
-                child_age = age(child_dob, get_utcnow().date())
-                age_in_years = (child_age.years + child_age.months/12)
-                if age_in_years < 5 and round(5 - age_in_years, 2) < 1:
-                    return round(5 - age_in_years, 2)
-                elif age_in_years < 10 and round(10 - age_in_years, 2) < 1:
-                    return round(10 - age_in_years, 2)
-            return False
+            return self.dob_aging_out(latest_consent.child_dob)
+
+    def dob_aging_out(self, child_dob):
+        """ Returns the years left before a child born on `child_dob` ages
+            out of the cohort age band if less than one, else False.
+        """
+        if child_dob:
+            child_age = age(child_dob, get_utcnow().date())
+            age_in_years = (child_age.years + child_age.months/12)
+            if age_in_years < 5 and round(5 - age_in_years, 2) < 1:
+                return round(5 - age_in_years, 2)
+            elif age_in_years < 10 and round(10 - age_in_years, 2) < 1:
+                return round(10 - age_in_years, 2)
+        return False
@@ -0,0 +1,147 @@
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+
+from dateutil.relativedelta import relativedelta
+from django.apps import apps as django_apps
+
+from .shared_cache_version import SharedCacheVersion
+
+CalendarData = namedtuple('CalendarData', ['weekdays', 'holidays', 'closed_days'])
+
+
+class ClinicCalendar:
+    """ Working day calendar of a facility, e.g. the `5-day clinic`.
+
+    * The facility's clinic weekdays and holidays are kept in memory as a
+      set and a sorted list of dates.
+    * The holidays are loaded once and reloaded after `refresh`, which is
+      called by `import_holidays` and when a holiday is saved or deleted.
+      The refresh is shared with the other workers through a
+      `SharedCacheVersion`, so lookups run no queries.
+    * `snapshot` returns a calendar fixed to the current holidays, for
+      loops over many days without a check per day.
+    * `working_days_between` and `next_working_day` use weekday arithmetic
+      and a binary search over the holidays, no per day lookups.
+    """
+
+    def __init__(self, facility_name='5-day clinic'):
+        self.facility_name = facility_name
+        self._data = None
+        self._version = None
+        self.shared_version = SharedCacheVersion(
+            f'flourish_child.clinic_calendar.{facility_name.replace(" ", "_")}')
+
+    @property
+    def facility(self):
+        facility_app_config = django_apps.get_app_config('edc_facility')
+        return facility_app_config.get_facility(self.facility_name)
+
+    @property
+    def data(self):
+        version = self.shared_version.get()
+        if self._data is None or version != self._version:
+            self._data = self.load(self.facility.holidays.holidays)
+            self._version = version
+        return self._data
+
+    def load(self, holidays):
+        weekdays = frozenset(day.weekday for day in self.facility.days)
+        holidays = sorted(set(holidays.values_list('local_date', flat=True)))
+        return CalendarData(
+            weekdays=weekdays,
+            holidays=holidays,
+            closed_days=[day for day in holidays if day.weekday() in weekdays])
+
+    def refresh(self):
+        self.shared_version.bump()
+        self._data = None
+
+    def snapshot(self):
+        return FixedClinicCalendar(self.facility_name, self.data)
+
+    def is_holiday(self, day, data=None):
+        holidays = (data or self.data).holidays
+        index = bisect_left(holidays, day)
+        return index < len(holidays) and holidays[index] == day
+
+    def is_working_day(self, day):
+        data = self.data
+        return day.weekday() in data.weekdays and not self.is_holiday(day, data)
+
+    def holidays_between(self, start_date, end_date):
+        """ Returns the holidays from `start_date` up to but excluding
+            `end_date`.
+        """
+        holidays = self.data.holidays
+        return holidays[bisect_left(holidays, start_date):bisect_left(holidays, end_date)]
+
+    def working_days_between(self, start_date, end_date):
+        """ Returns the number of working days from `start_date` up to but
+            excluding `end_date`.
+        """
+        if end_date <= start_date:
+            return 0
+        data = self.data
+        weeks, days = divmod((end_date - start_date).days, 7)
+        clinic_days = weeks * len(data.weekdays) + len([
+            offset for offset in range(days)
+            if (start_date.weekday() + offset) % 7 in data.weekdays])
+        closed_days = (bisect_left(data.closed_days, end_date)
+                       - bisect_left(data.closed_days, start_date))
+        return clinic_days - closed_days
+
+    def next_working_day(self, day, n=1):
+        """ Returns the nth working day after `day`. With n=0 returns `day`
+            itself if a working day, otherwise the next working day.
+        """
+        data = self.data
+        if n == 0:
+            if day.weekday() in data.weekdays and not self.is_holiday(day, data):
+                return day
+            n = 1
+        if not data.weekdays:
+            raise ValueError(f'Facility {self.facility_name} has no clinic days.')
+        while n:
+            next_day = self.add_clinic_days(day, n, data.weekdays)
+            # Holidays skipped over are made up for from the new day.
+            n = (bisect_right(data.closed_days, next_day)
+                 - bisect_right(data.closed_days, day))
+            day = next_day
+        return day
+
+    def add_clinic_days(self, day, n, weekdays):
+        """ Returns the nth clinic weekday after `day`, ignoring holidays.
+        """
+        weeks, days = divmod(n - 1, len(weekdays))
+        day = day + relativedelta(weeks=weeks)
+        days += 1
+        while days:
+            day = day + relativedelta(days=1)
+            if day.weekday() in weekdays:
+                days -= 1
+        return day
+
+
+class FixedClinicCalendar(ClinicCalendar):
+    """ A clinic calendar fixed to the holidays it was created with.
+    """
+
+    def __init__(self, facility_name='5-day clinic', data=None):
+        self.facility_name = facility_name
+        self._data = data
+
+    @property
+    def data(self):
+        return self._data
+
+
+clinic_calendar = ClinicCalendar()
+
+
+def import_holidays(**kwargs):
+    """ Imports the holidays file (settings.HOLIDAY_FILE) and refreshes the
+        clinic calendar.
+    """
+    from edc_facility.import_holidays import import_holidays as edc_import_holidays
+    edc_import_holidays(**kwargs)
+    clinic_calendar.refresh()
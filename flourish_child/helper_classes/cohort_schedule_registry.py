@@ -0,0 +1,142 @@
+from collections import namedtuple
+
+from django.core.exceptions import ImproperlyConfigured
+from edc_visit_schedule.site_visit_schedules import site_visit_schedules
+
+CohortSchedule = namedtuple('CohortSchedule', [
+    'cohort', 'onschedule_model', 'onschedule_model_cls', 'visit_schedule',
+    'schedule', 'schedule_name'])
+
+
+class CohortScheduleError(Exception):
+    pass
+
+
+class CohortScheduleRegistry:
+    """ Maps every cohort key used to put a child on schedule, e.g.
+        `cohort_a_enrol`, `cohort_pool` or `cohort_a_birth`, to its
+        on-schedule model and schedule as registered in
+        `site_visit_schedules`. The keys the callers build are validated when
+        the app is ready, so naming mismatches fail at boot; any other key is
+        resolved against the registered schedules on first use.
+    """
+
+    cohorts = ['a', 'b', 'c']
+    cohort_suffixes = ['enrol', 'quarterly', 'fu_qt', 'sec', 'sec_qt']
+    other_cohorts = ['cohort_pool', 'cohort_a_birth', 'child_cohort_a_birth',
+                     'tb_adol']
+
+    def __init__(self):
+        self.registry = {}
+        self.schedules = {}
+        self.quarterly_cohorts = {}
+
+    @property
+    def cohort_keys(self):
+        return [f'cohort_{cohort}_{suffix}' for cohort in self.cohorts
+                for suffix in self.cohort_suffixes] + self.other_cohorts
+
+    def populate(self):
+        schedules = {}
+        for visit_schedule in site_visit_schedules.visit_schedules.values():
+            for schedule in visit_schedule.schedules.values():
+                if schedule.onschedule_model.startswith('flourish_child.'):
+                    schedules[(schedule.onschedule_model, schedule.name)] = (
+                        visit_schedule, schedule)
+        self.schedules = schedules
+        registry = {}
+        for cohort in self.cohort_keys:
+            try:
+                registry[cohort] = self.resolve(cohort)
+            except CohortScheduleError as e:
+                raise ImproperlyConfigured(e)
+        self.registry = registry
+
+    def resolve(self, cohort):
+        """ Returns the `CohortSchedule` of the registered schedule named
+            after the cohort, preferring the one whose on-schedule model also
+            matches the naming convention.
+        """
+        onschedule_model, schedule_name = self.onschedule_model_schedule_name(
+            cohort)
+        if (onschedule_model, schedule_name) in self.schedules:
+            keys = [(onschedule_model, schedule_name)]
+        else:
+            keys = [key for key in self.schedules if key[1] == schedule_name]
+        if len(keys) != 1:
+            raise CohortScheduleError(
+                f'Cohort \'{cohort}\' does not match a registered schedule. '
+                f'Expected {onschedule_model}, {schedule_name}.')
+        visit_schedule, schedule = self.schedules[keys[0]]
+        return CohortSchedule(
+            cohort=cohort,
+            onschedule_model=schedule.onschedule_model,
+            onschedule_model_cls=schedule.onschedule_model_cls,
+            visit_schedule=visit_schedule,
+            schedule=schedule,
+            schedule_name=schedule.name)
+
+    def get(self, cohort):
+        if not self.registry:
+            self.populate()
+        try:
+            return self.registry[cohort]
+        except KeyError:
+            self.registry[cohort] = self.resolve(cohort)
+            return self.registry[cohort]
+
+    def quarterly_cohort(self, schedule_name):
+        """ Returns the quarterly call cohort key for a visit's schedule
+            name, e.g. `child_a_enrol_schedule1` -> `cohort_a_quarterly`.
+        """
+        try:
+            return self.quarterly_cohorts[schedule_name]
+        except KeyError:
+            cohort_list = schedule_name.split('_')
+            if 'sec' in schedule_name:
+                cohort = '_'.join(['cohort', cohort_list[1], 'sec_qt'])
+            elif 'fu' in schedule_name:
+                cohort = '_'.join(['cohort', cohort_list[1], 'fu_qt'])
+            else:
+                cohort = '_'.join(['cohort', cohort_list[1], 'quarterly'])
+            self.quarterly_cohorts[schedule_name] = cohort
+            return cohort
+
+    def onschedule_model_schedule_name(self, cohort):
+        """ Returns the onschedule model label and schedule name for the
+            cohort by naming convention.
+        """
+        if 'birth' in cohort and not cohort.startswith('child_'):
+            # e.g. `cohort_a_birth`, built from the consent's cohort
+            cohort = 'child_' + cohort
+
+        cohort_label_lower = ''.join(cohort.split('_'))
+
+        if 'fuqt' in cohort_label_lower:
+            cohort_label_lower = cohort_label_lower.replace('fuqt', 'fuquart')
+
+        if 'enrol' in cohort:
+            cohort_label_lower = cohort_label_lower.replace(
+                'enrol', 'enrollment')
+
+        elif 'sec' in cohort:
+            cohort_label_lower = cohort_label_lower.replace('qt', 'quart')
+
+        if 'birth' in cohort:
+            onschedule_model = 'flourish_child.onschedule' + cohort_label_lower
+            schedule_name = cohort.replace('cohort_', '') + '_schedule1'
+        else:
+            onschedule_model = 'flourish_child.onschedulechild' + cohort_label_lower
+
+            schedule_name = cohort.replace('cohort', 'child') + '_schedule1'
+
+        if 'quarterly' in cohort:
+            schedule_name = schedule_name.replace('quarterly', 'quart')
+
+        if 'tb_adol' in cohort:
+            schedule_name = 'tb_adol_schedule'
+            onschedule_model = 'flourish_child.onschedulechildtbadolschedule'
+        return onschedule_model, schedule_name
+
+
+cohort_schedule_registry = CohortScheduleRegistry()
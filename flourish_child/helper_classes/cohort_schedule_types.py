@@ -0,0 +1,90 @@
+import threading
+
+from django.apps import apps as django_apps
+
+from .shared_cache_version import SharedCacheVersion
+
+
+class CohortScheduleTypes:
+    """ Process wide cache of the child schedule names in
+        `flourish_caregiver.cohortschedules` by type, i.e. quarterly,
+        follow up and enrolment. Loaded with one query on first use and
+        reloaded after `invalidate`, which is called when a cohort schedule
+        is saved. `version` changes on every invalidation so that values
+        derived from the schedules can be cached against it. It is shared
+        with the other workers through a `SharedCacheVersion`.
+    """
+
+    cohort_schedules_model = 'flourish_caregiver.cohortschedules'
+    onschedule_app_label = 'flourish_child'
+
+    def __init__(self):
+        self._schedules = None
+        self._version = None
+        self._lock = threading.Lock()
+        self.shared_version = SharedCacheVersion(
+            'flourish_child.cohort_schedule_types')
+
+    @property
+    def version(self):
+        return self.shared_version.get()
+
+    @property
+    def cohort_schedules_cls(self):
+        return django_apps.get_model(self.cohort_schedules_model)
+
+    @property
+    def schedules(self):
+        """ Returns a list of (schedule_name, schedule_type) of the child
+            schedules.
+        """
+        version = self.version
+        schedules = self._schedules
+        if schedules is None or version != self._version:
+            schedules = list(self.cohort_schedules_cls.objects.filter(
+                onschedule_model__startswith=self.onschedule_app_label).values_list(
+                    'schedule_name', 'schedule_type'))
+            with self._lock:
+                # Keep only if not invalidated while loading.
+                if version == self.version:
+                    self._schedules = schedules
+                    self._version = version
+        return schedules
+
+    def invalidate(self):
+        with self._lock:
+            self._schedules = None
+            self.shared_version.bump()
+
+    def filter(self, schedule_type=None, schedule_name=None, exclude_type=None):
+        """ Returns the schedule names whose type or name contains the given
+            values, case insensitive as `icontains`.
+        """
+        names = []
+        for name, _type in self.schedules:
+            _type = (_type or '').lower()
+            if exclude_type and exclude_type in _type:
+                continue
+            if ((schedule_type and schedule_type in _type)
+                    or (schedule_name and schedule_name in name.lower())):
+                names.append(name)
+        return names
+
+    @property
+    def quarterly(self):
+        return self.filter(schedule_type='quarterly')
+
+    @property
+    def followup(self):
+        return self.filter(schedule_type='followup', exclude_type='quarterly')
+
+    @property
+    def quarterly_and_fu(self):
+        return self.filter(schedule_type='quarterly', schedule_name='_fu_')
+
+    @property
+    def enrolment(self):
+        return self.filter(schedule_type='enrol')
+
+
+cohort_schedule_types = CohortScheduleTypes()
@@ -0,0 +1,107 @@
+import json
+import re
+from collections import namedtuple
+
+from django.apps import apps as django_apps
+from django.db import connections
+
+Advice = namedtuple('Advice', ['name', 'full_scans', 'plan'])
+
+
+class IndexAdvisor:
+    """ Explains the hot appointment, visit and CRF lookups with the
+        database's query planner and reports the tables each one still
+        reads with a full table scan.
+
+    The lookups are built as the code builds them, with the values of the
+    latest appointment and visit, so the plans match the data at hand.
+    Full scans are read from SQLite (`SCAN`), PostgreSQL (`Seq Scan`) and
+    MySQL (`access_type` ALL) plans.
+    """
+
+    appointment_model = 'flourish_child.appointment'
+    visit_model = 'flourish_child.childvisit'
+    crf_models = ['flourish_child.childsociodemographic',
+                  'flourish_child.birthfeedingvaccine',
+                  'flourish_child.infantfeeding']
+
+    @property
+    def appointment_model_cls(self):
+        return django_apps.get_model(self.appointment_model)
+
+    @property
+    def visit_model_cls(self):
+        return django_apps.get_model(self.visit_model)
+
+    def patterns(self):
+        """ Returns a list of (name, queryset) of the lookups to explain.
+        """
+        appointment = self.appointment_model_cls.objects.order_by(
+            '-appt_datetime').first() or self.appointment_model_cls()
+        visit = self.visit_model_cls.objects.order_by(
+            '-report_datetime').first() or self.visit_model_cls()
+        subject_identifier = appointment.subject_identifier or ''
+        patterns = [
+            ('appointment next by timepoint',
+             self.appointment_model_cls.objects.filter(
+                 subject_identifier=subject_identifier,
+                 timepoint__gt=appointment.timepoint or 0,
+                 visit_code_sequence=0,
+                 schedule_name=appointment.schedule_name).order_by('timepoint')[:1]),
+            ('previous appointment',
+             self.appointment_model_cls.objects.filter(
+                 subject_identifier=subject_identifier,
+                 appt_datetime__lt=appointment.appt_datetime,
+                 schedule_name__in=[appointment.schedule_name],
+                 visit_code_sequence=0).order_by('-appt_datetime')[:1]),
+            ('visit by schedule and visit code',
+             self.visit_model_cls.objects.filter(
+                 subject_identifier=visit.subject_identifier,
+                 visit_schedule_name=visit.visit_schedule_name,
+                 schedule_name=visit.schedule_name,
+                 visit_code=visit.visit_code)),
+            ('visit subject identifier search',
+             self.visit_model_cls.objects.filter(
+                 subject_identifier__startswith=visit.subject_identifier or '',
+                 visit_code__startswith=visit.visit_code or '')),
+        ]
+        for crf_model in self.crf_models:
+            crf_model_cls = django_apps.get_model(crf_model)
+            visit_attr = crf_model_cls.visit_model_attr()
+            patterns.append((
+                f'{crf_model_cls._meta.model_name} by subject and report date',
+                crf_model_cls.objects.filter(**{
+                    f'{visit_attr}__subject_identifier': visit.subject_identifier,
+                    'report_datetime__lte': visit.report_datetime}).order_by(
+                        '-report_datetime')[:1]))
+        return patterns
+
+    def full_scans(self, plan, vendor):
+        """ Returns the names of the tables read with a full scan in the
+            query plan.
+        """
+        if vendor == 'mysql':
+            return sorted(set(re.findall(
+                r'"table_name": "(\w+)",\s*"access_type": "ALL"', plan)))
+        if vendor == 'postgresql':
+            return sorted(set(re.findall(r'Seq Scan on (\w+)', plan)))
+        return sorted(set(
+            match for line in plan.splitlines() if 'USING' not in line
+            for match in re.findall(r'\bSCAN (?:TABLE )?(\w+)', line)))
+
+    def explain(self, queryset):
+        vendor = connections[queryset.db].vendor
+        if vendor == 'mysql':
+            plan = json.dumps(json.loads(queryset.explain(format='json')), indent=1)
+        else:
+            plan = queryset.explain()
+        return plan, vendor
+
+    def report(self):
+        """ Returns a list of `Advice`, one per lookup.
+        """
+        advice = []
+        for name, queryset in self.patterns():
+            plan, vendor = self.explain(queryset)
+            advice.append(Advice(name, self.full_scans(plan, vendor), plan))
+        return advice
@@ -0,0 +1,75 @@
+import threading
+
+from django.apps import apps as django_apps
+from django.core.exceptions import ValidationError
+
+from .shared_cache_version import SharedCacheVersion
+
+
+class InterviewerChoices:
+    """ Process wide cache of the interviewer choices, i.e. (username,
+        full name) of the users in the caregiver app's interviewers group
+        followed by the app's extra assignee choices.
+
+    Built with one query on first use, validating the interviewers' names
+    once, and rebuilt after `invalidate`, which is called when a user, a
+    group or a user's group membership changes. The invalidation is shared
+    with the other workers through a `SharedCacheVersion`.
+    """
+
+    user_model = 'auth.user'
+    app_label = 'flourish_caregiver'
+
+    def __init__(self):
+        self._choices = None
+        self._version = None
+        self._lock = threading.Lock()
+        self.shared_version = SharedCacheVersion(
+            'flourish_child.interviewer_choices')
+
+    @property
+    def user_model_cls(self):
+        return django_apps.get_model(self.user_model)
+
+    @property
+    def choices(self):
+        version = self.shared_version.get()
+        choices = self._choices
+        if choices is None or version != self._version:
+            choices = self.build_choices()
+            with self._lock:
+                # Keep only if not invalidated while building.
+                if version == self.shared_version.get():
+                    self._choices = choices
+                    self._version = version
+        return choices
+
+    def build_choices(self):
+        """ Returns the choices tuple, raises a ValidationError if an
+            interviewer has no first or last name.
+        """
+        app_config = django_apps.get_app_config(self.app_label)
+        interviewers = self.user_model_cls.objects.filter(
+            groups__name=app_config.interviewers_group).values_list(
+                'username', 'first_name', 'last_name')
+        intv_choices = ()
+        for username, first_name, last_name in interviewers:
+            if not first_name:
+                raise ValidationError(
+                    f"The user {username} needs to set their first name.")
+            if not last_name:
+                raise ValidationError(
+                    f"The user {username} needs to set their last name.")
+            intv_choices += ((username, f'{first_name} {last_name}'),)
+        if app_config.extra_assignee_choices:
+            for _, value in app_config.extra_assignee_choices.items():
+                intv_choices += (value[0],)
+        return intv_choices
+
+    def invalidate(self):
+        with self._lock:
+            self._choices = None
+            self.shared_version.bump()
+
+
+interviewer_choices = InterviewerChoices()
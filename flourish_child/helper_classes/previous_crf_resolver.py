@@ -0,0 +1,89 @@
+from django.apps import apps as django_apps
+from django.core.exceptions import ValidationError
+from django.db.models import Case, IntegerField, Q, Value, When
+
+
+class PreviousCrfResolver:
+    """ Resolves the CRFs a form prefills from, i.e. a CRF at a child visit
+        or the subject's latest earlier one.
+
+    Each lookup is a single query and is cached on the resolver, so a form
+    that keeps one resolver costs the same number of queries however many
+    fields it prefills.
+    """
+
+    visit_model = 'flourish_child.childvisit'
+
+    def __init__(self, visit=None, visit_id=None, subject_identifier=None):
+        self._visit = visit
+        self.visit_id = visit.id if visit else visit_id
+        self._subject_identifier = subject_identifier
+        self._cache = {}
+
+    @property
+    def visit_model_cls(self):
+        return django_apps.get_model(self.visit_model)
+
+    @property
+    def visit(self):
+        if self._visit is None and self.visit_id:
+            try:
+                self._visit = self.visit_model_cls.objects.get(id=self.visit_id)
+            except (self.visit_model_cls.DoesNotExist, ValueError, ValidationError):
+                self.visit_id = None
+        return self._visit
+
+    @property
+    def subject_identifier(self):
+        if self._subject_identifier is None and self.visit:
+            self._subject_identifier = self.visit.subject_identifier
+        return self._subject_identifier
+
+    def at_visit(self, model_cls):
+        """ Returns the instance of `model_cls` at the visit or None.
+        """
+        key = ('at_visit', model_cls._meta.label_lower)
+        if key not in self._cache:
+            self.at_visit_or_latest(model_cls)
+        return self._cache[key]
+
+    def at_visit_or_latest(self, model_cls):
+        """ Returns the instance of `model_cls` at the visit, otherwise the
+            subject's latest one reported on or before the visit.
+        """
+        key = ('at_visit_or_latest', model_cls._meta.label_lower)
+        if key not in self._cache:
+            obj = None
+            visit = self.visit
+            if visit:
+                visit_attr = model_cls.visit_model_attr()
+                obj = model_cls.objects.filter(
+                    Q(**{visit_attr: visit}) | Q(**{
+                        f'{visit_attr}__subject_identifier': visit.subject_identifier,
+                        'report_datetime__lte': visit.report_datetime})).annotate(
+                    other_visit=Case(
+                        When(**{visit_attr: visit}, then=Value(0)),
+                        default=Value(1), output_field=IntegerField())).order_by(
+                    'other_visit', '-report_datetime').first()
+            self._cache[key] = obj
+            self._cache[('at_visit', model_cls._meta.label_lower)] = (
+                obj if obj and obj.other_visit == 0 else None)
+        return self._cache[key]
+
+    def latest(self, model_cls, before=None):
+        """ Returns the subject's latest instance of `model_cls`, reported
+            before `before` if given.
+        """
+        key = ('latest', model_cls._meta.label_lower, before)
+        if key not in self._cache:
+            obj = None
+            if self.subject_identifier:
+                options = {
+                    f'{model_cls.visit_model_attr()}__subject_identifier':
+                        self.subject_identifier}
+                if before:
+                    options.update(report_datetime__lt=before)
+                obj = model_cls.objects.filter(**options).order_by(
+                    '-report_datetime').first()
+            self._cache[key] = obj
+        return self._cache[key]
@@ -0,0 +1,107 @@
+import numpy as np
+
+CBCL_SCORES = {'not_true': 0, 'somewhat': 1, 'very_true': 2}
+
+BRIEF2_SCORES = {'never': 1, 'sometimes': 2, 'often': 3}
+
+
+class Instrument:
+    """ Declarative scoring of a questionnaire model.
+
+    * `items` are the scored fields, or all fields with `item_choices` as
+      their choices.
+    * `values` maps an answer to its score, `item_values` overrides it per
+      item. Answers not mapped score `missing_score`; with the default of
+      None any unanswered item leaves the scores empty.
+    * `reverse_items` are scored from the other end of their range.
+    * The sum of all items is stored in `total_field`, the sum of each
+      subscale's items in the subscale's field.
+
+    The same vectorized `score_rows` scores one instance on save and a whole
+    table when rescoring.
+    """
+
+    def __init__(self, values={}, items=[], item_choices=None, item_values={},
+                 reverse_items=[], total_field=None, subscales={}, missing_score=None):
+        self.values = values
+        self.items = list(items)
+        self.item_choices = item_choices
+        self.item_values = item_values
+        self.reverse_items = reverse_items
+        self.total_field = total_field
+        self.subscales = subscales
+        self.missing_score = missing_score
+        self._items = {}
+
+    @property
+    def score_fields(self):
+        return ([self.total_field] if self.total_field else []) + list(self.subscales)
+
+    def items_for(self, model_cls):
+        """ Returns the names of the scored fields of `model_cls`.
+        """
+        label = model_cls._meta.label_lower
+        if label not in self._items:
+            items = self.items
+            if not items and self.item_choices:
+                items = [field.name for field in model_cls._meta.fields
+                         if field.choices
+                         and list(field.choices) == list(self.item_choices)]
+            self._items[label] = items
+        return self._items[label]
+
+    def score(self, obj):
+        """ Returns a dict of score field to score of a model instance.
+        """
+        items = self.items_for(obj.__class__)
+        scores = self.score_rows(
+            obj.__class__, [[getattr(obj, item) for item in items]])
+        return {field: values[0] for field, values in scores.items()}
+
+    def score_rows(self, model_cls, rows):
+        """ Returns a dict of score field to a list of scores, one per row of
+            answers ordered as `items_for(model_cls)`.
+        """
+        items = self.items_for(model_cls)
+        answers = np.array(rows, dtype=object).reshape(len(rows), len(items))
+        missing = np.nan if self.missing_score is None else self.missing_score
+        item_scores = np.full(answers.shape, missing, dtype=float)
+        for index, item in enumerate(items):
+            values = self.item_values.get(item, self.values)
+            column = answers[:, index]
+            for answer, score in values.items():
+                item_scores[column == answer, index] = score
+            if item in self.reverse_items:
+                item_scores[:, index] = (
+                    min(values.values()) + max(values.values()) - item_scores[:, index])
+
+        scores = {}
+        columns = {item: index for index, item in enumerate(items)}
+        for field, subscale_items in (
+                [(self.total_field, items)] if self.total_field else []) + list(
+                self.subscales.items()):
+            sums = item_scores[:, [columns[item] for item in subscale_items]].sum(axis=1)
+            scores[field] = [None if np.isnan(value) else int(value) for value in sums]
+        return scores
+
+    def rescore(self, model_cls, batch_size=1000, dry_run=False):
+        """ Recomputes the scores of all `model_cls` instances and updates
+            the changed ones. Returns the number of changed instances.
+        """
+        items = self.items_for(model_cls)
+        score_fields = self.score_fields
+        rows = list(model_cls.objects.values_list('id', *score_fields, *items))
+        if not rows:
+            return 0
+        score_count = len(score_fields)
+        scores = self.score_rows(
+            model_cls, [row[1 + score_count:] for row in rows])
+
+        changed = []
+        for index, row in enumerate(rows):
+            values = {field: scores[field][index] for field in score_fields}
+            if [values[field] for field in score_fields] != list(row[1:1 + score_count]):
+                changed.append(model_cls(id=row[0], **values))
+        if changed and not dry_run:
+            model_cls.objects.bulk_update(changed, score_fields, batch_size=batch_size)
+        return len(changed)
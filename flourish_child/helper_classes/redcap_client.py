@@ -0,0 +1,151 @@
+import threading
+import time
+
+import requests
+from django.conf import settings
+from django.utils import timezone
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class TTLCache:
+    """ Small thread safe in-process cache whose entries expire `ttl`
+        seconds after being set.
+    """
+
+    def __init__(self, ttl=300):
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get_many(self, keys=[]):
+        now = time.monotonic()
+        found = {}
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry and entry[1] > now:
+                    found[key] = entry[0]
+                elif entry:
+                    del self._entries[key]
+        return found
+
+    def set_many(self, values={}):
+        expires = time.monotonic() + self.ttl
+        with self._lock:
+            for key, value in values.items():
+                self._entries[key] = (value, expires)
+
+    def clear(self):
+        with self._lock:
+            self._entries = {}
+
+
+class RedcapClient:
+    """ REDCap API client sharing one pooled `requests.Session`.
+
+    * Requests time out after `timeout` (connect, read) seconds.
+    * Connection errors and 429/5xx responses are retried with backoff,
+      record exports are read only so POSTs are safe to retry.
+    * `export_records` exports many records per request, in batches of
+      `batch_size`, instead of one request per record.
+    """
+
+    status_forcelist = (429, 500, 502, 503, 504)
+
+    def __init__(self, url=None, token=None, timeout=(5, 30), retries=3,
+                 backoff_factor=0.5, pool_maxsize=10):
+        self._url = url
+        self._token = token
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.pool_maxsize = pool_maxsize
+        self._session = None
+        self._lock = threading.Lock()
+
+    @property
+    def url(self):
+        return self._url or getattr(settings, 'REDCAP_API_URL', '')
+
+    @property
+    def token(self):
+        return self._token or getattr(settings, 'REDCAP_API_TOKEN', None)
+
+    @property
+    def session(self):
+        with self._lock:
+            if self._session is None:
+                retry_options = dict(
+                    total=self.retries,
+                    backoff_factor=self.backoff_factor,
+                    status_forcelist=self.status_forcelist,
+                    raise_on_status=False)
+                try:
+                    retry = Retry(allowed_methods=frozenset(['POST']), **retry_options)
+                except TypeError:
+                    # urllib3 < 1.26
+                    retry = Retry(method_whitelist=frozenset(['POST']), **retry_options)
+                adapter = HTTPAdapter(
+                    max_retries=retry, pool_maxsize=self.pool_maxsize)
+                session = requests.Session()
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                self._session = session
+            return self._session
+
+    def post(self, data={}):
+        data = dict(token=self.token, returnFormat='json', **data)
+        response = self.session.post(self.url, data=data, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def export_records(self, records=[], forms=[], events=[], fields=[],
+                       date_range_begin=None, date_range_end=None, batch_size=100):
+        """ Returns the flat, raw exported rows of the `records`, or of all
+            records if none are given. `date_range_begin`/`date_range_end`
+            limit the export to records created or modified in that range.
+            Raises `requests.exceptions.RequestException` or `ValueError`
+            on a failed request or invalid JSON.
+        """
+        records = list(records)
+        batches = ([records[start:start + batch_size]
+                    for start in range(0, len(records), batch_size)]
+                   if records else [[]])
+        rows = []
+        for batch in batches:
+            data = {
+                'content': 'record',
+                'action': 'export',
+                'format': 'json',
+                'type': 'flat',
+                'csvDelimiter': '',
+                'rawOrLabel': 'raw',
+                'rawOrLabelHeaders': 'raw',
+                'exportCheckboxLabel': 'false',
+                'exportSurveyFields': 'false',
+                'exportDataAccessGroups': 'false',
+            }
+            for name, values in [('records', batch), ('forms', forms),
+                                 ('events', events), ('fields', fields)]:
+                data.update({f'{name}[{index}]': value
+                             for index, value in enumerate(values)})
+            if date_range_begin:
+                data.update(dateRangeBegin=self.redcap_datetime(date_range_begin))
+            if date_range_end:
+                data.update(dateRangeEnd=self.redcap_datetime(date_range_end))
+            result = self.post(data=data)
+            if not isinstance(result, list):
+                raise ValueError(f'Unexpected REDCap response: {result}')
+            rows += result
+        return rows
+
+    def redcap_datetime(self, dt):
+        """ REDCap date ranges are in the server's local time.
+        """
+        if timezone.is_aware(dt):
+            dt = timezone.localtime(dt)
+        return dt.strftime('%Y-%m-%d %H:%M:%S')
+
+
+redcap_client = RedcapClient()
@@ -0,0 +1,39 @@
+import time
+from uuid import uuid4
+
+from django.core.cache import cache
+
+
+class SharedCacheVersion:
+    """ Version token of a process local cache, kept in Django's cache
+        framework under `key` so that an invalidation in one worker is
+        seen by all of them.
+
+    The shared token is read at most every `check_interval` seconds, so a
+    cache comparing `get` on every lookup costs no query in between, and
+    other workers see an invalidation within `check_interval` seconds.
+    `bump` is seen at once in the process calling it, by every instance
+    with the same key. A token evicted from the cache comes back as a new
+    one, i.e. as an invalidation.
+    """
+
+    # key: (token, monotonic time read), shared by the process' instances.
+    _tokens = {}
+
+    def __init__(self, key, check_interval=60):
+        self.key = key
+        self.check_interval = check_interval
+
+    def get(self):
+        now = time.monotonic()
+        token, checked = self._tokens.get(self.key, (None, None))
+        if token is None or now - checked >= self.check_interval:
+            token = cache.get_or_set(self.key, uuid4().hex, timeout=None)
+            self._tokens[self.key] = (token, now)
+        return token
+
+    def bump(self):
+        token = uuid4().hex
+        cache.set(self.key, token, timeout=None)
+        self._tokens[self.key] = (token, time.monotonic())
+        return token
@@ -26,6 +26,7 @@ class ChildUtils:
     child_assent_model = 'flourish_child.childassent'
     caregiver_consent_model = 'flourish_caregiver.subjectconsent'
     caregiver_child_consent_model = 'flourish_caregiver.caregiverchildconsent'
+    subject_identity_graph_model = 'flourish_child.subjectidentitygraph'
 
     @property
     def child_assent_model_cls(self):
@@ -63,6 +64,10 @@ class ChildUtils:
     def caregiver_child_consent_cls(self):
         return django_apps.get_model(self.caregiver_child_consent_model)
 
+    @property
+    def subject_identity_graph_cls(self):
+        return django_apps.get_model(self.subject_identity_graph_model)
+
     def caregiver_subject_consent_obj(self, subject_identifier=None):
         if len(subject_identifier.split('-')) == 4:
             subject_identifier = self.caregiver_subject_identifier(subject_identifier)
@@ -80,6 +85,12 @@ class ChildUtils:
             pass
 
     def caregiver_subject_identifier(self, subject_identifier=None):
+        caregiver_sid = self.subject_identity_graph_cls.objects.filter(
+            subject_identifier=subject_identifier).values_list(
+                'caregiver_subject_identifier', flat=True).first()
+        if caregiver_sid:
+            return caregiver_sid
+
         childconsent_obj = self.child_dummy_consent_model_cls.objects.filter(
             subject_identifier=subject_identifier).last()
 
@@ -0,0 +1,46 @@
+import csv
+
+from dateutil import parser
+from dateutil.tz import gettz
+from django.core.management.base import BaseCommand
+
+from flourish_child.helper_classes import BulkChildOnScheduleHelper
+
+
+class Command(BaseCommand):
+
+    help = ('Put children on schedule in bulk from a csv file with the columns '
+            'subject_identifier, cohort and base_appt_datetime.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('csv_file', type=str, help='Path to the enrolments csv.')
+        parser.add_argument(
+            '--chunk-size', type=int, default=500,
+            help='Number of enrolments committed per transaction.')
+        parser.add_argument(
+            '--resume-from', type=int, default=0,
+            help='Index of the first enrolment to process, see the last run output.')
+
+    def handle(self, *args, **kwargs):
+        with open(kwargs.get('csv_file')) as csv_file:
+            enrolments = [
+                (row.get('subject_identifier'), row.get('cohort'),
+                 self.base_appt_datetime(row.get('base_appt_datetime')))
+                for row in csv.DictReader(csv_file)]
+
+        helper = BulkChildOnScheduleHelper(
+            enrolments=enrolments, chunk_size=kwargs.get('chunk_size'))
+        summary = helper.put_on_schedule(resume_from=kwargs.get('resume_from'))
+
+        for subject_identifier, error in summary.get('failed'):
+            self.stderr.write(f'{subject_identifier}: {error}')
+        self.stdout.write(self.style.SUCCESS(
+            f'{summary.get("created")} put on schedule, {summary.get("skipped")} '
+            f'already on schedule, {len(summary.get("failed"))} failed. '
+            f'Resume from {summary.get("resume_from")}.'))
+
+    def base_appt_datetime(self, value):
+        base_appt_datetime = parser.parse(value)
+        if not base_appt_datetime.tzinfo:
+            base_appt_datetime = base_appt_datetime.replace(tzinfo=gettz('UTC'))
+        return base_appt_datetime.replace(microsecond=0)
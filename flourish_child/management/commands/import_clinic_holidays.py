@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from flourish_child.helper_classes.clinic_calendar import import_holidays
+
+
+class Command(BaseCommand):
+
+    help = ('Import the holidays file (settings.HOLIDAY_FILE) and reload the '
+            'clinic calendar of every worker.')
+
+    def handle(self, *args, **kwargs):
+        import_holidays()
+        self.stdout.write(self.style.SUCCESS('Holidays imported.'))
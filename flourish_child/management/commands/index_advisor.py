@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from flourish_child.helper_classes.index_advisor import IndexAdvisor
+
+
+class Command(BaseCommand):
+
+    help = ('Explain the hot appointment, visit and CRF lookups and list '
+            'the tables they read with a full table scan.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--plans', action='store_true', default=False,
+            help='Print the query plan of each lookup.')
+
+    def handle(self, *args, **kwargs):
+        report = IndexAdvisor().report()
+        for advice in report:
+            if advice.full_scans:
+                self.stdout.write(self.style.WARNING(
+                    f'{advice.name}: full scan of {", ".join(advice.full_scans)}'))
+            else:
+                self.stdout.write(f'{advice.name}: index')
+            if kwargs.get('plans'):
+                self.stdout.write(advice.plan)
+        full_scans = len([advice for advice in report if advice.full_scans])
+        self.stdout.write(self.style.SUCCESS(
+            f'{full_scans} of {len(report)} lookups read a table in full.'))
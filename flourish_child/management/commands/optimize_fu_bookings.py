@@ -0,0 +1,41 @@
+from dateutil import parser
+from django.core.management.base import BaseCommand
+
+from flourish_child.helper_classes.child_fu_booking_optimizer import \
+    ChildFollowUpBookingOptimizer
+
+
+class Command(BaseCommand):
+
+    help = 'Assign follow up booking dates for all unbooked children in one batch.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run', action='store_true', default=False,
+            help='Print the booking diff without writing it.')
+        parser.add_argument(
+            '--include-booked', action='store_true', default=False,
+            help='Also move children already booked on or after the start date.')
+        parser.add_argument(
+            '--start-date', type=str, default=None,
+            help='First date to book against, defaults to today.')
+
+    def handle(self, *args, **kwargs):
+        start_date = kwargs.get('start_date')
+        optimizer = ChildFollowUpBookingOptimizer(
+            start_date=parser.parse(start_date).date() if start_date else None,
+            include_booked=kwargs.get('include_booked'))
+        diff = optimizer.diff()
+
+        for subject_identifier, current_date, booking_date in diff.get('created'):
+            self.stdout.write(f'+ {subject_identifier}: {booking_date}')
+        for subject_identifier, current_date, booking_date in diff.get('moved'):
+            self.stdout.write(
+                f'~ {subject_identifier}: {current_date} -> {booking_date}')
+
+        if not kwargs.get('dry_run'):
+            optimizer.apply(diff=diff)
+        self.stdout.write(self.style.SUCCESS(
+            f'{len(diff.get("created"))} created, {len(diff.get("moved"))} moved, '
+            f'{len(diff.get("unchanged"))} unchanged'
+            f'{" (dry run)" if kwargs.get("dry_run") else ""}.'))
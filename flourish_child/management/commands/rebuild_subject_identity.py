@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from flourish_child.models import SubjectIdentityGraph
+
+
+class Command(BaseCommand):
+
+    help = 'Rebuild the subject identity graph from the consent and dataset tables.'
+
+    def handle(self, *args, **kwargs):
+        created = SubjectIdentityGraph.objects.rebuild()
+        self.stdout.write(self.style.SUCCESS(
+            f'Rebuilt subject identity graph, {created} rows created.'))
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from flourish_child.models import ChildIdentifierSequence
+
+
+class Command(BaseCommand):
+
+    help = ('Check the child identifier sequences against the registered '
+            'child identifiers.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--fix', action='store_true', default=False,
+            help='Move sequences that would reuse an identifier past it.')
+
+    def handle(self, *args, **kwargs):
+        mismatches = ChildIdentifierSequence.objects.reconcile(
+            fix=kwargs.get('fix'))
+        for caregiver_subject_identifier, last_value, expected in mismatches:
+            self.stdout.write(
+                f'{caregiver_subject_identifier}: {last_value} -> {expected}')
+        self.stdout.write(self.style.SUCCESS(
+            f'{len(mismatches)} sequences behind the registered identifiers'
+            f'{", fixed" if kwargs.get("fix") else ""}.'))
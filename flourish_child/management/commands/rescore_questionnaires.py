@@ -0,0 +1,40 @@
+from django.apps import apps as django_apps
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+
+    help = 'Recompute the stored scores of the scored questionnaires in bulk.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'models', nargs='*',
+            help='Model names to rescore, e.g. childphqdepressionscreening. '
+                 'Defaults to all scored questionnaires.')
+        parser.add_argument(
+            '--dry-run', action='store_true', default=False,
+            help='Count the changed scores without writing them.')
+        parser.add_argument(
+            '--batch-size', type=int, default=1000,
+            help='Rows per bulk update.')
+
+    def handle(self, *args, **kwargs):
+        app_config = django_apps.get_app_config('flourish_child')
+        model_clss = [model_cls for model_cls in app_config.get_models()
+                      if getattr(model_cls, 'scoring_instrument', None)]
+        if kwargs.get('models'):
+            names = [name.lower() for name in kwargs.get('models')]
+            unknown = set(names) - {
+                model_cls._meta.model_name for model_cls in model_clss}
+            if unknown:
+                raise CommandError(
+                    f'Not scored questionnaires: {", ".join(sorted(unknown))}')
+            model_clss = [model_cls for model_cls in model_clss
+                          if model_cls._meta.model_name in names]
+
+        for model_cls in model_clss:
+            changed = model_cls.scoring_instrument.rescore(
+                model_cls, batch_size=kwargs.get('batch_size'),
+                dry_run=kwargs.get('dry_run'))
+            self.stdout.write(f'{model_cls._meta.label_lower}: {changed} changed')
+        self.stdout.write(self.style.SUCCESS('Done.'))
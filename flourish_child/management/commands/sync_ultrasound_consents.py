@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from flourish_child.helper_classes.ultrasound_consent_sync import \
+    UltrasoundConsentSync
+
+
+class Command(BaseCommand):
+
+    help = 'Mirror the REDCap ultrasound consents changed since the last sync.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--full', action='store_true', default=False,
+            help='Export all consents instead of the changes since the last sync.')
+
+    def handle(self, *args, **kwargs):
+        created, updated = UltrasoundConsentSync().sync(full=kwargs.get('full'))
+        self.stdout.write(self.style.SUCCESS(
+            f'{created} created, {updated} updated.'))
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from flourish_child.models import ChildDummySubjectConsent
+
+
+class Command(BaseCommand):
+
+    help = ('Set the relative identifier of the child dummy consents to the '
+            'caregiver\'s subject identifier.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run', action='store_true', default=False,
+            help='Print the changes without writing them.')
+
+    def handle(self, *args, **kwargs):
+        changes = ChildDummySubjectConsent.objects.update_relative_identifier(
+            dry_run=kwargs.get('dry_run'))
+        for subject_identifier, current, new in changes:
+            self.stdout.write(f'{subject_identifier}: {current} -> {new}')
+        self.stdout.write(self.style.SUCCESS(f'{len(changes)} changed.'))
@@ -1,8 +1,13 @@
-import pytz
-from django.db import models
+import logging
+
+from django.db import models, transaction
+from django.db.models import F, Q
 from django.db.models.deletion import ProtectedError
 from edc_appointment.constants import NEW_APPT
 from edc_appointment.managers import AppointmentManager as EdcAppointmentManager
+from edc_visit_schedule.site_visit_schedules import site_visit_schedules
+
+logger = logging.getLogger(__name__)
 
 
 class AppointmentManager(EdcAppointmentManager, models.Manager):
@@ -15,10 +20,33 @@ class AppointmentManager(EdcAppointmentManager, models.Manager):
                                       schedule_name=None):
         """ Deletes appointments for a given subject_identifier with
             appt datetime covering the window period greater than or equal to
-            the `dt`.
+            the `dt`. Returns the number of appointments deleted.
 
-        If a visit form exists for any appointment, a ProtectedError will
-        be raised.
+        Appointments with a visit form are protected and not deleted, see
+        `delete_for_subject_after_date_report`.
+        """
+        report = self.delete_for_subject_after_date_report(
+            subject_identifier, dt, op=op,
+            visit_schedule_name=visit_schedule_name,
+            schedule_name=schedule_name)
+        return len(report.get('deleted'))
+
+    def delete_for_subject_after_date_report(self, subject_identifier, dt, op=None,
+                                             visit_schedule_name=None,
+                                             schedule_name=None):
+        """ Deletes, in a single transaction, appointments for a given
+            subject_identifier with appt datetime greater than or equal to
+            the `dt`, plus NEW appointments whose window upper bound is
+            greater than or equal to the `dt`.
+
+        As before, appointments are considered from the latest timepoint
+        backwards and deletion stops at the first appointment protected by
+        a visit form. Returns a dict of the `deleted` and `protected`
+        appointment (id, visit_code, visit_code_sequence) tuples.
+
+        Should the delete still raise a ProtectedError, the transaction is
+        rolled back and no appointment is deleted; all are reported as
+        protected.
         """
         valid_ops = ['gt', 'gte']
         op = 'gte' if op is None else op
@@ -39,32 +67,86 @@ class AppointmentManager(EdcAppointmentManager, models.Manager):
                     options.update(dict(schedule_name=schedule_name))
             options.update(dict(visit_schedule_name=visit_schedule_name))
 
-        appt_options = options.copy()
-        appt_options.update({f'appt_datetime__{op}': dt})
-        future_appts = self.filter(**appt_options).order_by('-timepoint')
-        deleted = self.delete_appointment(appointments=future_appts)
+        visit_attr = self.model.related_visit_model_attr()
+        fields = ['id', 'visit_code', 'visit_code_sequence', 'timepoint',
+                  'appt_datetime', 'appt_status', 'timepoint_datetime',
+                  'visit_schedule_name', 'schedule_name']
+        values = dict(visit_id=F(f'{visit_attr}__id'))
+
+        future_appts = list(self.filter(
+            **options, **{f'appt_datetime__{op}': dt}).values(
+                *fields, **values).order_by('-timepoint'))
+        deleted, protected = self.deletable_appointments(future_appts)
 
         # Checks if there's any new appointments remaining that have a future
         # upper window period opening, and removes them too.
-        appt_options = options.copy()
-        appt_options.update({f'appt_status': NEW_APPT})
-        appointments = self.filter(**appt_options).order_by('-timepoint')
+        new_appts = self.filter(**options, appt_status=NEW_APPT)
+        window_uppers = self.window_uppers(new_appts.values(
+            'visit_schedule_name', 'schedule_name', 'visit_code').distinct())
         future_by_upper = []
-        for appt in appointments:
-            visit_definition = appt.visits.get(appt.visit_code)
-            latest_appt_date = (
-                appt.timepoint_datetime + visit_definition.rupper).astimezone(
-                    pytz.timezone('Africa/Gaborone'))
-            if latest_appt_date >= dt:
-                future_by_upper.append(appt)
-        deleted += self.delete_appointment(appointments=future_by_upper, deleted=deleted)
-        return deleted
-
-    def delete_appointment(self, appointments=[], deleted=0):
-        for appointment in appointments:
+        if window_uppers:
+            window_query = Q()
+            for (visit_schedule_name, schedule_name, visit_code), rupper in (
+                    window_uppers.items()):
+                window_query |= Q(visit_schedule_name=visit_schedule_name,
+                                  schedule_name=schedule_name,
+                                  visit_code=visit_code,
+                                  timepoint_datetime__gte=dt - rupper)
+            future_by_upper = list(new_appts.filter(window_query).exclude(
+                id__in=[appt.get('id') for appt in deleted]).values(
+                    *fields, **values).order_by('-timepoint'))
+        deleted_by_upper, protected_by_upper = self.deletable_appointments(
+            future_by_upper)
+        deleted += deleted_by_upper
+        protected += [appt for appt in protected_by_upper if appt not in protected]
+
+        if deleted:
             try:
-                appointment.delete()
-                deleted += 1
-            except ProtectedError:
-                break
-        return deleted
+                with transaction.atomic():
+                    self.filter(
+                        id__in=[appt.get('id') for appt in deleted]).delete()
+            except ProtectedError as e:
+                logger.warning(
+                    f'Failed to delete appointments for {subject_identifier}: {e}')
+                protected += deleted
+                deleted = []
+
+        return dict(deleted=self.appointment_report(deleted),
+                    protected=self.appointment_report(protected))
+
+    def deletable_appointments(self, appointments=[]):
+        """ Splits appointments, ordered by descending timepoint, into those
+            that can be deleted and those protected by a visit form. As with
+            one by one deletion, nothing below a protected appointment is
+            deleted.
+        """
+        deletable = []
+        for index, appointment in enumerate(appointments):
+            if appointment.get('visit_id'):
+                return deletable, [appt for appt in appointments[index:]
+                                   if appt.get('visit_id')]
+            deletable.append(appointment)
+        return deletable, []
+
+    def visit_key(self, appointment):
+        return (appointment.get('visit_schedule_name'),
+                appointment.get('schedule_name'),
+                appointment.get('visit_code'))
+
+    def window_uppers(self, appointments=[]):
+        """ Returns a dict of the window upper bound (`rupper`) per visit,
+            looking up each visit definition once.
+        """
+        uppers = {}
+        for appointment in appointments:
+            key = self.visit_key(appointment)
+            if key not in uppers:
+                visit_schedule_name, schedule_name, visit_code = key
+                schedule = site_visit_schedules.get_visit_schedule(
+                    visit_schedule_name).schedules.get(schedule_name)
+                uppers[key] = schedule.visits.get(visit_code).rupper
+        return uppers
+
+    def appointment_report(self, appointments=[]):
+        return [(appt.get('id'), appt.get('visit_code'),
+                 appt.get('visit_code_sequence')) for appt in appointments]
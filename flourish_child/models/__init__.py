@@ -104,6 +104,8 @@ from .onschedule import OnScheduleChildTbAdolSchedule
 from .onschedule import OnScheduleTbAdolFollowupSchedule
 from .pre_flourish_birth_data import PreFlourishBirthData
 from .signals import child_consent_on_post_save
+from .subject_identity_graph import SubjectIdentityGraph
+from .child_identifier_sequence import ChildIdentifierSequence
 from .tb_adol_assent import TbAdolAssent
 from .tb_engagement import TbAdolEngagement
 from .tb_int_transcription import TbAdolInterviewTranscription
@@ -111,6 +113,7 @@ from .tb_int_translation import TbAdolInterviewTranslation
 from .tb_interview import TbAdolInterview
 from .tb_referral_outcomes import TbAdolReferralOutcomes
 from .tb_visit_screen_adol import TbVisitScreeningAdolescent
+from .ultrasound_consent_mirror import RedcapSync, UltrasoundConsentMirror
 from .young_adult_locator import YoungAdultLocator
 from .child_social_work_referral import ChildSocialWorkReferral
 from .child_safi_stigma import ChildSafiStigma
@@ -1,11 +1,19 @@
 from django.db import models
 
 from .child_crf_model_mixin import ChildCrfModelMixin
+from .model_mixins import QuestionnaireScoreMixin
 from .model_mixins.test_questions_mixin import TestQuestionMixin
 from ..choices import BRIEF2_SCALE
+from ..helper_classes.questionnaire_scoring import BRIEF2_SCORES, Instrument
 
 
-class Brief2Parent(ChildCrfModelMixin, TestQuestionMixin):
+class Brief2Parent(QuestionnaireScoreMixin, ChildCrfModelMixin, TestQuestionMixin):
+
+    scoring_instrument = Instrument(
+        values=BRIEF2_SCORES,
+        item_choices=BRIEF2_SCALE,
+        total_field='total_score')
+
     memory_retention = models.CharField(
         verbose_name='When given three things to do, remembers only the first or last',
         choices=BRIEF2_SCALE,
@@ -66,6 +74,11 @@ class Brief2Parent(ChildCrfModelMixin, TestQuestionMixin):
         choices=BRIEF2_SCALE,
         max_length=10)
 
+    total_score = models.IntegerField(
+        verbose_name='Total score',
+        null=True,
+        editable=False)
+
     class Meta(ChildCrfModelMixin.Meta):
         app_label = 'flourish_child'
         verbose_name = 'BRIEF-2 Screening Parent'
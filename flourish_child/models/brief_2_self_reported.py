@@ -3,11 +3,19 @@ from edc_base.model_fields import OtherCharField
 from edc_constants.choices import YES_NO
 
 from .child_crf_model_mixin import ChildCrfModelMixin
+from .model_mixins import QuestionnaireScoreMixin
 from ..choices import BRIEF2_SCALE, CBCL_IMPACT, CBCL_INTEREST, CBCL_INVALID_REASON, \
     CBCL_UNDERSTANDING
+from ..helper_classes.questionnaire_scoring import BRIEF2_SCORES, Instrument
 
 
-class Brief2SelfReported(ChildCrfModelMixin):
+class Brief2SelfReported(QuestionnaireScoreMixin, ChildCrfModelMixin):
+
+    scoring_instrument = Instrument(
+        values=BRIEF2_SCORES,
+        item_choices=BRIEF2_SCALE,
+        total_field='total_score')
+
     short_attention_span = models.CharField(
         verbose_name='I have a short attention span',
         choices=BRIEF2_SCALE,
@@ -123,6 +131,11 @@ class Brief2SelfReported(ChildCrfModelMixin):
         blank=True,
         null=True)
 
+    total_score = models.IntegerField(
+        verbose_name='Total score',
+        null=True,
+        editable=False)
+
     class Meta(ChildCrfModelMixin.Meta):
         app_label = 'flourish_child'
         verbose_name = 'BRIEF-2 Screening Self-Reported'
@@ -49,4 +49,16 @@ class Appointment(AppointmentModelMixin, SiteModelMixin, BaseUuidModel):
         ).order_by('timepoint').first()
 
     class Meta(AppointmentModelMixin.Meta):
-        pass
+        indexes = list(getattr(AppointmentModelMixin.Meta, 'indexes', [])) + [
+            # next_by_timepoint
+            models.Index(fields=['subject_identifier', 'schedule_name',
+                                 'visit_code_sequence', 'timepoint'],
+                         name='child_appt_schedule_tp_idx'),
+            # child_utils.get_previous_appt_instance
+            models.Index(fields=['subject_identifier', 'schedule_name',
+                                 'visit_code_sequence', 'appt_datetime'],
+                         name='child_appt_schedule_dt_idx'),
+            # admin KeysetChangeList
+            models.Index(fields=['modified', 'id'],
+                         name='child_appt_modified_id_idx'),
+        ]
@@ -190,11 +190,19 @@ class ChildAssent(SiteModelMixin, NonUniqueSubjectIdentifierFieldMixin,
                 'Please complete the adult participation consent '
                 f'v{self.version} first.')
         else:
-            children_count = 1 + child_utils.registered_subject_cls.objects.filter(
-                relative_identifier=consent.subject_identifier).exclude(
-                    identity=self.identity).count()
-            child_identifier_postfix = '-' + str(children_count * 10)
-            return consent.subject_identifier + child_identifier_postfix
+            registered_subject = child_utils.registered_subject_cls.objects.filter(
+                relative_identifier=consent.subject_identifier,
+                identity=self.identity).values_list(
+                    'subject_identifier', flat=True).first()
+            if registered_subject:
+                return registered_subject
+            sequence_cls = django_apps.get_model(
+                'flourish_child.childidentifiersequence')
+            value = sequence_cls.objects.allocate(
+                caregiver_subject_identifier=consent.subject_identifier)
+            return sequence_cls(
+                caregiver_subject_identifier=consent.subject_identifier).child_identifier(
+                    value)
 
     class Meta:
         app_label = 'flourish_child'
@@ -1,10 +1,18 @@
 from django.db import models
 
 from .child_crf_model_mixin import ChildCrfModelMixin
+from .model_mixins import QuestionnaireScoreMixin
 from ..choices import CBCL_SCALE
+from ..helper_classes.questionnaire_scoring import CBCL_SCORES, Instrument
 
 
-class ChildCBCLSection1(ChildCrfModelMixin):
+class ChildCBCLSection1(QuestionnaireScoreMixin, ChildCrfModelMixin):
+
+    scoring_instrument = Instrument(
+        values=CBCL_SCORES,
+        missing_score=0,
+        item_choices=CBCL_SCALE,
+        total_field='section_score')
 
     acts_young = models.CharField(
         verbose_name='Acts too young for his/her age',
@@ -201,6 +209,11 @@ class ChildCBCLSection1(ChildCrfModelMixin):
         max_length=10,
         help_text='(30)')
 
+    section_score = models.IntegerField(
+        verbose_name='Section score',
+        null=True,
+        editable=False)
+
     class Meta(ChildCrfModelMixin.Meta):
         app_label = 'flourish_child'
         verbose_name = 'Child CBCL Section: 1'
@@ -1,10 +1,18 @@
 from django.db import models
 
 from .child_crf_model_mixin import ChildCrfModelMixin
+from .model_mixins import QuestionnaireScoreMixin
 from ..choices import CBCL_SCALE
+from ..helper_classes.questionnaire_scoring import CBCL_SCORES, Instrument
 
 
-class ChildCBCLSection2(ChildCrfModelMixin):
+class ChildCBCLSection2(QuestionnaireScoreMixin, ChildCrfModelMixin):
+
+    scoring_instrument = Instrument(
+        values=CBCL_SCORES,
+        missing_score=0,
+        item_choices=CBCL_SCALE,
+        total_field='section_score')
 
     fear_harmful_thoughts = models.CharField(
         verbose_name='Fears he/she might think or do something bad',
@@ -166,6 +174,11 @@ class ChildCBCLSection2(ChildCrfModelMixin):
         max_length=10,
         help_text='(55)')
 
+    section_score = models.IntegerField(
+        verbose_name='Section score',
+        null=True,
+        editable=False)
+
     class Meta(ChildCrfModelMixin.Meta):
         app_label = 'flourish_child'
         verbose_name = 'Child CBCL Section: 2'
@@ -1,11 +1,20 @@
 from django.db import models
 
 from .child_crf_model_mixin import ChildCrfModelMixin
+from .model_mixins import QuestionnaireScoreMixin
 from .model_mixins.test_questions_mixin import TestQuestionMixin
 from ..choices import CBCL_SCALE
+from ..helper_classes.questionnaire_scoring import CBCL_SCORES, Instrument
 
 
-class ChildCBCLSection4(ChildCrfModelMixin, TestQuestionMixin):
+class ChildCBCLSection4(QuestionnaireScoreMixin, ChildCrfModelMixin, TestQuestionMixin):
+
+    scoring_instrument = Instrument(
+        values=CBCL_SCORES,
+        missing_score=0,
+        item_choices=CBCL_SCALE,
+        total_field='section_score')
+
     stares_blankly = models.CharField(
         verbose_name='Stares blankly',
         choices=CBCL_SCALE,
@@ -241,6 +250,11 @@ class ChildCBCLSection4(ChildCrfModelMixin, TestQuestionMixin):
         verbose_name='Please write in any problems your child has that were not listed above',
         help_text='(113)')
 
+    section_score = models.IntegerField(
+        verbose_name='Section score',
+        null=True,
+        editable=False)
+
     class Meta(ChildCrfModelMixin.Meta):
         app_label = 'flourish_child'
         verbose_name = 'Child CBCL Section: 4'
@@ -15,7 +15,8 @@ class ChildDataset(
 
     study_maternal_identifier = models.CharField(
         verbose_name="Study maternal Subject Identifier",
-        max_length=50)
+        max_length=50,
+        db_index=True)
 
     first_name = FirstnameField(
         verbose_name='Firstname',
@@ -34,11 +34,37 @@ class ChildDummySubjectConsentManager(SearchSlugManager, models.Manager):
             return consent.subject_consent.subject_identifier
         return None
 
-    def update_relative_identifier(self):
-        for obj in self.all():
-            parent_identifier = self.parent_identifier(obj.subject_identifier)
-            setattr(obj, 'relative_identifier', parent_identifier)
-            obj.save_base(raw=True, update_fields=['relative_identifier'])
+    def parent_identifiers(self):
+        """Returns a dict of child subject identifier to the caregiver
+        subject identifier of the child's last consent, for all the dummy
+        consents, with one query.
+        """
+        consents = self.child_consent_model_cls.objects.filter(
+            subject_identifier__in=self.values('subject_identifier'))
+        if not consents.ordered:
+            consents = consents.order_by('pk')
+        # Later consents replace earlier ones, as `last()`.
+        return dict(consents.values_list(
+            'subject_identifier', 'subject_consent__subject_identifier'))
+
+    def update_relative_identifier(self, dry_run=False, batch_size=500):
+        """Sets each dummy consent's relative identifier to its caregiver's
+        subject identifier, updating only the changed rows in batches.
+        Returns a list of (subject identifier, current, new) of the changes.
+        """
+        parent_identifiers = self.parent_identifiers()
+        changes, changed = [], []
+        for pk, subject_identifier, relative_identifier in self.values_list(
+                'pk', 'subject_identifier', 'relative_identifier'):
+            parent_identifier = parent_identifiers.get(subject_identifier)
+            if parent_identifier != relative_identifier:
+                changes.append(
+                    (subject_identifier, relative_identifier, parent_identifier))
+                changed.append(self.model(
+                    pk=pk, relative_identifier=parent_identifier))
+        if changed and not dry_run:
+            self.bulk_update(changed, ['relative_identifier'], batch_size=batch_size)
+        return changes
 
 
 class ChildDummySubjectConsent(
@@ -1,10 +1,25 @@
 from django.db import models
+from edc_constants.constants import YES
 
 from .child_crf_model_mixin import ChildCrfModelMixin
+from .model_mixins import QuestionnaireScoreMixin
 from ..choices import ANSWERER, FOOD, HOW_OFTEN, YES_NO_DONT_KNOW
+from ..helper_classes.questionnaire_scoring import Instrument
 
 
-class ChildFoodSecurityQuestionnaire(ChildCrfModelMixin):
+class ChildFoodSecurityQuestionnaire(QuestionnaireScoreMixin, ChildCrfModelMixin):
+
+    # Six item short form raw score, the number of affirmative answers.
+    scoring_instrument = Instrument(
+        items=['did_food_last', 'balanced_meals', 'cut_meals', 'how_often',
+               'eat_less', 'didnt_eat'],
+        values={YES: 1},
+        item_values={
+            'did_food_last': {FOOD[0][0]: 1, FOOD[1][0]: 1},
+            'balanced_meals': {FOOD[0][0]: 1, FOOD[1][0]: 1},
+            'how_often': {'almost_every_month': 1, 'some_months': 1}},
+        missing_score=0,
+        total_field='food_security_score')
 
     answerer = models.CharField(
         verbose_name='Who will answer the Food Security Questionnaire?',
@@ -42,6 +57,11 @@ class ChildFoodSecurityQuestionnaire(ChildCrfModelMixin):
                      ' eat because there wasn\'t enough money for food?',
         max_length=20, choices=YES_NO_DONT_KNOW)
 
+    food_security_score = models.IntegerField(
+        verbose_name='Food security raw score',
+        null=True,
+        editable=False)
+
     class Meta(ChildCrfModelMixin.Meta):
 
         app_label = 'flourish_child'
@@ -1,10 +1,19 @@
 from django.db import models
 
 from .child_crf_model_mixin import ChildCrfModelMixin
+from .model_mixins import QuestionnaireScoreMixin
 from ..choices import DEPRESSION_SCALE
+from ..helper_classes.questionnaire_scoring import Instrument
 
 
-class ChildGadAnxietyScreening(ChildCrfModelMixin):
+class ChildGadAnxietyScreening(QuestionnaireScoreMixin, ChildCrfModelMixin):
+
+    scoring_instrument = Instrument(
+        items=['feeling_anxious', 'control_worrying', 'worrying',
+               'trouble_relaxing', 'restlessness', 'easily_annoyed', 'fearful'],
+        values={value: int(value) for value, _ in DEPRESSION_SCALE},
+        total_field='anxiety_score',
+        subscales={'gad2_score': ['feeling_anxious', 'control_worrying']})
 
     feeling_anxious = models.CharField(
         verbose_name='Feeling nervous, anxious, or on edge',
@@ -45,19 +54,14 @@ class ChildGadAnxietyScreening(ChildCrfModelMixin):
         null=True,
         blank=True)
 
-    def save(self, *args, **kwargs):
-        self.anxiety_score = self.calculate_depression_score
-        super().save(*args, **kwargs)
+    gad2_score = models.IntegerField(
+        verbose_name='GAD-2 score',
+        null=True,
+        editable=False)
 
     @property
     def calculate_depression_score(self):
-        score = 0
-        for f in self._meta.get_fields():
-            if f.name in ['feeling_anxious', 'control_worrying', 'worrying',
-                          'trouble_relaxing', 'restlessness', 'easily_annoyed',
-                          'fearful', ]:
-                score += int(getattr(self, f.name))
-        return score
+        return self.scoring_instrument.score(self).get('anxiety_score')
 
     class Meta(ChildCrfModelMixin.Meta):
         app_label = 'flourish_child'
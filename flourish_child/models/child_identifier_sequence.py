@@ -0,0 +1,106 @@
+from django.apps import apps as django_apps
+from django.db import models, transaction
+from edc_base.model_mixins import BaseUuidModel
+
+
+class ChildIdentifierSequenceManager(models.Manager):
+
+    registered_subject_model = 'edc_registration.registeredsubject'
+    child_consent_model = 'flourish_caregiver.caregiverchildconsent'
+
+    @property
+    def registered_subject_cls(self):
+        return django_apps.get_model(self.registered_subject_model)
+
+    @property
+    def child_consent_cls(self):
+        return django_apps.get_model(self.child_consent_model)
+
+    def registered_children(self, caregiver_subject_identifier=None):
+        """Returns the subject identifiers registered with the caregiver as
+        their relative, or given to a child on the caregiver's child
+        consent.
+        """
+        registered_children = set(self.registered_subject_cls.objects.filter(
+            relative_identifier=caregiver_subject_identifier).values_list(
+                'subject_identifier', flat=True))
+        registered_children.update(self.child_consent_cls.objects.filter(
+            subject_identifier__startswith=f'{caregiver_subject_identifier}-').values_list(
+                'subject_identifier', flat=True))
+        return sorted(registered_children)
+
+    def allocate(self, caregiver_subject_identifier=None):
+        """Returns the caregiver's next child sequence number.
+
+        The caregiver's row is locked with `select_for_update`, so siblings
+        saved at the same time get different numbers. Each allocation
+        starts past the number of children already registered with the
+        caregiver and past the highest registered child identifier, so
+        identifiers given out elsewhere, e.g. on the child consent, are
+        not handed out again.
+        """
+        with transaction.atomic():
+            sequence, _ = self.select_for_update().get_or_create(
+                caregiver_subject_identifier=caregiver_subject_identifier)
+            registered_children = self.registered_children(
+                caregiver_subject_identifier)
+            sequence.last_value = max(
+                sequence.last_value,
+                len(registered_children),
+                sequence.expected_last_value(registered_children))
+            sequence.last_value += 1
+            sequence.save()
+        return sequence.last_value
+
+    def reconcile(self, fix=False):
+        """Returns a list of (caregiver subject identifier, last value,
+        expected last value) of the sequences that would hand out a number
+        already in use. Moves them past the used numbers if `fix`.
+        """
+        mismatches = []
+        for sequence in self.all():
+            expected = sequence.expected_last_value(
+                self.registered_children(sequence.caregiver_subject_identifier))
+            if expected > sequence.last_value:
+                mismatches.append((sequence.caregiver_subject_identifier,
+                                   sequence.last_value, expected))
+                if fix:
+                    with transaction.atomic():
+                        locked = self.select_for_update().get(pk=sequence.pk)
+                        locked.last_value = max(locked.last_value, expected)
+                        locked.save()
+        return mismatches
+
+
+class ChildIdentifierSequence(BaseUuidModel):
+    """Last child sequence number handed out per caregiver, the child's
+    subject identifier being the caregiver's followed by `-{number * 10}`.
+    """
+
+    caregiver_subject_identifier = models.CharField(
+        max_length=50,
+        unique=True)
+
+    last_value = models.IntegerField(default=0)
+
+    objects = ChildIdentifierSequenceManager()
+
+    def child_identifier(self, value=None):
+        return f'{self.caregiver_subject_identifier}-{(value or self.last_value) * 10}'
+
+    def expected_last_value(self, registered_children=[]):
+        """Returns the lowest last value from which no registered child
+        identifier is handed out again.
+        """
+        prefix = f'{self.caregiver_subject_identifier}-'
+        used = [0]
+        for subject_identifier in registered_children:
+            suffix = subject_identifier[len(prefix):]
+            if (subject_identifier.startswith(prefix) and suffix.isdigit()
+                    and int(suffix) % 10 == 0):
+                used.append(int(suffix) // 10)
+        return max(used)
+
+    class Meta:
+        app_label = 'flourish_child'
+        verbose_name = 'Child Identifier Sequence'
@@ -2,10 +2,20 @@ from django.db import models
 from edc_constants.choices import YES_NO
 
 from .child_crf_model_mixin import ChildCrfModelMixin
+from .model_mixins import QuestionnaireScoreMixin
 from ..choices import DEPRESSION_SCALE, DIFFICULTY_LEVEL
+from ..helper_classes.questionnaire_scoring import Instrument
 
 
-class ChildPhqDepressionScreening(ChildCrfModelMixin):
+class ChildPhqDepressionScreening(QuestionnaireScoreMixin, ChildCrfModelMixin):
+
+    scoring_instrument = Instrument(
+        items=['activity_interest', 'depressed', 'sleep_disorders', 'fatigued',
+               'eating_disorders', 'self_doubt', 'easily_distracted',
+               'restlessness', 'self_harm'],
+        values={value: int(value) for value, _ in DEPRESSION_SCALE},
+        total_field='depression_score',
+        subscales={'phq2_score': ['activity_interest', 'depressed']})
 
     depressed = models.CharField(
         verbose_name='Feeling down, depressed, irritable or hopelesss',
@@ -87,18 +97,13 @@ class ChildPhqDepressionScreening(ChildCrfModelMixin):
         null=True,
         blank=True)
 
-    def save(self, *args, **kwargs):
-        self.depression_score = self.calculate_depression_score()
-        super().save(*args, **kwargs)
+    phq2_score = models.IntegerField(
+        verbose_name='PHQ-2 score',
+        null=True,
+        editable=False)
 
     def calculate_depression_score(self):
-        score = 0
-        for f in self._meta.get_fields():
-            if f.name in ['activity_interest', 'depressed', 'sleep_disorders',
-                          'fatigued', 'eating_disorders', 'self_doubt',
-                          'easily_distracted', 'restlessness', 'self_harm', ]:
-                score += int(getattr(self, f.name))
-        return score
+        return self.scoring_instrument.score(self).get('depression_score')
 
     class Meta(ChildCrfModelMixin.Meta):
         app_label = 'flourish_child'
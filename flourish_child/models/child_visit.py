@@ -113,3 +113,11 @@ class ChildVisit(
         app_label = 'flourish_child'
         verbose_name = "Child Visit"
         verbose_name_plural = "Child Visit"
+        indexes = list(getattr(VisitModelMixin.Meta, 'indexes', [])) + [
+            models.Index(fields=['subject_identifier', 'visit_code'],
+                         name='child_visit_subject_code_idx',
+                         opclasses=['varchar_pattern_ops', 'varchar_pattern_ops']),
+            # admin KeysetChangeList
+            models.Index(fields=['modified', 'id'],
+                         name='child_visit_modified_id_idx'),
+        ]
@@ -5,6 +5,7 @@ from edc_constants.choices import YES_NO, YES_NO_NA, YES_NO_UNSURE_NA
 from edc_constants.constants import NOT_APPLICABLE
 
 from ..choices import COWS_MILK, TIMES_BREASTFED, WATER_USED
+from ..helper_classes.previous_crf_resolver import PreviousCrfResolver
 from .child_crf_model_mixin import ChildCrfModelMixin
 
 
@@ -215,18 +216,16 @@ class InfantFeedingPractices(ChildCrfModelMixin):
         null=True)
 
     def save(self, *args, **kwargs):
-        previous_infant_feeding = self.previous_infant_feeding(self.infant_visit)
+        previous_infant_feeding = self.previous_infant_feeding(self.child_visit)
         if previous_infant_feeding:
             self.last_att_sche_visit = previous_infant_feeding.report_datetime.date()
         super(InfantFeedingPractices, self).save(*args, **kwargs)
 
-    def previous_infant_feeding(self, infant_visit):
+    def previous_infant_feeding(self, child_visit):
         """ Return previous infant feeding from. """
 
-        return self.__class__.objects.filter(
-            infant_visit__appointment__subject_identifier=infant_visit.appointment.subject_identifier,
-            report_datetime__lt=self.report_datetime).order_by(
-                '-report_datetime').first()
+        return PreviousCrfResolver(visit=child_visit).latest(
+            self.__class__, before=self.report_datetime)
 
     class Meta(ChildCrfModelMixin.Meta):
         app_label = 'flourish_child'
@@ -5,3 +5,4 @@ from .referral_form_mixin import ReferralFormMixin
 from .search_slug_model_mixin import SearchSlugModelMixin
 from .child_socio_demographic_mixin import ChildSocioDemographicMixin
 from .child_medical_history_mixin import ChildMedicalHistoryMixin
+from .questionnaire_score_mixin import QuestionnaireScoreMixin
@@ -0,0 +1,11 @@
+class QuestionnaireScoreMixin:
+    """Stores the scores of the model's `scoring_instrument` on save.
+    """
+
+    scoring_instrument = None
+
+    def save(self, *args, **kwargs):
+        if self.scoring_instrument:
+            for field, score in self.scoring_instrument.score(self).items():
+                setattr(self, field, score)
+        super().save(*args, **kwargs)
@@ -3,7 +3,8 @@ from datetime import datetime
 import pytz
 from dateutil.relativedelta import relativedelta
 from django.apps import apps as django_apps
-from django.db.models.signals import post_save
+from django.contrib.auth.models import User
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 from django.forms import model_to_dict, ValidationError
 from edc_appointment.constants import COMPLETE_APPT
@@ -29,10 +30,16 @@ from flourish_prn.models.child_death_report import ChildDeathReport
 from pre_flourish.helper_classes import MatchHelper
 from .child_assent import ChildAssent
 from .child_clinician_notes import ClinicianNotesImage
+from .child_dataset import ChildDataset
 from .child_dummy_consent import ChildDummySubjectConsent
 from .child_visit import ChildVisit
+from .subject_identity_graph import SubjectIdentityGraph
 from ..action_items import YOUNG_ADULT_LOCATOR_ACTION
 from ..helper_classes import ChildFollowUpBookingHelper, ChildOnScheduleHelper
+from ..helper_classes.clinic_calendar import clinic_calendar
+from ..helper_classes.cohort_schedule_types import cohort_schedule_types
+from ..helper_classes.cohort_schedule_registry import cohort_schedule_registry
+from ..helper_classes.interviewer_choices import interviewer_choices
 from ..helper_classes.utils import (child_utils, notification, stamp_image,
                                     trigger_action_item)
 from ..models import AcademicPerformance, ChildOffSchedule, ChildSocioDemographic
@@ -182,6 +189,68 @@ def child_consent_on_post_save(sender, instance, raw, created, **kwargs):
                 helper_cls.put_on_schedule(instance, )
 
 
+@receiver(post_save, weak=False, sender='flourish_caregiver.caregiverchildconsent',
+          dispatch_uid='caregiver_child_consent_identity_on_post_save')
+def caregiver_child_consent_identity_on_post_save(sender, instance, raw, created,
+                                                  **kwargs):
+    """Keep the subject identity graph current for the consented child.
+    """
+    if not raw and instance.subject_identifier:
+        SubjectIdentityGraph.objects.update_for_child(
+            subject_identifier=instance.subject_identifier)
+
+
+@receiver(post_save, weak=False, sender=ChildDummySubjectConsent,
+          dispatch_uid='child_dummy_consent_identity_on_post_save')
+def child_dummy_consent_identity_on_post_save(sender, instance, raw, created,
+                                              **kwargs):
+    if not raw:
+        SubjectIdentityGraph.objects.update_for_child(
+            subject_identifier=instance.subject_identifier)
+
+
+@receiver(post_save, weak=False, sender=ChildDataset,
+          dispatch_uid='child_dataset_identity_on_post_save')
+def child_dataset_identity_on_post_save(sender, instance, raw, created, **kwargs):
+    if not raw:
+        SubjectIdentityGraph.objects.update_for_child_dataset(
+            child_dataset=instance)
+
+
+@receiver([post_save, post_delete], weak=False, sender='edc_facility.holiday',
+          dispatch_uid='holiday_clinic_calendar_on_change')
+def holiday_clinic_calendar_on_change(sender, instance, **kwargs):
+    """Reload the cached clinic calendar when a holiday changes. Holidays
+    imported with `bulk_create` send no signals, import them with
+    `clinic_calendar.import_holidays`.
+    """
+    clinic_calendar.refresh()
+
+
+@receiver([post_save, post_delete], weak=False,
+          sender='flourish_caregiver.cohortschedules',
+          dispatch_uid='cohort_schedules_types_on_change')
+def cohort_schedules_types_on_change(sender, instance, **kwargs):
+    """Reload the cached schedule types, and the admin fieldlists built on
+    them, when a cohort schedule changes.
+    """
+    cohort_schedule_types.invalidate()
+
+
+@receiver([post_save, post_delete], weak=False, sender='auth.user',
+          dispatch_uid='user_interviewer_choices_on_change')
+@receiver([post_save, post_delete], weak=False, sender='auth.group',
+          dispatch_uid='group_interviewer_choices_on_change')
+@receiver(m2m_changed, weak=False, sender=User.groups.through,
+          dispatch_uid='user_groups_interviewer_choices_on_change')
+def interviewer_choices_on_change(sender, instance, **kwargs):
+    """Rebuild the cached interviewer choices when a user's names or group
+    membership, or a group, changes. Logins only update `last_login`.
+    """
+    if kwargs.get('update_fields') != frozenset(['last_login']):
+        interviewer_choices.invalidate()
+
+
 @receiver(post_save, weak=False, sender=TbVisitScreeningAdolescent,
           dispatch_uid='adol_tb_visit_presence_on_post_save')
 def child_tb_visit_screening_on_post_save(sender, instance, raw, created, **kwargs):
@@ -245,20 +314,8 @@ def child_visit_on_post_save(sender, instance, raw, created, **kwargs):
     if not raw and created and instance.visit_code in ['2000', '2000D', '3000',
                                                        '3000A', '3000B', '3000C']:
 
-        if 'sec' in instance.schedule_name:
-
-            cohort_list = instance.schedule_name.split('_')
-
-            cohort = '_'.join(['cohort', cohort_list[1], 'sec_qt'])
-        elif 'fu' in instance.schedule_name:
-
-            cohort_list = instance.schedule_name.split('_')
-
-            cohort = '_'.join(['cohort', cohort_list[1], 'fu_qt'])
-        else:
-            cohort_list = instance.schedule_name.split('_')
-
-            cohort = '_'.join(['cohort', cohort_list[1], 'quarterly'])
+        cohort = cohort_schedule_registry.quarterly_cohort(
+            instance.schedule_name)
 
         helper_cls = ChildOnScheduleHelper(
             subject_identifier=instance.subject_identifier,
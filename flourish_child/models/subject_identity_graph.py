@@ -0,0 +1,177 @@
+from django.apps import apps as django_apps
+from django.db import models, transaction
+from django.db.models import Q
+from edc_base.model_mixins import BaseUuidModel
+
+
+class SubjectIdentityGraphManager(models.Manager):
+
+    child_consent_model = 'flourish_caregiver.caregiverchildconsent'
+    child_dataset_model = 'flourish_child.childdataset'
+
+    identifier_fields = ['subject_identifier', 'caregiver_subject_identifier',
+                         'screening_identifier', 'study_maternal_identifier',
+                         'study_child_identifier']
+
+    @property
+    def child_consent_model_cls(self):
+        return django_apps.get_model(self.child_consent_model)
+
+    @property
+    def child_dataset_model_cls(self):
+        return django_apps.get_model(self.child_dataset_model)
+
+    def resolve(self, identifier=None):
+        """Returns the identity rows linked to any of the known identifiers,
+        i.e. child, caregiver, screening or legacy study identifiers.
+        """
+        if not identifier:
+            return self.none()
+        query = Q()
+        for field in self.identifier_fields:
+            query |= Q(**{field: identifier})
+        return self.filter(query)
+
+    def linked_identifiers(self, identifier=None):
+        """Returns a dict of identifier field to the set of linked values
+        for the given identifier.
+        """
+        linked = {field: set() for field in self.identifier_fields}
+        linked.update(child_dataset_id=set())
+        for row in self.resolve(identifier).values(
+                *self.identifier_fields, 'child_dataset_id'):
+            for field, value in row.items():
+                if value:
+                    linked[field].add(value)
+        return linked
+
+    def identity_options(self, consent=None, child_dataset=None):
+        subject_consent = consent.subject_consent
+        options = dict(
+            caregiver_subject_identifier=subject_consent.subject_identifier,
+            screening_identifier=subject_consent.screening_identifier,
+            study_child_identifier=consent.study_child_identifier or None,
+            study_maternal_identifier=None,
+            child_dataset_id=None)
+        if child_dataset:
+            options.update(
+                study_maternal_identifier=child_dataset.study_maternal_identifier,
+                child_dataset_id=child_dataset.id)
+        return options
+
+    def update_for_child(self, subject_identifier=None):
+        """Creates or updates the identity row for a single child from the
+        latest caregiver child consent and the linked child dataset.
+        """
+        consent = self.child_consent_model_cls.objects.filter(
+            subject_identifier=subject_identifier).select_related(
+                'subject_consent').order_by('consent_datetime').last()
+        if not consent:
+            return None
+        child_dataset = None
+        if consent.study_child_identifier:
+            child_dataset = self.child_dataset_model_cls.objects.filter(
+                study_child_identifier=consent.study_child_identifier).only(
+                    'id', 'study_maternal_identifier').first()
+        obj, _ = self.update_or_create(
+            subject_identifier=subject_identifier,
+            defaults=self.identity_options(
+                consent=consent, child_dataset=child_dataset))
+        return obj
+
+    def update_for_child_dataset(self, child_dataset=None):
+        return self.filter(
+            study_child_identifier=child_dataset.study_child_identifier).update(
+                study_maternal_identifier=child_dataset.study_maternal_identifier,
+                child_dataset_id=child_dataset.id)
+
+    def rebuild(self):
+        """Rebuilds the whole identity graph from the consent and dataset
+        tables, returns the number of rows created.
+        """
+        datasets = {
+            study_child_identifier: (pk, study_maternal_identifier) for
+            pk, study_child_identifier, study_maternal_identifier in
+            self.child_dataset_model_cls.objects.values_list(
+                'id', 'study_child_identifier', 'study_maternal_identifier')}
+
+        consents = self.child_consent_model_cls.objects.exclude(
+            Q(subject_identifier__isnull=True) | Q(subject_identifier='')).values_list(
+                'subject_identifier', 'study_child_identifier',
+                'subject_consent__subject_identifier',
+                'subject_consent__screening_identifier').order_by('consent_datetime')
+
+        # Later consents override earlier versions for the same child.
+        latest = {}
+        for (subject_identifier, study_child_identifier,
+             caregiver_subject_identifier, screening_identifier) in consents:
+            latest[subject_identifier] = (
+                study_child_identifier, caregiver_subject_identifier,
+                screening_identifier)
+
+        objs = []
+        for subject_identifier, values in latest.items():
+            study_child_identifier, caregiver_sid, screening_identifier = values
+            child_dataset_id, study_maternal_identifier = datasets.get(
+                study_child_identifier, (None, None))
+            objs.append(self.model(
+                subject_identifier=subject_identifier,
+                caregiver_subject_identifier=caregiver_sid,
+                screening_identifier=screening_identifier,
+                study_child_identifier=study_child_identifier or None,
+                study_maternal_identifier=study_maternal_identifier,
+                child_dataset_id=child_dataset_id))
+
+        with transaction.atomic():
+            self.all().delete()
+            self.bulk_create(objs, batch_size=500)
+        return len(objs)
+
+
+class SubjectIdentityGraph(BaseUuidModel):
+    """ A denormalized, system maintained lookup linking a child to the
+        caregiver, screening and legacy study identifiers. Kept current by
+        the consent and dataset post save signals.
+    """
+
+    subject_identifier = models.CharField(
+        verbose_name='Child subject identifier',
+        max_length=50,
+        unique=True)
+
+    caregiver_subject_identifier = models.CharField(
+        verbose_name='Caregiver subject identifier',
+        max_length=50,
+        null=True,
+        db_index=True)
+
+    screening_identifier = models.CharField(
+        verbose_name='Screening identifier',
+        max_length=50,
+        null=True,
+        db_index=True)
+
+    study_maternal_identifier = models.CharField(
+        verbose_name='Study maternal subject identifier',
+        max_length=50,
+        null=True,
+        db_index=True)
+
+    study_child_identifier = models.CharField(
+        verbose_name='Study child subject identifier',
+        max_length=150,
+        null=True,
+        db_index=True)
+
+    child_dataset_id = models.UUIDField(
+        null=True,
+        blank=True)
+
+    objects = SubjectIdentityGraphManager()
+
+    def __str__(self):
+        return f'{self.subject_identifier} ({self.caregiver_subject_identifier})'
+
+    class Meta:
+        app_label = 'flourish_child'
+        verbose_name = 'Subject Identity Graph'
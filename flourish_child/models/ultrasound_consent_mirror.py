@@ -0,0 +1,88 @@
+from django.db import models
+from edc_base.model_mixins import BaseUuidModel
+
+
+class UltrasoundConsentMirrorManager(models.Manager):
+
+    consent_fields = ['reviewed_v4', 'answered_v4', 'asked_v4', 'verified_v4',
+                      'copy_v4']
+
+    def consent_completed(self, caregiver_subject_identifiers=[]):
+        """Returns a dict of caregiver subject identifier to consent
+        completion for the mirrored caregivers only.
+        """
+        return dict(self.filter(
+            caregiver_subject_identifier__in=caregiver_subject_identifiers).values_list(
+                'caregiver_subject_identifier', 'consent_completed'))
+
+    def update_from_rows(self, rows={}, synced_datetime=None):
+        """Creates or updates the mirror rows from a dict of caregiver
+        subject identifier to exported REDCap row. Returns the number of
+        created and updated rows.
+        """
+        existing = {obj.caregiver_subject_identifier: obj for obj in self.filter(
+            caregiver_subject_identifier__in=list(rows))}
+        created, updated = [], []
+        for subject_identifier, row in rows.items():
+            values = {field: row.get(field) or None for field in self.consent_fields}
+            values.update(consent_completed=all(
+                row.get(field) == '1' for field in self.consent_fields))
+            obj = existing.get(subject_identifier)
+            if obj is None:
+                created.append(self.model(
+                    caregiver_subject_identifier=subject_identifier,
+                    synced_datetime=synced_datetime, **values))
+            elif any(getattr(obj, field) != value for field, value in values.items()):
+                for field, value in values.items():
+                    setattr(obj, field, value)
+                obj.synced_datetime = synced_datetime
+                updated.append(obj)
+        self.bulk_create(created, batch_size=500)
+        self.bulk_update(
+            updated, self.consent_fields + ['consent_completed', 'synced_datetime'],
+            batch_size=500)
+        return len(created), len(updated)
+
+
+class UltrasoundConsentMirror(BaseUuidModel):
+    """Local copy of the caregiver's REDCap ultrasound consent (version 4)
+    fields, kept current by `UltrasoundConsentSync`.
+    """
+
+    caregiver_subject_identifier = models.CharField(
+        max_length=50,
+        unique=True)
+
+    reviewed_v4 = models.CharField(max_length=5, null=True)
+
+    answered_v4 = models.CharField(max_length=5, null=True)
+
+    asked_v4 = models.CharField(max_length=5, null=True)
+
+    verified_v4 = models.CharField(max_length=5, null=True)
+
+    copy_v4 = models.CharField(max_length=5, null=True)
+
+    consent_completed = models.BooleanField(default=False)
+
+    synced_datetime = models.DateTimeField(null=True)
+
+    objects = UltrasoundConsentMirrorManager()
+
+    class Meta:
+        app_label = 'flourish_child'
+        verbose_name = 'Ultrasound Consent Mirror'
+
+
+class RedcapSync(BaseUuidModel):
+    """Watermark of an incremental REDCap export, i.e. the end of the last
+    successfully synced date range.
+    """
+
+    name = models.CharField(max_length=50, unique=True)
+
+    last_synced_datetime = models.DateTimeField(null=True)
+
+    class Meta:
+        app_label = 'flourish_child'
+        verbose_name = 'REDCap Sync'
@@ -139,11 +139,11 @@ childphqdeprscreening = Recipe(
     depressed='2',
     sleep_disorders='1',
     fatigued='1',
-    eating_disorders='0',
+    eating_disorders='1',
     self_doubt='0',
     easily_distracted='1',
     restlessness='1',
-    self_harm='4',
+    self_harm='3',
     self_harm_thoughts=NO,
     suidice_attempt=NO)
 
@@ -0,0 +1,126 @@
+import json
+import os
+import time
+
+from django.db import connection, transaction
+from django.forms.models import model_to_dict
+from django.test.utils import CaptureQueriesContext
+from model_mommy import mommy
+from model_mommy.recipe import Recipe
+
+from .. import forms as child_forms
+from .. import mommy_recipes
+from ..forms.child_form_mixin import ChildModelFormMixin
+
+
+class FormFixtureError(Exception):
+    pass
+
+
+class FormQueryBudget:
+    """ Measures the queries and time of instantiating, validating and
+        saving each `ChildModelFormMixin` CRF form, and checks the query
+        counts against the budgets recorded in `budgets_file`.
+
+    Form data is built from the model's recipe in `mommy_recipes`, or from
+    a plain `mommy.prepare` if it has none; `FormFixtureError` is raised
+    if that fails. Forms without a recorded budget are not checked. Set
+    `FORM_QUERY_BUDGETS_RECORD=1` to write the measured counts and times
+    to `budgets_file` instead.
+    """
+
+    budgets_file = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), 'form_query_budgets.json')
+    phases = ['init', 'is_valid', 'save']
+
+    def __init__(self, child_visit):
+        self.child_visit = child_visit
+        self.results = {}
+        self.errors = {}
+        self.recipes = {
+            recipe._model: f'flourish_child.{name}'
+            for name, recipe in vars(mommy_recipes).items()
+            if isinstance(recipe, Recipe)}
+
+    @property
+    def record(self):
+        return os.environ.get('FORM_QUERY_BUDGETS_RECORD') == '1'
+
+    @property
+    def budgets(self):
+        try:
+            with open(self.budgets_file) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def form_classes(self):
+        """ Returns the forms in `flourish_child.forms` built on
+            `ChildModelFormMixin` for models with a child visit.
+        """
+        form_classes = []
+        for form_cls in vars(child_forms).values():
+            if (isinstance(form_cls, type)
+                    and issubclass(form_cls, ChildModelFormMixin)
+                    and form_cls is not ChildModelFormMixin
+                    and getattr(form_cls._meta, 'model', None)
+                    and 'child_visit' in [
+                        field.name for field in form_cls._meta.model._meta.fields]):
+                form_classes.append(form_cls)
+        return sorted(set(form_classes), key=lambda form_cls: form_cls.__name__)
+
+    def form_data(self, form_cls):
+        model_cls = form_cls._meta.model
+        options = dict(child_visit=self.child_visit,
+                       report_datetime=self.child_visit.report_datetime)
+        recipe = self.recipes.get(model_cls)
+        try:
+            if recipe:
+                obj = mommy.prepare_recipe(recipe, **options)
+            else:
+                obj = mommy.prepare(model_cls, **options)
+        except (AttributeError, LookupError, TypeError, ValueError) as e:
+            raise FormFixtureError(
+                f'Could not build data for {form_cls.__name__}. Got {e}') from e
+        data = model_to_dict(obj, exclude=[
+            field.name for field in model_cls._meta.many_to_many])
+        return {key: '' if value is None else value for key, value in data.items()}
+
+    def measure(self, form_cls):
+        """ Returns the query counts and seconds per phase of the form. The
+            save is rolled back.
+        """
+        result = {}
+        initial = {'child_visit': str(self.child_visit.id),
+                   'subject_identifier': self.child_visit.subject_identifier}
+        with transaction.atomic():
+            data = self.form_data(form_cls)
+            for phase in self.phases:
+                with CaptureQueriesContext(connection) as queries:
+                    start = time.perf_counter()
+                    if phase == 'init':
+                        form = form_cls(data=data, initial=initial)
+                    elif phase == 'is_valid':
+                        valid = form.is_valid()
+                    elif valid:
+                        form.save()
+                    result[f'{phase}_seconds'] = round(time.perf_counter() - start, 4)
+                result[phase] = len(queries)
+            result.update(valid=valid)
+            transaction.set_rollback(True)
+        self.results[form_cls.__name__] = result
+        self.errors[form_cls.__name__] = form.errors.as_data()
+        return result
+
+    def over_budget(self, form_cls):
+        """ Returns a dict of phase to (queries, budget) for the phases of
+            the last measurement that went over the form's budget.
+        """
+        budget = self.budgets[form_cls.__name__]
+        result = self.results[form_cls.__name__]
+        return {phase: (result[phase], budget[phase]) for phase in self.phases
+                if result[phase] > budget[phase]}
+
+    def write_budgets(self):
+        with open(self.budgets_file, 'w') as f:
+            json.dump(self.results, f, indent=4, sort_keys=True)
@@ -0,0 +1,66 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs
+
+
+class RedcapStubServer:
+    """ Local REDCap API stand-in for tests. Serves record exports of
+        `records`, a dict of record id to flat row, all of them if no
+        records are requested, and answers the first `failures` requests
+        with a 503.
+
+    Usage:
+        with RedcapStubServer(records={...}) as server:
+            client = RedcapClient(url=server.url, token='token')
+    """
+
+    record_id_field = 'record_id'
+
+    def __init__(self, records={}, failures=0):
+        self.records = records
+        self.failures = failures
+        self.requests = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length', 0))
+                data = parse_qs(self.rfile.read(length).decode())
+                stub.requests.append(data)
+                if stub.failures:
+                    stub.failures -= 1
+                    self.respond(503, {'error': 'Service unavailable'})
+                    return
+                records = [value[0] for key, value in data.items()
+                           if key.startswith('records[')] or list(stub.records)
+                self.respond(200, [
+                    dict(stub.records[record], **{stub.record_id_field: record})
+                    for record in records if record in stub.records])
+
+            def respond(self, status, body):
+                content = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = HTTPServer(('127.0.0.1', 0), Handler)
+
+    @property
+    def url(self):
+        return 'http://127.0.0.1:{}/api/'.format(self.server.server_port)
+
+    def __enter__(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.server.shutdown()
+        self.server.server_close()
@@ -2,11 +2,12 @@ from dateutil.relativedelta import relativedelta
 from django.apps import apps as django_apps
 from edc_base.utils import get_utcnow
 from edc_constants.constants import NOT_APPLICABLE, YES
-from edc_facility.import_holidays import import_holidays
 from model_mommy import mommy
 
 from flourish_caregiver.models import CaregiverLocator, MaternalDataset
 
+from ..helper_classes.clinic_calendar import import_holidays
+
 
 class SubjectHelperClass:
 
@@ -2,9 +2,9 @@ from dateutil.relativedelta import relativedelta
 from django.test import tag, TestCase
 from edc_base import get_utcnow
 from edc_constants.constants import NEG, YES
-from edc_facility.import_holidays import import_holidays
 from model_mommy import mommy
 
+from flourish_child.helper_classes.clinic_calendar import import_holidays
 from flourish_child.models import ChildDummySubjectConsent, \
     OnScheduleChildCohortABirth, OnScheduleChildCohortAEnrollment
 
@@ -0,0 +1,150 @@
+from unittest import mock
+
+from dateutil.relativedelta import relativedelta
+from django.db.models.deletion import ProtectedError
+from django.test import TestCase, tag
+from edc_appointment.constants import NEW_APPT
+from edc_base import get_utcnow
+from edc_constants.constants import MALE, YES
+from edc_visit_tracking.constants import SCHEDULED
+from model_mommy import mommy
+
+from ..helper_classes.clinic_calendar import import_holidays
+from ..helper_classes.cohort_schedule_registry import cohort_schedule_registry
+from ..models import Appointment
+
+
+@tag('appointment_manager')
+class TestAppointmentManager(TestCase):
+
+    def setUp(self):
+        import_holidays()
+        maternal_dataset_obj = mommy.make_recipe(
+            'flourish_caregiver.maternaldataset',
+            delivdt=get_utcnow() - relativedelta(years=3),
+            mom_enrolldate=get_utcnow(),
+            mom_hivstatus='HIV-infected',
+            study_maternal_identifier='12345',
+            protocol='Tshilo Dikotla')
+
+        child_dataset = mommy.make_recipe(
+            'flourish_child.childdataset',
+            dob=get_utcnow() - relativedelta(years=3),
+            infant_hiv_exposed='Exposed',
+            infant_enrolldate=get_utcnow(),
+            study_maternal_identifier='12345',
+            study_child_identifier='1234',
+            infant_sex=MALE)
+
+        mommy.make_recipe(
+            'flourish_caregiver.screeningpriorbhpparticipants',
+            screening_identifier=maternal_dataset_obj.screening_identifier)
+
+        subject_consent = mommy.make_recipe(
+            'flourish_caregiver.subjectconsent',
+            screening_identifier=maternal_dataset_obj.screening_identifier,
+            breastfeed_intent=YES,
+            biological_caregiver=YES,
+            consent_datetime=get_utcnow(),
+            version='1')
+
+        caregiver_child_consent = mommy.make_recipe(
+            'flourish_caregiver.caregiverchildconsent',
+            subject_consent=subject_consent,
+            study_child_identifier=child_dataset.study_child_identifier,
+            child_dob=maternal_dataset_obj.delivdt.date())
+
+        mommy.make_recipe(
+            'flourish_caregiver.caregiverpreviouslyenrolled',
+            subject_identifier=subject_consent.subject_identifier)
+
+        self.subject_identifier = caregiver_child_consent.subject_identifier
+        enrol_appointment = Appointment.objects.get(
+            subject_identifier=self.subject_identifier, visit_code='2000')
+        self.make_visit(enrol_appointment)
+        # The enrolment visit puts the child on the quarterly schedule.
+        cohort_schedule = cohort_schedule_registry.get(
+            cohort_schedule_registry.quarterly_cohort(
+                enrol_appointment.schedule_name))
+        self.schedule_options = dict(
+            visit_schedule_name=cohort_schedule.visit_schedule.name,
+            schedule_name=cohort_schedule.schedule_name)
+        self.quarterly_appointments = self.schedule_appointments().order_by(
+            'timepoint')
+        self.assertGreater(self.quarterly_appointments.count(), 1)
+
+    def make_visit(self, appointment):
+        return mommy.make_recipe(
+            'flourish_child.childvisit',
+            appointment=appointment,
+            report_datetime=appointment.appt_datetime,
+            reason=SCHEDULED)
+
+    def schedule_appointments(self):
+        return Appointment.objects.filter(
+            subject_identifier=self.subject_identifier, **self.schedule_options)
+
+    def expected_deleted(self, dt, appointments):
+        """ Returns the ids the per appointment deletion would remove, i.e.
+            those on or after `dt` or NEW with a window upper bound on or
+            after `dt`, down to the first with a visit.
+        """
+        visit_attr = Appointment.related_visit_model_attr()
+        expected = []
+        for appointment in sorted(appointments, key=lambda a: -a.timepoint):
+            upper = appointment.timepoint_datetime + appointment.visits.get(
+                appointment.visit_code).rupper
+            if appointment.appt_datetime >= dt or (
+                    appointment.appt_status == NEW_APPT and upper >= dt):
+                if hasattr(appointment, visit_attr):
+                    break
+                expected.append(appointment.id)
+        return expected
+
+    def test_delete_after_date(self):
+        appointments = list(self.schedule_appointments())
+        dt = self.quarterly_appointments[1].appt_datetime
+        expected = self.expected_deleted(dt, appointments)
+        self.assertTrue(expected)
+
+        report = Appointment.objects.delete_for_subject_after_date_report(
+            self.subject_identifier, dt, **self.schedule_options)
+
+        self.assertCountEqual([appt[0] for appt in report['deleted']], expected)
+        self.assertEqual(report['protected'], [])
+        self.assertCountEqual(
+            self.schedule_appointments().values_list('id', flat=True),
+            [appt.id for appt in appointments if appt.id not in expected])
+
+    def test_appointment_with_crf_protected(self):
+        first = self.quarterly_appointments[0]
+        child_visit = self.make_visit(first)
+        mommy.make_recipe(
+            'flourish_child.childfoodsecurityquestionnaire',
+            child_visit=child_visit)
+        dt = first.appt_datetime - relativedelta(days=1)
+        later = [appt.id for appt in self.schedule_appointments()
+                 if appt.timepoint > first.timepoint]
+
+        report = Appointment.objects.delete_for_subject_after_date_report(
+            self.subject_identifier, dt, **self.schedule_options)
+
+        self.assertCountEqual([appt[0] for appt in report['deleted']], later)
+        self.assertEqual([appt[0] for appt in report['protected']], [first.id])
+        self.assertEqual(
+            list(self.schedule_appointments().values_list('id', flat=True)),
+            [first.id])
+
+    def test_protected_error_rolls_back(self):
+        ids = list(self.schedule_appointments().values_list('id', flat=True))
+        dt = self.quarterly_appointments[1].appt_datetime
+
+        with mock.patch('django.db.models.query.QuerySet.delete',
+                        side_effect=ProtectedError('protected', [])):
+            report = Appointment.objects.delete_for_subject_after_date_report(
+                self.subject_identifier, dt, **self.schedule_options)
+
+        self.assertEqual(report['deleted'], [])
+        self.assertTrue(report['protected'])
+        self.assertCountEqual(
+            self.schedule_appointments().values_list('id', flat=True), ids)
@@ -1,13 +1,20 @@
+from datetime import date, datetime
+from unittest import mock
+
 from dateutil.relativedelta import relativedelta
+from django.db import connection
 from django.test import TestCase, tag
+from django.test.utils import CaptureQueriesContext
 from edc_base import get_utcnow
 from edc_constants.constants import MALE, YES, NOT_APPLICABLE, NEG, FEMALE
-from edc_facility.import_holidays import import_holidays
 from model_mommy import mommy
 from unittest.case import skip
 from flourish_calendar.models import ParticipantNote
 
 from ..helper_classes import ChildFollowUpBookingHelper
+from ..helper_classes.child_fu_booking_helper import ChildData
+from ..helper_classes.clinic_calendar import clinic_calendar
+from ..helper_classes.clinic_calendar import import_holidays
 from ..models import (ChildDummySubjectConsent, OnScheduleChildCohortAEnrollment,
                       OnScheduleChildCohortCSec, OnScheduleChildCohortABirth)
 
@@ -109,6 +116,19 @@ class TestFuBooking(TestCase):
             title='Follow Up Schedule',
             date=booking_dt.date()).count(), 1)
 
+    def test_fu_booking_priorities_in_memory(self):
+        subject_identifier = self.caregiver_child_consent.subject_identifier
+        booking_helper = self.booking_helper()
+        booking_helper.preload_child_data([subject_identifier])
+
+        with self.assertNumQueries(0):
+            child_data = booking_helper.get_child_data(subject_identifier)
+            priorities = booking_helper.assign_priority(
+                subject_identifier, [], get_utcnow())
+
+        self.assertEqual(child_data.child_dob, self.caregiver_child_consent.child_dob)
+        self.assertEqual(priorities, {subject_identifier: False})
+
     def test_fu_booking_birth(self):
         screening_preg = mommy.make_recipe(
             'flourish_caregiver.screeningpregwomen',
@@ -320,3 +340,100 @@ class TestFuBooking(TestCase):
         self.assertEqual(ParticipantNote.objects.filter(
             subject_identifier=caregiver_child_consent.subject_identifier,
             date=booked_date).count(), 1)
+
+
+@tag('booking')
+class TestFuBookingCalendar(TestCase):
+    """ Books against existing follow up bookings with one slot a day,
+        starting on Monday 4 March 2024.
+    """
+
+    def setUp(self):
+        import_holidays()
+        clinic_calendar.refresh()
+        self.monday = date(2024, 3, 4)
+        # 4 years 8 months old, in the cohort A priority window.
+        priority_dob = self.monday - relativedelta(years=4, months=8)
+        self.child_data = {
+            'B142-040990001-6-10': ChildData(
+                'B142-040990001-6-10', date(2012, 1, 1), 'cohort_c', False),
+            'B142-040990002-6-10': ChildData(
+                'B142-040990002-6-10', priority_dob, 'cohort_a', False),
+            'B142-040990003-6-10': ChildData(
+                'B142-040990003-6-10', priority_dob, 'cohort_a', False),
+            'B142-040990004-6-10': ChildData(
+                'B142-040990004-6-10', date(2012, 1, 2), 'cohort_c', False), }
+
+    def booking_helper(self):
+        booking_helper = ChildFollowUpBookingHelper()
+        booking_helper.max_possible = 1
+
+        def preload_child_data(subject_identifiers=[]):
+            booking_helper.child_data.update(self.child_data)
+            return booking_helper.child_data
+
+        mock.patch.object(
+            booking_helper, 'preload_child_data',
+            side_effect=preload_child_data).start()
+        self.addCleanup(mock.patch.stopall)
+        return booking_helper
+
+    def book(self, subject_identifier, booking_date):
+        ParticipantNote.objects.create(
+            subject_identifier=subject_identifier,
+            title='Follow Up Schedule',
+            date=booking_date)
+
+    def bookings(self):
+        return list(ParticipantNote.objects.filter(
+            title='Follow Up Schedule').order_by('date').values_list(
+                'date', 'subject_identifier'))
+
+    def test_priority_child_bumps_low_priority_child(self):
+        """ The priority child takes Monday from the low priority child, who
+            is moved past Tuesday's priority child to Wednesday.
+        """
+        tuesday = self.monday + relativedelta(days=1)
+        self.book('B142-040990001-6-10', self.monday)
+        self.book('B142-040990002-6-10', tuesday)
+
+        self.booking_helper().schedule_fu_booking(
+            'B142-040990003-6-10', datetime(2024, 3, 4, 8, 0))
+
+        self.assertEqual(self.bookings(), [
+            (self.monday, 'B142-040990003-6-10'),
+            (tuesday, 'B142-040990002-6-10'),
+            (self.monday + relativedelta(days=2), 'B142-040990001-6-10')])
+
+    def test_low_priority_child_takes_next_free_day(self):
+        for days in range(4):
+            self.book(f'B142-04099000{days % 3 + 1}-6-10',
+                      self.monday + relativedelta(days=days))
+
+        self.booking_helper().schedule_fu_booking(
+            'B142-040990004-6-10', datetime(2024, 3, 4, 8, 0))
+
+        self.assertEqual(
+            self.bookings()[-1],
+            (self.monday + relativedelta(days=4), 'B142-040990004-6-10'))
+
+    def test_queries_do_not_grow_with_days_scanned(self):
+        """ Assert booking past 2 and past 8 full clinic days costs the same
+            number of queries.
+        """
+        clinic_calendar.is_working_day(self.monday)
+        queries = []
+        for full_days in [2, 8]:
+            ParticipantNote.objects.all().delete()
+            booking_date = self.monday
+            for _ in range(full_days):
+                self.book('B142-040990001-6-10', booking_date)
+                booking_date = clinic_calendar.next_working_day(booking_date)
+            with CaptureQueriesContext(connection) as captured:
+                self.booking_helper().schedule_fu_booking(
+                    'B142-040990004-6-10', datetime(2024, 3, 4, 8, 0))
+            self.assertEqual(
+                self.bookings()[-1], (booking_date, 'B142-040990004-6-10'))
+            queries.append(len([query for query in captured.captured_queries
+                                if 'SAVEPOINT' not in query['sql']]))
+        self.assertEqual(queries[0], queries[1])
@@ -4,14 +4,16 @@ from unittest.mock import patch
 from django.test import tag, TestCase
 from edc_base import get_utcnow
 from edc_constants.constants import YES
-from edc_facility.import_holidays import import_holidays
 from model_mommy import mommy
 from requests.exceptions import RequestException
 
 from flourish_caregiver.models.onschedule import OnScheduleCaregiverBrainUltrasound
 from flourish_child.helper_classes.brain_ultrasound_helper import BrainUltrasoundHelper
+from flourish_child.helper_classes.redcap_client import RedcapClient
 from flourish_child.models import ChildDummySubjectConsent
 from flourish_child.models.onschedule import OnScheduleChildBrainUltrasound
+from ..helper_classes.clinic_calendar import import_holidays
+from .redcap_stub_server import RedcapStubServer
 
 
 @tag('buh')
@@ -19,6 +21,8 @@ class TestBrainUltrasoundHelper(TestCase):
 
     def setUp(self):
         import_holidays()
+        BrainUltrasoundHelper.consent_cache.clear()
+        self.consent_row = {field: '1' for field in BrainUltrasoundHelper.consent_fields}
 
         self.options = {
             'consent_datetime': get_utcnow(),
@@ -78,10 +82,9 @@ class TestBrainUltrasoundHelper(TestCase):
         assert mock_apps.get_model.call_count == 2
         assert mock_schedules.get_by_onschedule_model_schedule_name.call_count == 2
 
-    @mock.patch('flourish_child.helper_classes.brain_ultrasound_helper.requests')
-    @mock.patch('flourish_child.helper_classes.brain_ultrasound_helper.settings')
-    def test_is_enrolled_brain_ultrasound_success(self, mock_settings, mock_requests):
-        mock_requests.post.return_value.json.return_value = True
+    @mock.patch.object(BrainUltrasoundHelper.redcap_client, 'export_records')
+    def test_is_enrolled_brain_ultrasound_success(self, mock_export_records):
+        mock_export_records.return_value = [self.consent_row]
         brain_ultrasound_helper = BrainUltrasoundHelper(
             self.child_consent.subject_identifier,
             self.subject_consent.subject_identifier)
@@ -89,7 +92,7 @@ class TestBrainUltrasoundHelper(TestCase):
         self.assertEqual(brain_ultrasound_helper.is_enrolled_brain_ultrasound(), True)
 
     @mock.patch('flourish_child.helper_classes.brain_ultrasound_helper.logger')
-    @patch('requests.post')
+    @patch.object(BrainUltrasoundHelper.redcap_client.session, 'post')
     def test_is_enrolled_brain_ultrasound_failure(self, mock_post, mock_logger):
         mock_post.side_effect = RequestException('Mocked Exception')
 
@@ -101,3 +104,27 @@ class TestBrainUltrasoundHelper(TestCase):
         self.assertFalse(result)
 
         mock_logger.error.assert_called_once_with('Error: Mocked Exception')
+
+    def test_consent_completed_batched_and_cached(self):
+        records = {'B142-040990001-1': self.consent_row,
+                   'B142-040990002-1': dict(self.consent_row, copy_v4='0')}
+        with RedcapStubServer(records=records) as server:
+            client = RedcapClient(url=server.url, token='token')
+            with mock.patch.object(BrainUltrasoundHelper, 'redcap_client', client):
+                completed = BrainUltrasoundHelper.consent_completed(
+                    ['B142-040990001-1', 'B142-040990002-1', 'B142-040990003-1'])
+                BrainUltrasoundHelper.consent_completed(['B142-040990001-1'])
+
+        self.assertEqual(completed, {'B142-040990001-1': True,
+                                     'B142-040990002-1': False,
+                                     'B142-040990003-1': False})
+        self.assertEqual(len(server.requests), 1)
+
+    def test_redcap_client_retries(self):
+        records = {'B142-040990001-1': self.consent_row}
+        with RedcapStubServer(records=records, failures=2) as server:
+            client = RedcapClient(url=server.url, token='token', backoff_factor=0)
+            rows = client.export_records(records=['B142-040990001-1'])
+
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(len(server.requests), 3)
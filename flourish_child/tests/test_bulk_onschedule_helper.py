@@ -0,0 +1,125 @@
+from dateutil.relativedelta import relativedelta
+from django.db import transaction
+from django.test import TestCase, tag
+from edc_base import get_utcnow
+from edc_constants.constants import MALE, YES
+from edc_visit_schedule.models import SubjectScheduleHistory
+from model_mommy import mommy
+
+from ..helper_classes import BulkChildOnScheduleHelper
+from ..helper_classes.clinic_calendar import import_holidays
+from ..helper_classes.cohort_schedule_registry import cohort_schedule_registry
+from ..models import Appointment
+
+
+@tag('bulk_onschedule')
+class TestBulkChildOnScheduleHelper(TestCase):
+
+    cohort = 'cohort_a_quarterly'
+
+    def setUp(self):
+        import_holidays()
+        maternal_dataset_obj = mommy.make_recipe(
+            'flourish_caregiver.maternaldataset',
+            delivdt=get_utcnow() - relativedelta(years=3),
+            mom_enrolldate=get_utcnow(),
+            mom_hivstatus='HIV-infected',
+            study_maternal_identifier='12345',
+            protocol='Tshilo Dikotla')
+
+        child_dataset = mommy.make_recipe(
+            'flourish_child.childdataset',
+            dob=get_utcnow() - relativedelta(years=3),
+            infant_hiv_exposed='Exposed',
+            infant_enrolldate=get_utcnow(),
+            study_maternal_identifier='12345',
+            study_child_identifier='1234',
+            infant_sex=MALE)
+
+        mommy.make_recipe(
+            'flourish_caregiver.screeningpriorbhpparticipants',
+            screening_identifier=maternal_dataset_obj.screening_identifier)
+
+        subject_consent = mommy.make_recipe(
+            'flourish_caregiver.subjectconsent',
+            screening_identifier=maternal_dataset_obj.screening_identifier,
+            breastfeed_intent=YES,
+            biological_caregiver=YES,
+            consent_datetime=get_utcnow(),
+            version='1')
+
+        caregiver_child_consent = mommy.make_recipe(
+            'flourish_caregiver.caregiverchildconsent',
+            subject_consent=subject_consent,
+            study_child_identifier=child_dataset.study_child_identifier,
+            child_dob=maternal_dataset_obj.delivdt.date())
+
+        mommy.make_recipe(
+            'flourish_caregiver.caregiverpreviouslyenrolled',
+            subject_identifier=subject_consent.subject_identifier)
+
+        self.subject_identifier = caregiver_child_consent.subject_identifier
+        # A Saturday, so the appointments are moved to clinic days.
+        base_appt_datetime = get_utcnow().replace(microsecond=0)
+        self.base_appt_datetime = base_appt_datetime + relativedelta(
+            days=(5 - base_appt_datetime.weekday()) % 7)
+        self.cohort_schedule = cohort_schedule_registry.get(self.cohort)
+
+    def snapshot(self):
+        """ Returns the on-schedule, history and appointment rows of the
+            subject on the cohort's schedule.
+        """
+        options = dict(subject_identifier=self.subject_identifier,
+                       schedule_name=self.cohort_schedule.schedule_name)
+        return dict(
+            onschedule=list(
+                self.cohort_schedule.onschedule_model_cls.objects.filter(
+                    **options).values_list(
+                        'onschedule_datetime', 'consent_version', 'site_id')),
+            history=list(SubjectScheduleHistory.objects.filter(
+                **options).values_list(
+                    'visit_schedule_name', 'onschedule_model',
+                    'onschedule_datetime', 'schedule_status')),
+            appointments=list(Appointment.objects.filter(
+                **options).order_by('timepoint').values_list(
+                    'visit_code', 'visit_code_sequence', 'timepoint',
+                    'timepoint_datetime', 'appt_datetime', 'appt_type',
+                    'appt_status', 'facility_name', 'site_id')))
+
+    def put_on_schedule(self):
+        self.cohort_schedule.schedule.put_on_schedule(
+            subject_identifier=self.subject_identifier,
+            onschedule_datetime=self.base_appt_datetime,
+            schedule_name=self.cohort_schedule.schedule_name,
+            base_appt_datetime=self.base_appt_datetime)
+
+    def test_bulk_matches_put_on_schedule(self):
+        with transaction.atomic():
+            self.put_on_schedule()
+            expected = self.snapshot()
+            transaction.set_rollback(True)
+        self.assertTrue(expected['appointments'])
+        self.assertEqual(self.snapshot()['onschedule'], [])
+
+        summary = BulkChildOnScheduleHelper(
+            enrolments=[(self.subject_identifier, self.cohort,
+                         self.base_appt_datetime)]).put_on_schedule()
+
+        self.assertEqual((summary['created'], summary['skipped']), (1, 0))
+        self.assertEqual(self.snapshot(), expected)
+
+    def test_bulk_skips_and_reports(self):
+        self.put_on_schedule()
+        summary = BulkChildOnScheduleHelper(
+            enrolments=[(self.subject_identifier, self.cohort,
+                         self.base_appt_datetime),
+                        ('B142-040990000-0-10', self.cohort,
+                         self.base_appt_datetime)],
+            chunk_size=1).put_on_schedule()
+
+        self.assertEqual(summary['created'], 0)
+        self.assertEqual(summary['skipped'], 1)
+        self.assertEqual(
+            summary['failed'],
+            [('B142-040990000-0-10', 'Missing dummy consent obj.')])
+        self.assertEqual(summary['resume_from'], 2)
@@ -0,0 +1,58 @@
+from django.core.management import call_command
+from django.test import TestCase, tag
+from model_mommy import mommy
+
+from ..models import ChildIdentifierSequence
+
+
+@tag('child_identifier')
+class TestChildIdentifierSequence(TestCase):
+
+    caregiver_subject_identifier = 'B142-040990001-6'
+
+    def register_child(self, suffix):
+        mommy.make_recipe(
+            'flourish_child.registeredsubject',
+            subject_identifier=f'{self.caregiver_subject_identifier}-{suffix}',
+            relative_identifier=self.caregiver_subject_identifier)
+
+    def test_allocate(self):
+        allocate = ChildIdentifierSequence.objects.allocate
+        self.assertEqual(allocate(self.caregiver_subject_identifier), 1)
+        self.assertEqual(allocate(self.caregiver_subject_identifier), 2)
+        self.assertEqual(allocate('B142-040990002-4'), 1)
+
+    def test_allocate_starts_after_registered_children(self):
+        self.register_child('25')
+        self.register_child('35')
+        self.assertEqual(ChildIdentifierSequence.objects.allocate(
+            self.caregiver_subject_identifier), 3)
+
+    def test_allocate_skips_registered_identifiers(self):
+        self.register_child('10')
+        self.register_child('30')
+        value = ChildIdentifierSequence.objects.allocate(
+            self.caregiver_subject_identifier)
+        self.assertEqual(value, 4)
+
+    def test_allocate_after_children_registered_elsewhere(self):
+        allocate = ChildIdentifierSequence.objects.allocate
+        self.assertEqual(allocate(self.caregiver_subject_identifier), 1)
+        self.register_child('20')
+        self.register_child('30')
+        self.assertEqual(allocate(self.caregiver_subject_identifier), 4)
+
+    def test_reconcile(self):
+        ChildIdentifierSequence.objects.allocate(self.caregiver_subject_identifier)
+        self.register_child('10')
+        self.register_child('20')
+        self.assertEqual(
+            ChildIdentifierSequence.objects.reconcile(),
+            [(self.caregiver_subject_identifier, 1, 2)])
+
+        call_command('reconcile_child_identifiers', '--fix')
+        self.assertEqual(ChildIdentifierSequence.objects.reconcile(), [])
+        sequence = ChildIdentifierSequence.objects.get(
+            caregiver_subject_identifier=self.caregiver_subject_identifier)
+        self.assertEqual(sequence.child_identifier(sequence.last_value + 1),
+                         f'{self.caregiver_subject_identifier}-30')
@@ -0,0 +1,219 @@
+from dateutil.relativedelta import relativedelta
+from django.apps import apps as django_apps
+from django.test import TestCase, tag
+from edc_base import get_utcnow
+from edc_constants.constants import MALE, YES
+from edc_visit_tracking.constants import SCHEDULED
+from model_mommy import mommy
+
+from ..admin_site import flourish_child_admin
+from ..choices import INFANT_VACCINATIONS, IMMUNIZATIONS
+from ..helper_classes.clinic_calendar import import_holidays
+from ..models import Appointment, BirthFeedingVaccine, BirthVaccines
+from ..models import ChildImmunizationHistory, VaccinesMissed, VaccinesReceived
+
+
+def baseline_model_data_per_visit(model_admin, subject_identifier=None,
+                                  child_visit=None):
+    """ The per object lookups `get_model_data_per_visit` did before
+        projecting the rows with `values()`.
+    """
+    model_dict = {}
+    for model_name in model_admin.extra_context_models:
+        data_dict = {}
+
+        if model_name == 'birthvaccines':
+
+            try:
+                birth_feeding_obj = BirthFeedingVaccine.objects.filter(
+                    child_visit__subject_identifier=subject_identifier).earliest('report_datetime')
+
+            except BirthFeedingVaccine.DoesNotExist:
+                pass
+            else:
+                model_objs = birth_feeding_obj.birthvaccines_set.all()
+                for model_obj in model_objs:
+                    visit_code = birth_feeding_obj.visit.visit_code
+                    data_dict.setdefault(visit_code, [])
+                    data_dict[visit_code].append(model_obj)
+            model_dict.update({model_name: data_dict})
+
+        else:
+
+            model_cls = django_apps.get_model(f'flourish_child.{model_name}')
+            model_objs = model_cls.objects.filter(
+                child_immunization_history__child_visit__subject_identifier=subject_identifier).exclude(
+                child_immunization_history__child_visit=child_visit)
+            for model_obj in model_objs:
+                visit_code = model_obj.child_immunization_history.visit_code
+                data_dict.setdefault(visit_code, [])
+                data_dict[visit_code].append(model_obj)
+
+            model_dict.update({model_name: data_dict})
+    return model_dict
+
+
+@tag('admin')
+class TestChildImmunizationHistoryAdmin(TestCase):
+
+    def setUp(self):
+        import_holidays()
+        maternal_dataset_obj = mommy.make_recipe(
+            'flourish_caregiver.maternaldataset',
+            delivdt=get_utcnow() - relativedelta(years=3),
+            mom_enrolldate=get_utcnow(),
+            mom_hivstatus='HIV-infected',
+            study_maternal_identifier='12345',
+            protocol='Tshilo Dikotla')
+
+        child_dataset = mommy.make_recipe(
+            'flourish_child.childdataset',
+            dob=get_utcnow() - relativedelta(years=3),
+            infant_hiv_exposed='Exposed',
+            infant_enrolldate=get_utcnow(),
+            study_maternal_identifier='12345',
+            study_child_identifier='1234',
+            infant_sex=MALE)
+
+        mommy.make_recipe(
+            'flourish_caregiver.screeningpriorbhpparticipants',
+            screening_identifier=maternal_dataset_obj.screening_identifier)
+
+        subject_consent = mommy.make_recipe(
+            'flourish_caregiver.subjectconsent',
+            screening_identifier=maternal_dataset_obj.screening_identifier,
+            breastfeed_intent=YES,
+            biological_caregiver=YES,
+            consent_datetime=get_utcnow(),
+            version='1')
+
+        caregiver_child_consent = mommy.make_recipe(
+            'flourish_caregiver.caregiverchildconsent',
+            subject_consent=subject_consent,
+            study_child_identifier=child_dataset.study_child_identifier,
+            child_dob=maternal_dataset_obj.delivdt.date())
+
+        mommy.make_recipe(
+            'flourish_caregiver.caregiverpreviouslyenrolled',
+            subject_identifier=subject_consent.subject_identifier)
+
+        self.subject_identifier = caregiver_child_consent.subject_identifier
+        self.model_admin = flourish_child_admin._registry[ChildImmunizationHistory]
+
+        enrol_appointment = Appointment.objects.get(
+            subject_identifier=self.subject_identifier,
+            visit_code='2000')
+        appointments = Appointment.objects.filter(
+            subject_identifier=self.subject_identifier,
+            schedule_name=enrol_appointment.schedule_name,
+            visit_code_sequence=0).order_by('timepoint')[:3]
+        self.child_visits = [
+            mommy.make_recipe(
+                'flourish_child.childvisit',
+                appointment=appointment,
+                report_datetime=appointment.appt_datetime,
+                reason=SCHEDULED) for appointment in appointments]
+
+    def add_immunization_history(self, child_visit, received=0, missed=0):
+        immunization_history = mommy.make(
+            ChildImmunizationHistory,
+            child_visit=child_visit,
+            report_datetime=child_visit.report_datetime)
+        for index in range(received):
+            mommy.make(
+                VaccinesReceived,
+                child_immunization_history=immunization_history,
+                received_vaccine_name=IMMUNIZATIONS[index][0],
+                first_dose_dt=child_visit.report_datetime.date(),
+                second_dose_dt=None)
+        for index in range(missed):
+            mommy.make(
+                VaccinesMissed,
+                child_immunization_history=immunization_history,
+                missed_vaccine_name=IMMUNIZATIONS[index][0])
+        return immunization_history
+
+    def add_birth_vaccines(self, child_visit, count=2):
+        birth_feeding_vaccine = mommy.make(
+            BirthFeedingVaccine,
+            child_visit=child_visit,
+            report_datetime=child_visit.report_datetime)
+        for index in range(count):
+            mommy.make(
+                BirthVaccines,
+                birth_feed_vaccine=birth_feeding_vaccine,
+                vaccination=INFANT_VACCINATIONS[index][0],
+                vaccine_date=child_visit.report_datetime.date())
+
+    def as_rows(self, model_dict):
+        """ Returns the data per visit with each object projected on the
+            keys of the `values()` rows, ordered for comparison.
+        """
+        rows_dict = {}
+        for model_name, data_dict in model_dict.items():
+            model_cls = django_apps.get_model(f'flourish_child.{model_name}')
+            if model_name == 'birthvaccines':
+                field_names = ['vaccination', 'vaccine_date']
+            else:
+                field_names = [field.name for field in model_cls._meta.concrete_fields]
+            rows_dict[model_name] = {}
+            for visit_code, objs in data_dict.items():
+                rows = []
+                for obj in objs:
+                    if isinstance(obj, dict):
+                        row = obj
+                    else:
+                        row = {
+                            field_name: model_cls._meta.get_field(
+                                field_name).value_from_object(obj)
+                            for field_name in field_names}
+                        row.update(visit_code=visit_code)
+                    rows.append(sorted((key, str(value)) for key, value in row.items()))
+                rows_dict[model_name][visit_code] = sorted(rows)
+        return rows_dict
+
+    def assertMatchesBaseline(self, child_visit):
+        model_dict = self.model_admin.get_model_data_per_visit(
+            subject_identifier=self.subject_identifier, child_visit=child_visit)
+        self.assertEqual(
+            self.as_rows(model_dict),
+            self.as_rows(baseline_model_data_per_visit(
+                self.model_admin, subject_identifier=self.subject_identifier,
+                child_visit=child_visit)))
+        return model_dict
+
+    def test_no_previous_data(self):
+        model_dict = self.assertMatchesBaseline(self.child_visits[0])
+        self.assertEqual(
+            model_dict, {'vaccinesreceived': {}, 'vaccinesmissed': {}, 'birthvaccines': {}})
+
+    def test_vaccines_and_doses_per_visit(self):
+        first_visit, empty_visit, current_visit = self.child_visits
+        self.add_birth_vaccines(first_visit)
+        self.add_immunization_history(first_visit, received=2, missed=1)
+        self.add_immunization_history(empty_visit)
+        self.add_immunization_history(current_visit, received=1, missed=1)
+
+        model_dict = self.assertMatchesBaseline(current_visit)
+        for model_name in ['vaccinesreceived', 'vaccinesmissed', 'birthvaccines']:
+            with self.subTest(model_name=model_name):
+                self.assertEqual(
+                    list(model_dict[model_name]), [first_visit.visit_code])
+        self.assertEqual(
+            len(model_dict['vaccinesreceived'][first_visit.visit_code]), 2)
+        self.assertEqual(
+            [row['first_dose_dt'] for row in
+             model_dict['vaccinesreceived'][first_visit.visit_code]],
+            [first_visit.report_datetime.date()] * 2)
+
+    def test_previous_visits_from_empty_visit(self):
+        first_visit, empty_visit, current_visit = self.child_visits
+        self.add_immunization_history(first_visit, received=1)
+        self.add_immunization_history(empty_visit)
+        self.add_immunization_history(current_visit, received=2, missed=2)
+
+        model_dict = self.assertMatchesBaseline(empty_visit)
+        self.assertEqual(
+            sorted(model_dict['vaccinesreceived']),
+            sorted([first_visit.visit_code, current_visit.visit_code]))
+        self.assertNotIn(empty_visit.visit_code, model_dict['vaccinesreceived'])
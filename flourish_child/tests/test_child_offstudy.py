@@ -2,13 +2,13 @@ from dateutil.relativedelta import relativedelta
 from django.test import TestCase, tag
 from edc_base import get_utcnow
 from edc_constants.constants import MALE, YES, INCOMPLETE
-from edc_facility.import_holidays import import_holidays
 from model_mommy import mommy
 from flourish_calendar.models import ParticipantNote
 from flourish_caregiver.models import ScreeningPriorBhpParticipants
 
 from ..helper_classes import ChildFollowUpBookingHelper
 from ..helper_classes.child_fu_onschedule_helper import ChildFollowUpEnrolmentHelper
+from ..helper_classes.clinic_calendar import import_holidays
 from ..models import OnScheduleChildCohortAEnrollment, OnScheduleChildCohortAFU, Appointment
 from edc_visit_tracking.constants import SCHEDULED
 
@@ -2,9 +2,9 @@ from dateutil.relativedelta import relativedelta
 from django.test import TestCase, tag
 from edc_base import get_utcnow
 from edc_constants.constants import NOT_APPLICABLE
-from edc_facility.import_holidays import import_holidays
 from model_mommy import mommy
 
+from ..helper_classes.clinic_calendar import import_holidays
 from ..models import ChildDummySubjectConsent
 
 
@@ -3,12 +3,12 @@ from django.test import tag, TestCase
 from django.utils.datetime_safe import datetime
 from edc_base.utils import get_utcnow
 from edc_constants.constants import NEG, NO, POS, YES
-from edc_facility.import_holidays import import_holidays
 from edc_metadata.constants import NOT_REQUIRED, REQUIRED
 from edc_metadata.models import CrfMetadata, RequisitionMetadata
 from edc_visit_tracking.constants import SCHEDULED
 from model_mommy import mommy
 
+from ..helper_classes.clinic_calendar import import_holidays
 from ..models import Appointment, ChildDummySubjectConsent, \
     OnScheduleChildCohortAQuarterly
 
@@ -0,0 +1,73 @@
+from datetime import date
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, tag
+from edc_facility.models import Holiday
+
+from ..helper_classes.clinic_calendar import ClinicCalendar, import_holidays
+
+
+@tag('calendar')
+class TestClinicCalendar(TestCase):
+
+    def setUp(self):
+        import_holidays()
+        self.calendar = ClinicCalendar()
+
+    def test_working_day(self):
+        self.assertTrue(self.calendar.is_working_day(date(2021, 4, 1)))
+        # Good Friday
+        self.assertFalse(self.calendar.is_working_day(date(2021, 4, 2)))
+        # Saturday
+        self.assertFalse(self.calendar.is_working_day(date(2021, 4, 10)))
+
+    def test_next_working_day(self):
+        self.assertEqual(
+            self.calendar.next_working_day(date(2021, 4, 1)), date(2021, 4, 6))
+        self.assertEqual(
+            self.calendar.next_working_day(date(2021, 4, 1), 0), date(2021, 4, 1))
+        self.assertEqual(
+            self.calendar.next_working_day(date(2021, 4, 2), 0), date(2021, 4, 6))
+        self.assertEqual(
+            self.calendar.next_working_day(date(2021, 3, 29), 7), date(2021, 4, 9))
+
+    def test_working_days_between(self):
+        self.assertEqual(self.calendar.working_days_between(
+            date(2021, 3, 29), date(2021, 4, 12)), 8)
+        self.assertEqual(self.calendar.working_days_between(
+            date(2021, 4, 12), date(2021, 3, 29)), 0)
+
+    def test_loaded_once(self):
+        self.calendar.is_working_day(date(2021, 4, 1))
+        with self.assertNumQueries(0):
+            self.calendar.next_working_day(date(2021, 4, 1), 20)
+            for day in range(1, 31):
+                self.calendar.is_working_day(date(2021, 4, day))
+        snapshot = self.calendar.snapshot()
+        with self.assertNumQueries(0):
+            snapshot.next_working_day(date(2021, 4, 1), 20)
+            snapshot.working_days_between(date(2021, 1, 1), date(2022, 1, 1))
+            for day in range(1, 31):
+                snapshot.is_working_day(date(2021, 4, day))
+
+    def test_holidays_imported_after_lookup(self):
+        Holiday.objects.all().delete()
+        # Good Friday
+        self.assertTrue(self.calendar.is_working_day(date(2021, 4, 2)))
+        call_command('import_clinic_holidays')
+        self.assertFalse(self.calendar.is_working_day(date(2021, 4, 2)))
+
+    def test_refresh_seen_by_other_workers(self):
+        """ Assert a refresh in another process, i.e. a new token in the
+            shared cache, reloads the calendar after the check interval.
+        """
+        self.calendar.shared_version.check_interval = 0
+        self.calendar.is_working_day(date(2021, 4, 1))
+        with mock.patch.object(ClinicCalendar, 'load', wraps=self.calendar.load) as load:
+            self.calendar.is_working_day(date(2021, 4, 1))
+            self.assertEqual(load.call_count, 0)
+            cache.set(self.calendar.shared_version.key, 'other-worker', timeout=None)
+            self.calendar.is_working_day(date(2021, 4, 1))
+            self.assertEqual(load.call_count, 1)
@@ -0,0 +1,64 @@
+from django.test import TestCase, tag
+
+from ..helper_classes.cohort_schedule_registry import (
+    cohort_schedule_registry, CohortScheduleError)
+
+
+@tag('registry')
+class TestCohortScheduleRegistry(TestCase):
+
+    def test_all_cohorts_registered(self):
+        cohort_schedule_registry.populate()
+        for cohort in cohort_schedule_registry.cohort_keys:
+            cohort_schedule = cohort_schedule_registry.get(cohort)
+            self.assertEqual(
+                cohort_schedule.onschedule_model_cls._meta.label_lower,
+                cohort_schedule.onschedule_model)
+            self.assertEqual(cohort_schedule.schedule.name,
+                             cohort_schedule.schedule_name)
+
+    def test_cohort_schedule_names(self):
+        expected = {
+            'cohort_a_enrol': ('flourish_child.onschedulechildcohortaenrollment',
+                               'child_a_enrol_schedule1'),
+            'cohort_b_quarterly': ('flourish_child.onschedulechildcohortbquarterly',
+                                   'child_b_quart_schedule1'),
+            'cohort_c_sec_qt': ('flourish_child.onschedulechildcohortcsecquart',
+                                'child_c_sec_qt_schedule1'),
+            'child_cohort_a_birth': ('flourish_child.onschedulechildcohortabirth',
+                                     'child_a_birth_schedule1'),
+            'cohort_a_birth': ('flourish_child.onschedulechildcohortabirth',
+                               'child_a_birth_schedule1'),
+            'tb_adol': ('flourish_child.onschedulechildtbadolschedule',
+                        'tb_adol_schedule'), }
+        for cohort, names in expected.items():
+            cohort_schedule = cohort_schedule_registry.get(cohort)
+            self.assertEqual(
+                (cohort_schedule.onschedule_model, cohort_schedule.schedule_name),
+                names)
+
+    def test_caller_cohorts_registered(self):
+        """ Assert the keys built by put_cohort_onschedule and the consent
+            post save signal resolve without a lookup at call time.
+        """
+        cohort_schedule_registry.populate()
+        for cohort in ['cohort_pool', 'cohort_a_birth', 'cohort_a_sec']:
+            self.assertIn(cohort, cohort_schedule_registry.registry)
+        self.assertEqual(
+            cohort_schedule_registry.get('cohort_pool').schedule_name,
+            'child_pool_schedule1')
+
+    def test_quarterly_cohort(self):
+        self.assertEqual(
+            cohort_schedule_registry.quarterly_cohort('child_a_enrol_schedule1'),
+            'cohort_a_quarterly')
+        self.assertEqual(
+            cohort_schedule_registry.quarterly_cohort('child_c_sec_schedule1'),
+            'cohort_c_sec_qt')
+        self.assertEqual(
+            cohort_schedule_registry.quarterly_cohort('child_b_fu_schedule1'),
+            'cohort_b_fu_qt')
+
+    def test_unknown_cohort(self):
+        self.assertRaises(
+            CohortScheduleError, cohort_schedule_registry.get, 'cohort_d_enrol')
@@ -0,0 +1,63 @@
+from django.apps import apps as django_apps
+from django.core.cache import cache
+from django.db.models import Q
+from django.test import TestCase, tag
+
+from ..helper_classes.cohort_schedule_types import cohort_schedule_types
+
+
+@tag('cohort_schedules')
+class TestCohortScheduleTypes(TestCase):
+
+    def setUp(self):
+        cohort_schedule_types.invalidate()
+        self.cohort_schedules = django_apps.get_model(
+            'flourish_caregiver.cohortschedules').objects.filter(
+                onschedule_model__startswith='flourish_child')
+
+    def schedule_names(self, *args, **kwargs):
+        return set(self.cohort_schedules.filter(*args, **kwargs).values_list(
+            'schedule_name', flat=True))
+
+    def test_matches_queries(self):
+        self.assertEqual(
+            set(cohort_schedule_types.quarterly),
+            self.schedule_names(schedule_type__icontains='quarterly'))
+        self.assertEqual(
+            set(cohort_schedule_types.quarterly_and_fu),
+            self.schedule_names(Q(schedule_type__icontains='quarterly')
+                                | Q(schedule_name__icontains='_fu_')))
+        self.assertEqual(
+            set(cohort_schedule_types.followup),
+            self.schedule_names(schedule_type__icontains='followup')
+            - self.schedule_names(schedule_type__icontains='quarterly'))
+
+    def test_loaded_once(self):
+        cohort_schedule_types.quarterly
+        with self.assertNumQueries(0):
+            cohort_schedule_types.quarterly_and_fu
+            cohort_schedule_types.followup
+
+    def test_invalidate(self):
+        cohort_schedule_types.quarterly
+        version = cohort_schedule_types.version
+        cohort_schedule_types.invalidate()
+        self.assertNotEqual(cohort_schedule_types.version, version)
+        with self.assertNumQueries(1):
+            cohort_schedule_types.quarterly
+
+    def test_invalidated_by_other_worker(self):
+        """ Assert a new token in the shared cache, i.e. an invalidation in
+            another process, reloads the schedules after the check interval.
+        """
+        cohort_schedule_types.quarterly
+        check_interval = cohort_schedule_types.shared_version.check_interval
+        cohort_schedule_types.shared_version.check_interval = 0
+        self.addCleanup(
+            setattr, cohort_schedule_types.shared_version, 'check_interval', check_interval)
+        with self.assertNumQueries(0):
+            cohort_schedule_types.quarterly
+        cache.set(cohort_schedule_types.shared_version.key, 'other-worker', timeout=None)
+        self.assertEqual(cohort_schedule_types.version, 'other-worker')
+        with self.assertNumQueries(1):
+            cohort_schedule_types.quarterly
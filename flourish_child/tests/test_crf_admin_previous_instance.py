@@ -0,0 +1,158 @@
+from decimal import Decimal
+
+from dateutil.relativedelta import relativedelta
+from django.core.exceptions import ObjectDoesNotExist
+from django.test import RequestFactory, TestCase, tag
+from edc_base import get_utcnow
+from edc_constants.constants import MALE, YES
+from edc_visit_tracking.constants import SCHEDULED
+from model_mommy import mommy
+
+from ..admin_site import flourish_child_admin
+from ..helper_classes.clinic_calendar import import_holidays
+from ..helper_classes.cohort_schedule_registry import cohort_schedule_registry
+from ..helper_classes.utils import child_utils
+from ..models import Appointment, ChildFoodSecurityQuestionnaire
+
+
+def baseline_previous_instance(model_cls, appointment):
+    """ The walk back through appointments `get_previous_instance` did
+        before the single query lookup.
+    """
+    obj = None
+    while appointment:
+        options = {
+            '{}__appointment'.format(model_cls.visit_model_attr()):
+            child_utils.get_previous_appt_instance(appointment)}
+        try:
+            obj = model_cls.objects.get(**options)
+        except ObjectDoesNotExist:
+            pass
+        else:
+            break
+        appointment = child_utils.get_previous_appt_instance(appointment)
+    return obj
+
+
+@tag('admin')
+class TestCrfAdminPreviousInstance(TestCase):
+
+    def setUp(self):
+        import_holidays()
+        maternal_dataset_obj = mommy.make_recipe(
+            'flourish_caregiver.maternaldataset',
+            delivdt=get_utcnow() - relativedelta(years=3),
+            mom_enrolldate=get_utcnow(),
+            mom_hivstatus='HIV-infected',
+            study_maternal_identifier='12345',
+            protocol='Tshilo Dikotla')
+
+        child_dataset = mommy.make_recipe(
+            'flourish_child.childdataset',
+            dob=get_utcnow() - relativedelta(years=3),
+            infant_hiv_exposed='Exposed',
+            infant_enrolldate=get_utcnow(),
+            study_maternal_identifier='12345',
+            study_child_identifier='1234',
+            infant_sex=MALE)
+
+        mommy.make_recipe(
+            'flourish_caregiver.screeningpriorbhpparticipants',
+            screening_identifier=maternal_dataset_obj.screening_identifier)
+
+        subject_consent = mommy.make_recipe(
+            'flourish_caregiver.subjectconsent',
+            screening_identifier=maternal_dataset_obj.screening_identifier,
+            breastfeed_intent=YES,
+            biological_caregiver=YES,
+            consent_datetime=get_utcnow(),
+            version='1')
+
+        caregiver_child_consent = mommy.make_recipe(
+            'flourish_caregiver.caregiverchildconsent',
+            subject_consent=subject_consent,
+            study_child_identifier=child_dataset.study_child_identifier,
+            child_dob=maternal_dataset_obj.delivdt.date())
+
+        mommy.make_recipe(
+            'flourish_caregiver.caregiverpreviouslyenrolled',
+            subject_identifier=subject_consent.subject_identifier)
+
+        self.subject_identifier = caregiver_child_consent.subject_identifier
+        self.model_admin = flourish_child_admin._registry[ChildFoodSecurityQuestionnaire]
+
+    def appointment(self, visit_code):
+        return Appointment.objects.get(
+            subject_identifier=self.subject_identifier,
+            visit_code=visit_code,
+            visit_code_sequence=0)
+
+    def request(self, appointment):
+        return RequestFactory().get('/', {'appointment': str(appointment.pk)})
+
+    def add_crf(self, appointment):
+        child_visit = mommy.make_recipe(
+            'flourish_child.childvisit',
+            appointment=appointment,
+            report_datetime=appointment.appt_datetime,
+            reason=SCHEDULED)
+        return mommy.make_recipe(
+            'flourish_child.childfoodsecurityquestionnaire',
+            child_visit=child_visit)
+
+    def test_previous_in_schedule(self):
+        crf = self.add_crf(self.appointment('2000'))
+        appointment = self.appointment('2001')
+        previous = self.model_admin.get_previous_instance(self.request(appointment))
+        self.assertEqual(previous, crf)
+        self.assertEqual(
+            previous, baseline_previous_instance(
+                ChildFoodSecurityQuestionnaire, appointment))
+
+    def test_no_previous_instance(self):
+        appointment = self.appointment('2001')
+        self.assertIsNone(
+            self.model_admin.get_previous_instance(self.request(appointment)))
+        self.assertIsNone(baseline_previous_instance(
+            ChildFoodSecurityQuestionnaire, appointment))
+
+    def test_cache_hit(self):
+        self.add_crf(self.appointment('2000'))
+        appointment = self.appointment('2001')
+        request = self.request(appointment)
+        previous = self.model_admin.get_previous_instance(request)
+        self.assertIsNotNone(previous)
+        with self.assertNumQueries(0):
+            instance = self.model_admin.get_instance(request)
+            cached = self.model_admin.get_previous_instance(request)
+            self.model_admin.get_key(request)
+        self.assertEqual(instance, appointment)
+        self.assertEqual(cached, previous)
+
+    def test_previous_by_timepoint_fallback(self):
+        """ Assert the previous instance is found by timepoint in another
+            schedule when no appointment on the subject's schedules is
+            dated before this one.
+        """
+        enrol_appointment = self.appointment('2000')
+        tb_schedule = cohort_schedule_registry.get('tb_adol').schedule
+        appointment = mommy.make(
+            Appointment,
+            subject_identifier=self.subject_identifier,
+            visit_schedule_name=enrol_appointment.visit_schedule_name,
+            schedule_name=tb_schedule.name,
+            visit_code=tb_schedule.visits.first.code,
+            visit_code_sequence=0,
+            timepoint=enrol_appointment.timepoint + Decimal('0.5'),
+            timepoint_datetime=enrol_appointment.appt_datetime - relativedelta(days=1),
+            appt_datetime=enrol_appointment.appt_datetime - relativedelta(days=1),
+            facility_name=enrol_appointment.facility_name)
+        previous_appointment = appointment.previous_by_timepoint
+        self.assertNotEqual(previous_appointment.schedule_name, appointment.schedule_name)
+        crf = self.add_crf(previous_appointment)
+
+        previous = self.model_admin.get_previous_instance(self.request(appointment))
+        self.assertEqual(previous, crf)
+        self.assertEqual(
+            previous, baseline_previous_instance(
+                ChildFoodSecurityQuestionnaire, appointment))
@@ -0,0 +1,146 @@
+from unittest import mock
+
+from dateutil.relativedelta import relativedelta
+from django.contrib.auth.models import User
+from django.contrib.sites.models import Site
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, tag
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
+from edc_base import get_utcnow
+from edc_constants.constants import MALE, YES
+from edc_visit_tracking.constants import SCHEDULED
+from model_mommy import mommy
+
+from ..admin_site import flourish_child_admin
+from ..helper_classes.clinic_calendar import import_holidays
+from ..models import Appointment, ChildFoodSecurityQuestionnaire
+
+
+@tag('admin')
+class TestCrfChangelistQueries(TestCase):
+
+    def setUp(self):
+        import_holidays()
+        maternal_dataset_obj = mommy.make_recipe(
+            'flourish_caregiver.maternaldataset',
+            delivdt=get_utcnow() - relativedelta(years=3),
+            mom_enrolldate=get_utcnow(),
+            mom_hivstatus='HIV-infected',
+            study_maternal_identifier='12345',
+            protocol='Tshilo Dikotla')
+
+        child_dataset = mommy.make_recipe(
+            'flourish_child.childdataset',
+            dob=get_utcnow() - relativedelta(years=3),
+            infant_hiv_exposed='Exposed',
+            infant_enrolldate=get_utcnow(),
+            study_maternal_identifier='12345',
+            study_child_identifier='1234',
+            infant_sex=MALE)
+
+        mommy.make_recipe(
+            'flourish_caregiver.screeningpriorbhpparticipants',
+            screening_identifier=maternal_dataset_obj.screening_identifier)
+
+        subject_consent = mommy.make_recipe(
+            'flourish_caregiver.subjectconsent',
+            screening_identifier=maternal_dataset_obj.screening_identifier,
+            breastfeed_intent=YES,
+            biological_caregiver=YES,
+            consent_datetime=get_utcnow(),
+            version='1')
+
+        self.caregiver_child_consent = mommy.make_recipe(
+            'flourish_caregiver.caregiverchildconsent',
+            subject_consent=subject_consent,
+            study_child_identifier=child_dataset.study_child_identifier,
+            child_dob=maternal_dataset_obj.delivdt.date())
+
+        mommy.make_recipe(
+            'flourish_caregiver.caregiverpreviouslyenrolled',
+            subject_identifier=subject_consent.subject_identifier)
+
+        self.model_admin = flourish_child_admin._registry[ChildFoodSecurityQuestionnaire]
+        self.request = RequestFactory().get('/')
+        self.request.user = User.objects.create_superuser(
+            'admin', 'admin@example.com', 'password')
+        self.request.site = Site.objects.get_current()
+
+    def add_crf(self, visit_code):
+        child_visit = mommy.make_recipe(
+            'flourish_child.childvisit',
+            appointment=Appointment.objects.get(
+                visit_code=visit_code,
+                subject_identifier=self.caregiver_child_consent.subject_identifier),
+            report_datetime=get_utcnow(),
+            reason=SCHEDULED)
+        mommy.make_recipe(
+            'flourish_child.childfoodsecurityquestionnaire',
+            child_visit=child_visit)
+
+    def changelist_queries(self):
+        changelist = self.model_admin.get_changelist_instance(self.request)
+        with CaptureQueriesContext(connection) as queries:
+            for obj in changelist.result_list:
+                str(obj.child_visit)
+                obj.how_often
+                self.model_admin.view_on_site(obj)
+        return len(queries), len(changelist.result_list)
+
+    def test_fixed_query_budget(self):
+        self.add_crf('2000')
+        queries, rows = self.changelist_queries()
+        self.assertEqual((queries, rows), (1, 1))
+
+        self.add_crf('2001')
+        queries, rows = self.changelist_queries()
+        self.assertEqual((queries, rows), (1, 2))
+
+    def test_search_by_subject_identifier_prefix(self):
+        self.add_crf('2000')
+        self.add_crf('2001')
+        subject_identifier = self.caregiver_child_consent.subject_identifier
+        queryset = ChildFoodSecurityQuestionnaire.objects.all()
+
+        results, use_distinct = self.model_admin.get_search_results(
+            self.request, queryset, subject_identifier[:8])
+        self.assertEqual(results.count(), 2)
+        self.assertFalse(use_distinct)
+
+        results, _ = self.model_admin.get_search_results(
+            self.request, queryset, f'{subject_identifier} 2001')
+        self.assertEqual(
+            list(results.values_list('child_visit__visit_code', flat=True)),
+            ['2001'])
+
+    def test_search_falls_back_to_search_fields(self):
+        self.add_crf('2000')
+        obj = ChildFoodSecurityQuestionnaire.objects.get()
+        results, _ = self.model_admin.get_search_results(
+            self.request, ChildFoodSecurityQuestionnaire.objects.all(),
+            obj.how_often)
+        self.assertIn(obj, results)
+
+    def test_export_from_changelist_has_all_columns(self):
+        self.add_crf('2000')
+        obj = ChildFoodSecurityQuestionnaire.objects.get()
+        changelist = self.model_admin.get_changelist_instance(self.request)
+        self.assertTrue(changelist.result_list[0].get_deferred_fields())
+
+        request = RequestFactory().post('/', {
+            'action': 'export_as_csv',
+            '_selected_action': [str(obj.pk)],
+            'index': 0})
+        request.user = self.request.user
+        request.site = self.request.site
+        request._dont_enforce_csrf_checks = True
+        with mock.patch.object(
+                type(self.model_admin), 'write_to_csv',
+                return_value=HttpResponse()) as write_to_csv:
+            self.model_admin.changelist_view(request)
+        records = write_to_csv.call_args[0][0]
+        self.assertEqual(len(records), 1)
+        for field_name in ['answerer', 'how_often', 'did_food_last',
+                           'balanced_meals', 'cut_meals', 'eat_less', 'didnt_eat']:
+            self.assertEqual(records[0].get(field_name), getattr(obj, field_name))
@@ -0,0 +1,92 @@
+from django.contrib import admin
+from django.contrib.auth.models import User
+from django.test import RequestFactory, TestCase, tag
+from edc_base import get_utcnow
+from model_mommy import mommy
+
+from ..admin.keyset_changelist import EstimatedCountPaginator, FastChangeListMixin
+from ..admin_site import flourish_child_admin
+from ..models import ChildDataset
+
+
+class CappedPaginator(EstimatedCountPaginator):
+    count_cap = 3
+
+
+class KeysetChildDatasetAdmin(FastChangeListMixin, admin.ModelAdmin):
+    fast_changelist = True
+    list_per_page = 2
+
+
+@tag('admin')
+class TestEstimatedCountPaginator(TestCase):
+
+    def setUp(self):
+        for index in range(5):
+            mommy.make_recipe(
+                'flourish_child.childdataset',
+                study_child_identifier=f'B142-{index}')
+
+    def test_count_below_cap(self):
+        paginator = EstimatedCountPaginator(ChildDataset.objects.all(), 2)
+        self.assertEqual(paginator.count, 5)
+        self.assertEqual(paginator.num_pages, 3)
+
+    def test_count_capped(self):
+        paginator = CappedPaginator(
+            ChildDataset.objects.filter(study_child_identifier__startswith='B142'), 2)
+        self.assertEqual(paginator.count, 3)
+        self.assertEqual(len(paginator.page(2).object_list), 1)
+
+
+@tag('admin')
+class TestKeysetChangeList(TestCase):
+
+    def setUp(self):
+        for index in range(7):
+            mommy.make_recipe(
+                'flourish_child.childdataset',
+                study_child_identifier=f'B142-{index}')
+        # Ties on modified, broken by id.
+        ChildDataset.objects.exclude(
+            study_child_identifier='B142-6').update(modified=get_utcnow())
+        self.model_admin = KeysetChildDatasetAdmin(ChildDataset, flourish_child_admin)
+        self.user = User.objects.create_superuser(
+            'admin', 'admin@example.com', 'password')
+        self.expected = list(ChildDataset.objects.order_by(
+            '-modified', '-id').values_list('pk', flat=True))
+
+    def changelist(self, url='?'):
+        request = RequestFactory().get('/' + url)
+        request.user = self.user
+        return self.model_admin.get_changelist_instance(request)
+
+    def test_next_pages(self):
+        pages, url = [], '?'
+        while url:
+            changelist = self.changelist(url)
+            pages.append([obj.pk for obj in changelist.result_list])
+            url = changelist.next_cursor_url
+        self.assertEqual([len(page) for page in pages], [2, 2, 2, 1])
+        self.assertEqual(sum(pages, []), self.expected)
+
+    def test_previous_pages(self):
+        url = '?'
+        while url:
+            changelist = self.changelist(url)
+            url = changelist.next_cursor_url
+        pages = [[obj.pk for obj in changelist.result_list]]
+        url = changelist.previous_cursor_url
+        while url:
+            changelist = self.changelist(url)
+            pages.insert(0, [obj.pk for obj in changelist.result_list])
+            url = changelist.previous_cursor_url
+        self.assertEqual([len(page) for page in pages], [2, 2, 2, 1])
+        self.assertEqual(sum(pages, []), self.expected)
+
+    def test_previous_from_second_page_is_first_page(self):
+        second = self.changelist(self.changelist().next_cursor_url)
+        first = self.changelist(second.previous_cursor_url)
+        self.assertEqual([obj.pk for obj in first.result_list], self.expected[:2])
+        self.assertIsNone(first.previous_cursor_url)
+        self.assertIsNone(self.changelist().previous_cursor_url)
@@ -0,0 +1,90 @@
+from dateutil.relativedelta import relativedelta
+from django.test import TestCase, tag
+from edc_base import get_utcnow
+from edc_constants.constants import MALE, YES
+from edc_visit_tracking.constants import SCHEDULED
+from model_mommy import mommy
+
+from ..helper_classes.clinic_calendar import import_holidays
+from ..models import Appointment
+from .form_query_budget import FormFixtureError, FormQueryBudget
+
+
+@tag('form_budget')
+class TestFormQueryBudgets(TestCase):
+
+    def setUp(self):
+        import_holidays()
+        maternal_dataset_obj = mommy.make_recipe(
+            'flourish_caregiver.maternaldataset',
+            delivdt=get_utcnow() - relativedelta(years=3),
+            mom_enrolldate=get_utcnow(),
+            mom_hivstatus='HIV-infected',
+            study_maternal_identifier='12345',
+            protocol='Tshilo Dikotla')
+
+        child_dataset = mommy.make_recipe(
+            'flourish_child.childdataset',
+            dob=get_utcnow() - relativedelta(years=3),
+            infant_hiv_exposed='Exposed',
+            infant_enrolldate=get_utcnow(),
+            study_maternal_identifier='12345',
+            study_child_identifier='1234',
+            infant_sex=MALE)
+
+        mommy.make_recipe(
+            'flourish_caregiver.screeningpriorbhpparticipants',
+            screening_identifier=maternal_dataset_obj.screening_identifier)
+
+        subject_consent = mommy.make_recipe(
+            'flourish_caregiver.subjectconsent',
+            screening_identifier=maternal_dataset_obj.screening_identifier,
+            breastfeed_intent=YES,
+            biological_caregiver=YES,
+            consent_datetime=get_utcnow(),
+            version='1')
+
+        self.caregiver_child_consent = mommy.make_recipe(
+            'flourish_caregiver.caregiverchildconsent',
+            subject_consent=subject_consent,
+            study_child_identifier=child_dataset.study_child_identifier,
+            child_dob=maternal_dataset_obj.delivdt.date())
+
+        mommy.make_recipe(
+            'flourish_caregiver.caregiverpreviouslyenrolled',
+            subject_identifier=subject_consent.subject_identifier)
+
+        child_visit = mommy.make_recipe(
+            'flourish_child.childvisit',
+            appointment=Appointment.objects.get(
+                visit_code='2000',
+                subject_identifier=self.caregiver_child_consent.subject_identifier),
+            report_datetime=get_utcnow(),
+            reason=SCHEDULED)
+        self.form_query_budget = FormQueryBudget(child_visit=child_visit)
+
+    def test_forms_within_query_budget(self):
+        form_classes = self.form_query_budget.form_classes()
+        self.assertTrue(form_classes)
+        budgets = self.form_query_budget.budgets
+        for form_cls in form_classes:
+            with self.subTest(form=form_cls.__name__):
+                try:
+                    result = self.form_query_budget.measure(form_cls)
+                except FormFixtureError as e:
+                    self.skipTest(str(e))
+                self.assertTrue(
+                    result['valid'],
+                    f'{form_cls.__name__} is not valid. Got '
+                    f'{self.form_query_budget.errors[form_cls.__name__]}')
+                if not self.form_query_budget.record:
+                    if form_cls.__name__ not in budgets:
+                        self.skipTest(
+                            f'{form_cls.__name__} has no recorded query budget. '
+                            'Run with FORM_QUERY_BUDGETS_RECORD=1.')
+                    self.assertEqual(
+                        self.form_query_budget.over_budget(form_cls), {},
+                        f'{form_cls.__name__} is over its query budget; '
+                        '(queries, budget) by phase.')
+        if self.form_query_budget.record:
+            self.form_query_budget.write_budgets()
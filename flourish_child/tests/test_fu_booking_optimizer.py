@@ -0,0 +1,222 @@
+from datetime import date
+from unittest import mock
+
+from dateutil.relativedelta import relativedelta
+from django.db.models.signals import post_save
+from django.test import TestCase, tag
+from edc_base import get_utcnow
+from edc_constants.constants import MALE, YES
+from flourish_caregiver.models import CaregiverChildConsent
+from model_mommy import mommy
+
+from ..helper_classes.child_fu_booking_optimizer import (
+    BookingCandidate, ChildFollowUpBookingOptimizer)
+from ..helper_classes.clinic_calendar import import_holidays
+
+
+@tag('booking')
+class TestFuBookingOptimizer(TestCase):
+
+    def setUp(self):
+        import_holidays()
+        # Monday
+        self.start_date = date(2024, 3, 4)
+        self.optimizer = ChildFollowUpBookingOptimizer(
+            start_date=self.start_date,
+            end_date=self.start_date + relativedelta(months=1),
+            max_possible=1)
+
+    def candidate(self, subject_identifier, child_dob, cohort, release_date=None):
+        window_start, window_end = self.optimizer.priority_window(
+            child_dob=child_dob, cohort=cohort)
+        return BookingCandidate(
+            subject_identifier=subject_identifier,
+            release_date=release_date or self.start_date,
+            window_start=window_start,
+            window_end=window_end,
+            child_dob=child_dob)
+
+    def test_priority_window(self):
+        child_dob = date(2019, 1, 1)
+        self.assertEqual(
+            self.optimizer.priority_window(child_dob=child_dob, cohort='cohort_a'),
+            (date(2023, 6, 1), date(2024, 1, 1)))
+        self.assertEqual(
+            self.optimizer.priority_window(
+                child_dob=child_dob, cohort='cohort_a', preg_enroll=True),
+            (date(2020, 5, 17), date(2020, 8, 15)))
+
+    def test_priority_child_booked_first(self):
+        candidates = [
+            self.candidate('B142-040990001-6-10', date(2021, 1, 1), 'cohort_a'),
+            self.candidate('B142-040990002-6-10',
+                           self.start_date - relativedelta(years=4, months=6),
+                           'cohort_a')]
+        with mock.patch.object(self.optimizer, 'candidates', return_value=candidates):
+            assignments = self.optimizer.optimize()
+        self.assertEqual(
+            assignments.get('B142-040990002-6-10'), self.start_date)
+        self.assertEqual(
+            assignments.get('B142-040990001-6-10'),
+            self.start_date + relativedelta(days=1))
+
+    def test_capacity_respected(self):
+        candidates = [
+            self.candidate(f'B142-04099000{i}-6-10', date(2021, 1, 1), 'cohort_c')
+            for i in range(5)]
+        with mock.patch.object(self.optimizer, 'candidates', return_value=candidates):
+            assignments = self.optimizer.optimize()
+        self.assertEqual(len(assignments), 5)
+        self.assertEqual(len(set(assignments.values())), 5)
+        for booking_date in assignments.values():
+            self.assertLess(booking_date.weekday(), 5)
+
+    def book(self, subject_identifier, booking_date):
+        self.optimizer.participant_note_cls.objects.create(
+            subject_identifier=subject_identifier,
+            title=self.optimizer.calendar.title,
+            date=booking_date)
+
+    def include_booked_optimizer(self, enrolment_dates):
+        optimizer = ChildFollowUpBookingOptimizer(
+            start_date=self.start_date,
+            end_date=self.start_date + relativedelta(months=1),
+            max_possible=1,
+            include_booked=True)
+        optimizer._enrolment_dates = enrolment_dates
+        return optimizer
+
+    def test_non_candidate_booking_kept(self):
+        self.book('B142-040990009-6-10', self.start_date)
+        self.optimizer = self.include_booked_optimizer(
+            {'B142-040990001-6-10': self.start_date - relativedelta(years=1)})
+        candidates = [
+            self.candidate('B142-040990001-6-10', date(2021, 1, 1), 'cohort_c')]
+        self.assertEqual(self.optimizer.movable_bookings(), {})
+        with mock.patch.object(self.optimizer, 'candidates', return_value=candidates):
+            assignments = self.optimizer.optimize()
+        self.assertEqual(
+            assignments, {'B142-040990001-6-10': self.start_date + relativedelta(days=1)})
+
+    def test_unassigned_movable_keeps_booking(self):
+        wednesday = self.start_date + relativedelta(days=2)
+        self.book('B142-040990001-6-10', wednesday)
+        self.optimizer = self.include_booked_optimizer(
+            {f'B142-04099000{i}-6-10': self.start_date - relativedelta(years=1)
+             for i in range(1, 5)})
+        candidates = [
+            self.candidate('B142-040990001-6-10', date(2021, 1, 1), 'cohort_c',
+                           release_date=wednesday + relativedelta(days=1))] + [
+            self.candidate(f'B142-04099000{i}-6-10', date(2021, 1, i), 'cohort_c')
+            for i in range(2, 5)]
+        with mock.patch.object(self.optimizer, 'candidates', return_value=candidates):
+            assignments = self.optimizer.optimize()
+            diff = self.optimizer.diff(assignments)
+        self.assertEqual(assignments.get('B142-040990001-6-10'), wednesday)
+        self.assertEqual(len(set(assignments.values())), 4)
+        self.assertEqual(diff['moved'], [])
+        self.assertEqual(
+            diff['unchanged'], [('B142-040990001-6-10', wednesday, wednesday)])
+
+    def test_apply_saves_each_booking(self):
+        saved = []
+
+        def on_post_save(sender, instance, created, **kwargs):
+            saved.append((instance.subject_identifier, instance.date, created))
+
+        self.book('B142-040990001-6-10', self.start_date + relativedelta(days=3))
+        self.optimizer = self.include_booked_optimizer(
+            {'B142-040990001-6-10': self.start_date - relativedelta(years=1)})
+        diff = dict(
+            created=[('B142-040990002-6-10', None, self.start_date)],
+            moved=[('B142-040990001-6-10', self.start_date + relativedelta(days=3),
+                    self.start_date + relativedelta(days=1))],
+            unchanged=[])
+        participant_note_cls = self.optimizer.participant_note_cls
+        post_save.connect(on_post_save, sender=participant_note_cls)
+        try:
+            self.optimizer.apply(diff=diff)
+        finally:
+            post_save.disconnect(on_post_save, sender=participant_note_cls)
+
+        self.assertCountEqual(saved, [
+            ('B142-040990002-6-10', self.start_date, True),
+            ('B142-040990001-6-10', self.start_date + relativedelta(days=1), True)])
+        self.assertEqual(
+            list(participant_note_cls.objects.filter(
+                title=self.optimizer.calendar.title).order_by('date').values_list(
+                    'subject_identifier', 'date')),
+            [('B142-040990002-6-10', self.start_date),
+             ('B142-040990001-6-10', self.start_date + relativedelta(days=1))])
+
+
+@tag('booking')
+class TestFuBookingOptimizerEligibility(TestCase):
+
+    def setUp(self):
+        import_holidays()
+        maternal_dataset_obj = mommy.make_recipe(
+            'flourish_caregiver.maternaldataset',
+            delivdt=get_utcnow() - relativedelta(years=3),
+            mom_enrolldate=get_utcnow(),
+            mom_hivstatus='HIV-infected',
+            study_maternal_identifier='12345',
+            protocol='Tshilo Dikotla')
+
+        child_dataset = mommy.make_recipe(
+            'flourish_child.childdataset',
+            dob=get_utcnow() - relativedelta(years=3),
+            infant_hiv_exposed='Exposed',
+            infant_enrolldate=get_utcnow(),
+            study_maternal_identifier='12345',
+            study_child_identifier='1234',
+            infant_sex=MALE)
+
+        mommy.make_recipe(
+            'flourish_caregiver.screeningpriorbhpparticipants',
+            screening_identifier=maternal_dataset_obj.screening_identifier)
+
+        subject_consent = mommy.make_recipe(
+            'flourish_caregiver.subjectconsent',
+            screening_identifier=maternal_dataset_obj.screening_identifier,
+            breastfeed_intent=YES,
+            biological_caregiver=YES,
+            consent_datetime=get_utcnow(),
+            version='1')
+
+        caregiver_child_consent = mommy.make_recipe(
+            'flourish_caregiver.caregiverchildconsent',
+            subject_consent=subject_consent,
+            study_child_identifier=child_dataset.study_child_identifier,
+            child_dob=maternal_dataset_obj.delivdt.date())
+
+        mommy.make_recipe(
+            'flourish_caregiver.caregiverpreviouslyenrolled',
+            subject_identifier=subject_consent.subject_identifier)
+
+        self.subject_identifier = caregiver_child_consent.subject_identifier
+
+    def optimizer(self):
+        return ChildFollowUpBookingOptimizer(
+            start_date=get_utcnow().date(), include_booked=True)
+
+    def candidate_identifiers(self):
+        return [candidate.subject_identifier
+                for candidate in self.optimizer().candidates()]
+
+    def test_enrolled_child_is_candidate(self):
+        self.assertEqual(self.candidate_identifiers(), [self.subject_identifier])
+
+    def test_aging_out_child_not_booked(self):
+        CaregiverChildConsent.objects.filter(
+            subject_identifier=self.subject_identifier).update(
+                child_dob=(get_utcnow() - relativedelta(years=4, months=6)).date())
+        self.assertEqual(self.candidate_identifiers(), [])
+
+    def test_offstudy_child_not_booked(self):
+        mommy.make_recipe(
+            'flourish_prn.childoffstudy',
+            subject_identifier=self.subject_identifier,
+            offstudy_date=get_utcnow())
+        self.assertNotIn(self.subject_identifier, self.optimizer().enrolment_dates())
+        self.assertEqual(self.candidate_identifiers(), [])
@@ -4,11 +4,11 @@ from dateutil.relativedelta import relativedelta
 from django.test import TestCase, tag
 from edc_base.utils import get_utcnow
 from edc_constants.constants import MALE, YES
-from edc_facility.import_holidays import import_holidays
 from edc_visit_tracking.constants import SCHEDULED
 from model_mommy import mommy
 
 from ..helper_classes.child_fu_onschedule_helper import ChildFollowUpEnrolmentHelper
+from ..helper_classes.clinic_calendar import import_holidays
 from ..models import ChildDummySubjectConsent, Appointment
 from ..models import OnScheduleChildCohortAEnrollment, OnScheduleChildCohortBFU
 from ..models import OnScheduleChildCohortAFU, OnScheduleChildCohortAFUQuart
@@ -7,11 +7,11 @@ from django.test import tag, TestCase
 from django.test.client import RequestFactory
 from edc_base import get_utcnow
 from edc_constants.constants import MALE, YES
-from edc_facility.import_holidays import import_holidays
 from edc_visit_tracking.constants import SCHEDULED
 from model_mommy import mommy
 
 from flourish_calendar.models import Reminder
+from flourish_child.helper_classes.clinic_calendar import import_holidays
 from flourish_child.models import ChildClinicalMeasurements
 from flourish_child.models.child_appointment import Appointment
 from pre_flourish.helper_classes import MatchHelper
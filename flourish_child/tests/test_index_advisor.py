@@ -0,0 +1,94 @@
+from dateutil.relativedelta import relativedelta
+from django.test import TestCase, tag
+from edc_base import get_utcnow
+from edc_constants.constants import MALE, YES
+from edc_visit_tracking.constants import SCHEDULED
+from model_mommy import mommy
+
+from ..helper_classes.clinic_calendar import import_holidays
+from ..helper_classes.index_advisor import IndexAdvisor
+from ..models import Appointment
+
+
+@tag('index_advisor')
+class TestIndexAdvisor(TestCase):
+
+    def setUp(self):
+        import_holidays()
+        maternal_dataset_obj = mommy.make_recipe(
+            'flourish_caregiver.maternaldataset',
+            delivdt=get_utcnow() - relativedelta(years=3),
+            mom_enrolldate=get_utcnow(),
+            mom_hivstatus='HIV-infected',
+            study_maternal_identifier='12345',
+            protocol='Tshilo Dikotla')
+
+        child_dataset = mommy.make_recipe(
+            'flourish_child.childdataset',
+            dob=get_utcnow() - relativedelta(years=3),
+            infant_hiv_exposed='Exposed',
+            infant_enrolldate=get_utcnow(),
+            study_maternal_identifier='12345',
+            study_child_identifier='1234',
+            infant_sex=MALE)
+
+        mommy.make_recipe(
+            'flourish_caregiver.screeningpriorbhpparticipants',
+            screening_identifier=maternal_dataset_obj.screening_identifier)
+
+        subject_consent = mommy.make_recipe(
+            'flourish_caregiver.subjectconsent',
+            screening_identifier=maternal_dataset_obj.screening_identifier,
+            breastfeed_intent=YES,
+            biological_caregiver=YES,
+            consent_datetime=get_utcnow(),
+            version='1')
+
+        caregiver_child_consent = mommy.make_recipe(
+            'flourish_caregiver.caregiverchildconsent',
+            subject_consent=subject_consent,
+            study_child_identifier=child_dataset.study_child_identifier,
+            child_dob=maternal_dataset_obj.delivdt.date())
+
+        mommy.make_recipe(
+            'flourish_caregiver.caregiverpreviouslyenrolled',
+            subject_identifier=subject_consent.subject_identifier)
+
+        mommy.make_recipe(
+            'flourish_child.childvisit',
+            appointment=Appointment.objects.get(
+                visit_code='2000',
+                subject_identifier=caregiver_child_consent.subject_identifier),
+            report_datetime=get_utcnow(),
+            reason=SCHEDULED)
+
+    def test_report_covers_patterns(self):
+        advisor = IndexAdvisor()
+        report = advisor.report()
+        self.assertEqual(
+            [advice.name for advice in report],
+            [name for name, _ in advisor.patterns()])
+        self.assertTrue(all(advice.plan for advice in report))
+
+    def test_appointment_lookups_use_an_index(self):
+        report = {advice.name: advice for advice in IndexAdvisor().report()}
+        table = Appointment._meta.db_table
+        for name in ['appointment next by timepoint', 'previous appointment']:
+            with self.subTest(name=name):
+                self.assertNotIn(table, report[name].full_scans)
+
+    def test_full_scans(self):
+        advisor = IndexAdvisor()
+        self.assertEqual(
+            advisor.full_scans('SCAN TABLE flourish_child_appointment', 'sqlite'),
+            ['flourish_child_appointment'])
+        self.assertEqual(
+            advisor.full_scans(
+                'SEARCH flourish_child_appointment USING INDEX '
+                'child_appt_schedule_tp_idx (subject_identifier=?)', 'sqlite'),
+            [])
+        self.assertEqual(
+            advisor.full_scans(
+                'Seq Scan on flourish_child_childvisit  (cost=0.00..1.01)',
+                'postgresql'),
+            ['flourish_child_childvisit'])
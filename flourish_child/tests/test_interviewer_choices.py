@@ -0,0 +1,68 @@
+from django.apps import apps as django_apps
+from django.contrib.auth.models import Group, User
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.test import TestCase, tag
+
+from ..helper_classes.interviewer_choices import interviewer_choices
+from ..models.model_mixins import IntvUsersMixin
+
+
+@tag('intv_choices')
+class TestInterviewerChoices(TestCase):
+
+    def setUp(self):
+        app_config = django_apps.get_app_config('flourish_caregiver')
+        self.group = Group.objects.create(name=app_config.interviewers_group)
+        self.extra_choices = tuple(
+            value[0] for value in (app_config.extra_assignee_choices or {}).values())
+        self.user = User.objects.create(
+            username='kgosi', first_name='Kgosi', last_name='Molefe')
+        self.user.groups.add(self.group)
+        interviewer_choices.invalidate()
+
+    def test_choices_cached(self):
+        self.assertEqual(
+            IntvUsersMixin().intv_users,
+            (('kgosi', 'Kgosi Molefe'),) + self.extra_choices)
+        with self.assertNumQueries(0):
+            IntvUsersMixin().intv_users
+
+    def test_membership_change_invalidates(self):
+        interviewer_choices.choices
+        user = User.objects.create(
+            username='neo', first_name='Neo', last_name='Sebina')
+        user.groups.add(self.group)
+        self.assertIn(('neo', 'Neo Sebina'), interviewer_choices.choices)
+
+        self.user.groups.remove(self.group)
+        self.assertNotIn(('kgosi', 'Kgosi Molefe'), interviewer_choices.choices)
+
+    def test_name_change_invalidates(self):
+        interviewer_choices.choices
+        self.user.last_name = 'Tau'
+        self.user.save()
+        self.assertIn(('kgosi', 'Kgosi Tau'), interviewer_choices.choices)
+
+    def test_missing_name_not_cached(self):
+        self.user.first_name = ''
+        self.user.save()
+        self.assertRaises(ValidationError, lambda: interviewer_choices.choices)
+        self.user.first_name = 'Kgosi'
+        self.user.save()
+        self.assertIn(('kgosi', 'Kgosi Molefe'), interviewer_choices.choices)
+
+    def test_invalidated_by_other_worker(self):
+        """ Assert a new token in the shared cache, i.e. an invalidation in
+            another process, rebuilds the choices after the check interval.
+        """
+        interviewer_choices.choices
+        User.objects.filter(pk=self.user.pk).update(last_name='Tau')
+        self.assertIn(('kgosi', 'Kgosi Molefe'), interviewer_choices.choices)
+
+        check_interval = interviewer_choices.shared_version.check_interval
+        interviewer_choices.shared_version.check_interval = 0
+        self.addCleanup(
+            setattr, interviewer_choices.shared_version, 'check_interval', check_interval)
+        cache.set(interviewer_choices.shared_version.key, 'other-worker', timeout=None)
+        self.assertIn(('kgosi', 'Kgosi Tau'), interviewer_choices.choices)
@@ -1,9 +1,9 @@
 from django.test import TestCase, tag
-from edc_facility.import_holidays import import_holidays
 from model_mommy import mommy
 from edc_base.utils import get_utcnow
 from edc_constants.constants import YES,NEG,NO
 from dateutil.relativedelta import relativedelta
+from ..helper_classes.clinic_calendar import import_holidays
 from ..models import Appointment, ChildDummySubjectConsent
 from edc_visit_tracking.constants import MISSED_VISIT,SCHEDULED
 from django.apps import apps as django_apps
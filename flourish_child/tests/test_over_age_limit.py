@@ -0,0 +1,58 @@
+from datetime import date
+from decimal import Decimal
+
+from dateutil.relativedelta import relativedelta
+from django.test import TestCase, tag
+from django.utils import timezone
+from flourish_caregiver.helper_classes.cohort import Cohort
+from model_mommy import mommy
+
+from ..models import ChildDataset
+from ..utils import ages_in_years_months, over_age_limit
+
+
+@tag('age')
+class TestOverAgeLimit(TestCase):
+
+    def test_ages_match_cohort(self):
+        check_date = date(2023, 2, 28)
+        dobs = [date(2019, 1, 31), date(2018, 2, 28), date(2012, 3, 1),
+                date(2022, 12, 31), None]
+        ages = ages_in_years_months(dobs, check_date)
+        for dob, age in zip(dobs, ages.tolist()):
+            self.assertAlmostEqual(
+                age, Cohort().age_at_enrollment(child_dob=dob, check_date=check_date))
+
+    def test_over_age_limit(self):
+        today = timezone.now().date()
+        for index, dob in enumerate([today - relativedelta(years=4, months=11),
+                                     today - relativedelta(years=10, months=2)]):
+            mommy.make_recipe(
+                'flourish_child.childdataset',
+                study_child_identifier=f'B142-{index}',
+                dob=dob)
+
+        over_age_limit()
+
+        self.assertEqual(
+            sorted(ChildDataset.objects.values_list('age_today', flat=True)),
+            [Decimal('4.11'), Decimal('10.20')])
+        self.assertEqual(ChildDataset.objects.filter(
+            age_calculation_date=today).count(), 2)
+
+        with self.assertNumQueries(1):
+            over_age_limit()
+
+    def test_unchanged_ages_not_written(self):
+        today = timezone.now().date()
+        mommy.make_recipe(
+            'flourish_child.childdataset',
+            study_child_identifier='B142-0',
+            dob=today - relativedelta(years=4, months=11))
+        over_age_limit()
+        ChildDataset.objects.update(age_calculation_date=today - relativedelta(days=1))
+
+        over_age_limit()
+
+        self.assertEqual(ChildDataset.objects.filter(
+            age_calculation_date=today - relativedelta(days=1)).count(), 1)
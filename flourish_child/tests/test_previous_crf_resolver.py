@@ -0,0 +1,102 @@
+from dateutil.relativedelta import relativedelta
+from django.test import TestCase, tag
+from edc_base import get_utcnow
+from edc_constants.constants import MALE, YES
+from edc_visit_tracking.constants import SCHEDULED
+from model_mommy import mommy
+
+from ..helper_classes.clinic_calendar import import_holidays
+from ..helper_classes.previous_crf_resolver import PreviousCrfResolver
+from ..models import Appointment, ChildSocioDemographic
+
+
+@tag('prefill')
+class TestPreviousCrfResolver(TestCase):
+
+    def setUp(self):
+        import_holidays()
+        maternal_dataset_obj = mommy.make_recipe(
+            'flourish_caregiver.maternaldataset',
+            delivdt=get_utcnow() - relativedelta(years=3),
+            mom_enrolldate=get_utcnow(),
+            mom_hivstatus='HIV-infected',
+            study_maternal_identifier='12345',
+            protocol='Tshilo Dikotla')
+
+        child_dataset = mommy.make_recipe(
+            'flourish_child.childdataset',
+            dob=get_utcnow() - relativedelta(years=3),
+            infant_hiv_exposed='Exposed',
+            infant_enrolldate=get_utcnow(),
+            study_maternal_identifier='12345',
+            study_child_identifier='1234',
+            infant_sex=MALE)
+
+        mommy.make_recipe(
+            'flourish_caregiver.screeningpriorbhpparticipants',
+            screening_identifier=maternal_dataset_obj.screening_identifier)
+
+        subject_consent = mommy.make_recipe(
+            'flourish_caregiver.subjectconsent',
+            screening_identifier=maternal_dataset_obj.screening_identifier,
+            breastfeed_intent=YES,
+            biological_caregiver=YES,
+            consent_datetime=get_utcnow(),
+            version='1')
+
+        self.caregiver_child_consent = mommy.make_recipe(
+            'flourish_caregiver.caregiverchildconsent',
+            subject_consent=subject_consent,
+            study_child_identifier=child_dataset.study_child_identifier,
+            child_dob=maternal_dataset_obj.delivdt.date())
+
+        mommy.make_recipe(
+            'flourish_caregiver.caregiverpreviouslyenrolled',
+            subject_identifier=subject_consent.subject_identifier)
+
+    def add_visit(self, visit_code, report_datetime):
+        return mommy.make_recipe(
+            'flourish_child.childvisit',
+            appointment=Appointment.objects.get(
+                visit_code=visit_code,
+                subject_identifier=self.caregiver_child_consent.subject_identifier),
+            report_datetime=report_datetime,
+            reason=SCHEDULED)
+
+    def test_at_visit_or_latest(self):
+        visit_2000 = self.add_visit('2000', get_utcnow() - relativedelta(months=3))
+        visit_2001 = self.add_visit('2001', get_utcnow())
+        socio_demographic = mommy.make_recipe(
+            'flourish_child.childsociodemographic',
+            child_visit=visit_2000,
+            report_datetime=visit_2000.report_datetime)
+
+        resolver = PreviousCrfResolver(visit=visit_2001)
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                resolver.at_visit_or_latest(ChildSocioDemographic), socio_demographic)
+            self.assertIsNone(resolver.at_visit(ChildSocioDemographic))
+            resolver.at_visit_or_latest(ChildSocioDemographic)
+
+        resolver = PreviousCrfResolver(visit_id=visit_2000.id)
+        self.assertEqual(resolver.at_visit(ChildSocioDemographic), socio_demographic)
+
+    def test_latest_before(self):
+        visit_2000 = self.add_visit('2000', get_utcnow() - relativedelta(months=3))
+        visit_2001 = self.add_visit('2001', get_utcnow())
+        socio_demographic = mommy.make_recipe(
+            'flourish_child.childsociodemographic',
+            child_visit=visit_2000,
+            report_datetime=visit_2000.report_datetime)
+        mommy.make_recipe(
+            'flourish_child.childsociodemographic',
+            child_visit=visit_2001,
+            report_datetime=visit_2001.report_datetime)
+
+        resolver = PreviousCrfResolver(
+            subject_identifier=self.caregiver_child_consent.subject_identifier)
+        with self.assertNumQueries(1):
+            for _ in range(4):
+                previous = resolver.latest(
+                    ChildSocioDemographic, before=visit_2001.report_datetime)
+        self.assertEqual(previous, socio_demographic)
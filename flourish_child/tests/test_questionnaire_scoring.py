@@ -0,0 +1,119 @@
+from dateutil.relativedelta import relativedelta
+from django.core.management import call_command
+from django.test import TestCase, tag
+from edc_base import get_utcnow
+from edc_constants.constants import MALE, NO, YES
+from edc_visit_tracking.constants import SCHEDULED
+from model_mommy import mommy
+
+from ..helper_classes.clinic_calendar import import_holidays
+from ..helper_classes.questionnaire_scoring import Instrument
+from ..models import Appointment, ChildFoodSecurityQuestionnaire
+from ..models import ChildGadAnxietyScreening, ChildPhqDepressionScreening
+
+
+@tag('scoring')
+class TestQuestionnaireScoring(TestCase):
+
+    def setUp(self):
+        import_holidays()
+        maternal_dataset_obj = mommy.make_recipe(
+            'flourish_caregiver.maternaldataset',
+            delivdt=get_utcnow() - relativedelta(years=3),
+            mom_enrolldate=get_utcnow(),
+            mom_hivstatus='HIV-infected',
+            study_maternal_identifier='12345',
+            protocol='Tshilo Dikotla')
+
+        child_dataset = mommy.make_recipe(
+            'flourish_child.childdataset',
+            dob=get_utcnow() - relativedelta(years=3),
+            infant_hiv_exposed='Exposed',
+            infant_enrolldate=get_utcnow(),
+            study_maternal_identifier='12345',
+            study_child_identifier='1234',
+            infant_sex=MALE)
+
+        mommy.make_recipe(
+            'flourish_caregiver.screeningpriorbhpparticipants',
+            screening_identifier=maternal_dataset_obj.screening_identifier)
+
+        subject_consent = mommy.make_recipe(
+            'flourish_caregiver.subjectconsent',
+            screening_identifier=maternal_dataset_obj.screening_identifier,
+            breastfeed_intent=YES,
+            biological_caregiver=YES,
+            consent_datetime=get_utcnow(),
+            version='1')
+
+        self.caregiver_child_consent = mommy.make_recipe(
+            'flourish_caregiver.caregiverchildconsent',
+            subject_consent=subject_consent,
+            study_child_identifier=child_dataset.study_child_identifier,
+            child_dob=maternal_dataset_obj.delivdt.date())
+
+        mommy.make_recipe(
+            'flourish_caregiver.caregiverpreviouslyenrolled',
+            subject_identifier=subject_consent.subject_identifier)
+
+        self.child_visit = mommy.make_recipe(
+            'flourish_child.childvisit',
+            appointment=Appointment.objects.get(
+                visit_code='2000',
+                subject_identifier=self.caregiver_child_consent.subject_identifier),
+            report_datetime=get_utcnow(),
+            reason=SCHEDULED)
+
+    def test_reverse_items_and_subscales(self):
+        instrument = Instrument(
+            items=['feeling_anxious', 'control_worrying', 'worrying'],
+            values={'0': 0, '1': 1, '2': 2, '3': 3},
+            reverse_items=['worrying'],
+            total_field='anxiety_score',
+            subscales={'gad2_score': ['feeling_anxious', 'control_worrying']})
+        self.assertEqual(
+            instrument.score_rows(
+                ChildGadAnxietyScreening, [('1', '3', '0'), ('2', None, '1')]),
+            {'anxiety_score': [7, None], 'gad2_score': [4, None]})
+
+    def test_scores_on_save(self):
+        gad = mommy.make_recipe(
+            'flourish_child.childgadanxietyscreening', child_visit=self.child_visit)
+        self.assertEqual((gad.anxiety_score, gad.gad2_score), (11, 4))
+
+        phq = mommy.make_recipe(
+            'flourish_child.childphqdeprscreening', child_visit=self.child_visit)
+        self.assertEqual((phq.depression_score, phq.phq2_score), (11, 3))
+
+        food_security = mommy.make_recipe(
+            'flourish_child.childfoodsecurityquestionnaire',
+            child_visit=self.child_visit,
+            did_food_last='sometimes_true ',
+            balanced_meals='never_true',
+            cut_meals=YES,
+            how_often='one_or_two',
+            eat_less=YES,
+            didnt_eat=NO)
+        self.assertEqual(food_security.food_security_score, 3)
+
+    def test_rescore(self):
+        mommy.make_recipe(
+            'flourish_child.childgadanxietyscreening', child_visit=self.child_visit)
+        ChildGadAnxietyScreening.objects.update(anxiety_score=0, gad2_score=None)
+
+        call_command('rescore_questionnaires', 'childgadanxietyscreening',
+                     '--dry-run')
+        self.assertEqual(ChildGadAnxietyScreening.objects.get().anxiety_score, 0)
+
+        changed = ChildGadAnxietyScreening.scoring_instrument.rescore(
+            ChildGadAnxietyScreening)
+        self.assertEqual(changed, 1)
+        self.assertEqual(
+            ChildGadAnxietyScreening.objects.values_list(
+                'anxiety_score', 'gad2_score').get(), (11, 4))
+        self.assertEqual(ChildGadAnxietyScreening.scoring_instrument.rescore(
+            ChildGadAnxietyScreening), 0)
+        self.assertEqual(ChildPhqDepressionScreening.scoring_instrument.rescore(
+            ChildPhqDepressionScreening), 0)
+        self.assertEqual(ChildFoodSecurityQuestionnaire.scoring_instrument.rescore(
+            ChildFoodSecurityQuestionnaire), 0)
@@ -0,0 +1,97 @@
+from dateutil.relativedelta import relativedelta
+from django.test import TestCase, tag
+from edc_base.utils import get_utcnow
+from edc_constants.constants import MALE, YES
+from model_mommy import mommy
+
+from ..helper_classes.clinic_calendar import import_holidays
+from ..helper_classes.utils import child_utils
+from ..models import SubjectIdentityGraph
+
+
+@tag('identity')
+class TestSubjectIdentityGraph(TestCase):
+
+    def setUp(self):
+        import_holidays()
+
+        self.options = {
+            'consent_datetime': get_utcnow(),
+            'version': '1'}
+
+        maternal_dataset_obj = mommy.make_recipe(
+            'flourish_caregiver.maternaldataset',
+            delivdt=get_utcnow() - relativedelta(years=3),
+            mom_enrolldate=get_utcnow(),
+            mom_hivstatus='HIV-infected',
+            study_maternal_identifier='12345',
+            protocol='Tshilo Dikotla')
+
+        self.child_dataset = mommy.make_recipe(
+            'flourish_child.childdataset',
+            dob=get_utcnow() - relativedelta(years=3),
+            infant_hiv_exposed='Exposed',
+            infant_enrolldate=get_utcnow(),
+            study_maternal_identifier='12345',
+            study_child_identifier='1234',
+            infant_sex=MALE)
+
+        mommy.make_recipe(
+            'flourish_caregiver.flourishconsentversion',
+            screening_identifier=maternal_dataset_obj.screening_identifier,
+            version='1',
+            child_version='1')
+
+        mommy.make_recipe(
+            'flourish_caregiver.screeningpriorbhpparticipants',
+            screening_identifier=maternal_dataset_obj.screening_identifier)
+
+        self.subject_consent = mommy.make_recipe(
+            'flourish_caregiver.subjectconsent',
+            screening_identifier=maternal_dataset_obj.screening_identifier,
+            breastfeed_intent=YES,
+            biological_caregiver=YES,
+            **self.options)
+
+        self.caregiver_child_consent = mommy.make_recipe(
+            'flourish_caregiver.caregiverchildconsent',
+            subject_consent=self.subject_consent,
+            gender=MALE,
+            study_child_identifier=self.child_dataset.study_child_identifier,
+            child_dob=maternal_dataset_obj.delivdt.date())
+
+    def test_identity_created_on_consent(self):
+        identity = SubjectIdentityGraph.objects.get(
+            subject_identifier=self.caregiver_child_consent.subject_identifier)
+        self.assertEqual(identity.caregiver_subject_identifier,
+                         self.subject_consent.subject_identifier)
+        self.assertEqual(identity.screening_identifier,
+                         self.subject_consent.screening_identifier)
+        self.assertEqual(identity.study_maternal_identifier, '12345')
+        self.assertEqual(identity.child_dataset_id, self.child_dataset.id)
+
+    def test_resolve_any_identifier(self):
+        for identifier in [self.caregiver_child_consent.subject_identifier,
+                           self.subject_consent.subject_identifier,
+                           self.subject_consent.screening_identifier,
+                           '12345', '1234']:
+            self.assertEqual(
+                SubjectIdentityGraph.objects.resolve(identifier).count(), 1)
+
+        linked = SubjectIdentityGraph.objects.linked_identifiers('12345')
+        self.assertEqual(linked.get('subject_identifier'),
+                         {self.caregiver_child_consent.subject_identifier})
+
+    def test_dataset_update_propagates(self):
+        self.child_dataset.study_maternal_identifier = '54321'
+        self.child_dataset.save()
+        self.assertEqual(
+            SubjectIdentityGraph.objects.resolve('54321').count(), 1)
+
+    def test_rebuild(self):
+        SubjectIdentityGraph.objects.all().delete()
+        self.assertEqual(SubjectIdentityGraph.objects.rebuild(), 1)
+        self.assertEqual(
+            child_utils.caregiver_subject_identifier(
+                self.caregiver_child_consent.subject_identifier),
+            self.subject_consent.subject_identifier)
@@ -4,13 +4,13 @@ from django.test import tag, TestCase
 from edc_action_item import site_action_items
 from edc_base import get_utcnow
 from edc_constants.constants import IND, NEG, NEW, NO, NOT_APPLICABLE, POS, YES
-from edc_facility.import_holidays import import_holidays
 from edc_metadata import NOT_REQUIRED, REQUIRED
 from edc_metadata.models import CrfMetadata, RequisitionMetadata
 from edc_visit_schedule.models import SubjectScheduleHistory
 from edc_visit_tracking.constants import SCHEDULED, UNSCHEDULED
 from model_mommy import mommy
 
+from flourish_child.helper_classes.clinic_calendar import import_holidays
 from flourish_child.models import Appointment, OnScheduleTbAdolFollowupSchedule
 from flourish_prn.models.tb_adol_off_study import TBAdolOffStudy
 
@@ -2,12 +2,12 @@ from dateutil.relativedelta import relativedelta
 from django.test import tag, TestCase
 from edc_base import get_utcnow
 from edc_constants.constants import MALE, NO, YES
-from edc_facility.import_holidays import import_holidays
 from edc_metadata import NOT_REQUIRED, REQUIRED
 from edc_metadata.models import CrfMetadata
 from edc_visit_tracking.constants import SCHEDULED
 from model_mommy import mommy
 
+from flourish_child.helper_classes.clinic_calendar import import_holidays
 from flourish_child.models import Appointment
 
 
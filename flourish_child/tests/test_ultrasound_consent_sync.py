@@ -0,0 +1,50 @@
+from unittest import mock
+
+from django.test import TestCase, tag
+
+from ..helper_classes.brain_ultrasound_helper import BrainUltrasoundHelper
+from ..helper_classes.redcap_client import RedcapClient
+from ..helper_classes.ultrasound_consent_sync import UltrasoundConsentSync
+from ..models import RedcapSync, UltrasoundConsentMirror
+from .redcap_stub_server import RedcapStubServer
+
+
+@tag('buh')
+class TestUltrasoundConsentSync(TestCase):
+
+    def setUp(self):
+        BrainUltrasoundHelper.consent_cache.clear()
+        self.consent_row = {field: '1' for field in BrainUltrasoundHelper.consent_fields}
+        self.records = {'B142-040990001-1': self.consent_row,
+                        'B142-040990002-1': dict(self.consent_row, copy_v4='0')}
+
+    def test_sync(self):
+        with RedcapStubServer(records=self.records) as server:
+            sync = UltrasoundConsentSync(
+                client=RedcapClient(url=server.url, token='token'))
+            self.assertEqual(sync.sync(), (2, 0))
+
+            self.records['B142-040990002-1'] = self.consent_row
+            self.assertEqual(sync.sync(), (0, 1))
+
+        self.assertNotIn('dateRangeBegin', server.requests[0])
+        self.assertIn('dateRangeBegin', server.requests[1])
+        self.assertIsNotNone(
+            RedcapSync.objects.get(name=sync.name).last_synced_datetime)
+        self.assertEqual(
+            UltrasoundConsentMirror.objects.filter(consent_completed=True).count(), 2)
+
+    def test_helper_reads_mirror(self):
+        UltrasoundConsentMirror.objects.update_from_rows(rows=self.records)
+        brain_ultrasound_helper = BrainUltrasoundHelper(
+            'B142-040990001-1-10', 'B142-040990001-1')
+
+        with RedcapStubServer() as server:
+            client = RedcapClient(url=server.url, token='token')
+            with mock.patch.object(BrainUltrasoundHelper, 'redcap_client', client):
+                self.assertTrue(brain_ultrasound_helper.is_enrolled_brain_ultrasound())
+                self.assertEqual(BrainUltrasoundHelper.consent_completed(
+                    ['B142-040990001-1', 'B142-040990002-1']),
+                    {'B142-040990001-1': True, 'B142-040990002-1': False})
+
+        self.assertEqual(len(server.requests), 0)
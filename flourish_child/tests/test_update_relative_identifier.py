@@ -0,0 +1,82 @@
+from dateutil.relativedelta import relativedelta
+from django.db import connection
+from django.test import TestCase, tag
+from django.test.utils import CaptureQueriesContext
+from edc_base import get_utcnow
+from edc_constants.constants import MALE, YES
+from model_mommy import mommy
+
+from ..helper_classes.clinic_calendar import import_holidays
+from ..models import ChildDummySubjectConsent
+
+
+@tag('relative_identifier')
+class TestUpdateRelativeIdentifier(TestCase):
+
+    def setUp(self):
+        import_holidays()
+        maternal_dataset_obj = mommy.make_recipe(
+            'flourish_caregiver.maternaldataset',
+            delivdt=get_utcnow() - relativedelta(years=3),
+            mom_enrolldate=get_utcnow(),
+            mom_hivstatus='HIV-infected',
+            study_maternal_identifier='12345',
+            protocol='Tshilo Dikotla')
+
+        child_dataset = mommy.make_recipe(
+            'flourish_child.childdataset',
+            dob=get_utcnow() - relativedelta(years=3),
+            infant_hiv_exposed='Exposed',
+            infant_enrolldate=get_utcnow(),
+            study_maternal_identifier='12345',
+            study_child_identifier='1234',
+            infant_sex=MALE)
+
+        mommy.make_recipe(
+            'flourish_caregiver.screeningpriorbhpparticipants',
+            screening_identifier=maternal_dataset_obj.screening_identifier)
+
+        subject_consent = mommy.make_recipe(
+            'flourish_caregiver.subjectconsent',
+            screening_identifier=maternal_dataset_obj.screening_identifier,
+            breastfeed_intent=YES,
+            biological_caregiver=YES,
+            consent_datetime=get_utcnow(),
+            version='1')
+
+        self.caregiver_child_consent = mommy.make_recipe(
+            'flourish_caregiver.caregiverchildconsent',
+            subject_consent=subject_consent,
+            study_child_identifier=child_dataset.study_child_identifier,
+            child_dob=maternal_dataset_obj.delivdt.date())
+
+        mommy.make_recipe(
+            'flourish_caregiver.caregiverpreviouslyenrolled',
+            subject_identifier=subject_consent.subject_identifier)
+
+        self.caregiver_subject_identifier = subject_consent.subject_identifier
+
+    def test_update_relative_identifier(self):
+        subject_identifier = self.caregiver_child_consent.subject_identifier
+        ChildDummySubjectConsent.objects.filter(
+            subject_identifier=subject_identifier).update(relative_identifier=None)
+
+        changes = ChildDummySubjectConsent.objects.update_relative_identifier(
+            dry_run=True)
+        self.assertEqual(
+            changes, [(subject_identifier, None, self.caregiver_subject_identifier)])
+        self.assertIsNone(ChildDummySubjectConsent.objects.get(
+            subject_identifier=subject_identifier).relative_identifier)
+
+        with CaptureQueriesContext(connection) as queries:
+            ChildDummySubjectConsent.objects.update_relative_identifier()
+        # The consent mapping, the current values and one update.
+        self.assertEqual(len([
+            query for query in queries.captured_queries
+            if 'SAVEPOINT' not in query['sql']]), 3)
+        self.assertEqual(
+            ChildDummySubjectConsent.objects.get(
+                subject_identifier=subject_identifier).relative_identifier,
+            self.caregiver_subject_identifier)
+        self.assertEqual(
+            ChildDummySubjectConsent.objects.update_relative_identifier(), [])
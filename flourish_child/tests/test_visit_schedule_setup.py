@@ -5,10 +5,10 @@ from model_mommy import mommy
 from edc_visit_schedule.models import SubjectScheduleHistory
 from edc_base.utils import get_utcnow
 from edc_constants.constants import NOT_APPLICABLE, YES, NO
-from edc_facility.import_holidays import import_holidays
 from edc_visit_schedule import site_visit_schedules
 from edc_visit_tracking.constants import SCHEDULED
 
+from ..helper_classes.clinic_calendar import import_holidays
 from ..models import ChildDummySubjectConsent, Appointment, \
     OnScheduleChildCohortCSecQuart
 from ..models import OnScheduleChildCohortAEnrollment, \
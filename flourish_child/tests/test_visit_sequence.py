@@ -0,0 +1,231 @@
+from dateutil.relativedelta import relativedelta
+from django.core.exceptions import MultipleObjectsReturned
+from django.db.models import Q
+from django.test import TestCase, tag
+from edc_base import get_utcnow
+from edc_constants.constants import MALE, YES
+from edc_visit_tracking.constants import SCHEDULED, UNSCHEDULED
+from edc_visit_tracking.visit_sequence import VisitSequence as EdcVisitSequence
+from model_mommy import mommy
+
+from ..helper_classes.clinic_calendar import import_holidays
+from ..helper_classes.cohort_schedule_registry import cohort_schedule_registry
+from ..helper_classes.utils import child_utils
+from ..models import Appointment
+from ..visit_sequence import VisitSequence
+
+
+class BaselineVisitSequence(EdcVisitSequence):
+    """ The per-call lookups VisitSequence resolved the previous appointment
+        and visit with before the visit chain.
+    """
+
+    def __init__(self, appointment=None):
+        self.appointment = appointment
+        self.appointment_model_cls = self.appointment.__class__
+        self.model_cls = getattr(
+            self.appointment_model_cls,
+            self.appointment_model_cls.related_visit_model_attr()
+        ).related.related_model
+        self.subject_identifier = self.appointment.subject_identifier
+        self.visit_schedule_name = self.appointment.visit_schedule_name
+        self.visit_code = self.appointment.visit_code
+        previous_visit = self.appointment.schedule.visits.previous(
+            self.visit_code)
+        self.previous_appointment = child_utils.get_previous_appt_instance(
+            self.appointment)
+        try:
+            self.previous_visit_code = getattr(
+                self.previous_appointment, 'visit_code', None) or previous_visit.code
+        except AttributeError:
+            self.previous_visit_code = None
+        self.sequence_query = Q()
+        if self.visit_code == self.previous_visit_code:
+            previous_visit_code_sequence = getattr(
+                self.previous_appointment, 'visit_code_sequence', 0)
+            self.sequence_query = Q(visit_code_sequence=previous_visit_code_sequence)
+        self.previous_visit_missing = self.previous_visit_code and not self.previous_visit
+
+    @property
+    def previous_visit(self):
+        previous_visit = None
+        if self.previous_visit_code:
+            try:
+                previous_visit = self.model_cls.objects.get(
+                    appointment__subject_identifier=self.subject_identifier,
+                    visit_schedule_name=self.visit_schedule_name,
+                    schedule_name=self.appointment.schedule_name,
+                    visit_code=self.previous_visit_code)
+            except (self.model_cls.DoesNotExist, MultipleObjectsReturned):
+                previous_visit = self.get_previous_visit_by_appt()
+        return previous_visit
+
+    def get_previous_visit_by_appt(self):
+        previous_visit = None
+        if self.visit_code not in ['2002S']:
+            previous_appointment = self.appointment_model_cls.objects.filter(
+                self.sequence_query,
+                subject_identifier=self.subject_identifier,
+                visit_code=self.previous_visit_code).order_by(
+                    '-visit_code_sequence').first()
+            if previous_appointment:
+                try:
+                    previous_visit = self.model_cls.objects.get(
+                        appointment=previous_appointment)
+                except self.model_cls.DoesNotExist:
+                    pass
+            else:
+                previous_visit = getattr(
+                    self.previous_appointment, self.model_cls._meta.model_name, None)
+        return previous_visit
+
+
+@tag('visit_sequence')
+class TestVisitSequence(TestCase):
+
+    def setUp(self):
+        import_holidays()
+        maternal_dataset_obj = mommy.make_recipe(
+            'flourish_caregiver.maternaldataset',
+            delivdt=get_utcnow() - relativedelta(years=3),
+            mom_enrolldate=get_utcnow(),
+            mom_hivstatus='HIV-infected',
+            study_maternal_identifier='12345',
+            protocol='Tshilo Dikotla')
+
+        child_dataset = mommy.make_recipe(
+            'flourish_child.childdataset',
+            dob=get_utcnow() - relativedelta(years=3),
+            infant_hiv_exposed='Exposed',
+            infant_enrolldate=get_utcnow(),
+            study_maternal_identifier='12345',
+            study_child_identifier='1234',
+            infant_sex=MALE)
+
+        mommy.make_recipe(
+            'flourish_caregiver.screeningpriorbhpparticipants',
+            screening_identifier=maternal_dataset_obj.screening_identifier)
+
+        subject_consent = mommy.make_recipe(
+            'flourish_caregiver.subjectconsent',
+            screening_identifier=maternal_dataset_obj.screening_identifier,
+            breastfeed_intent=YES,
+            biological_caregiver=YES,
+            consent_datetime=get_utcnow(),
+            version='1')
+
+        caregiver_child_consent = mommy.make_recipe(
+            'flourish_caregiver.caregiverchildconsent',
+            subject_consent=subject_consent,
+            study_child_identifier=child_dataset.study_child_identifier,
+            child_dob=maternal_dataset_obj.delivdt.date())
+
+        mommy.make_recipe(
+            'flourish_caregiver.caregiverpreviouslyenrolled',
+            subject_identifier=subject_consent.subject_identifier)
+
+        self.subject_identifier = caregiver_child_consent.subject_identifier
+        self.enrol_appointment = Appointment.objects.get(
+            subject_identifier=self.subject_identifier,
+            visit_code='2000')
+
+    def sequence(self, visit_sequence):
+        return (getattr(visit_sequence.previous_appointment, 'id', None),
+                visit_sequence.previous_visit_code,
+                getattr(visit_sequence.previous_visit, 'id', None),
+                bool(visit_sequence.previous_visit_missing))
+
+    def assertMatchesBaseline(self, appointment):
+        with self.subTest(visit_code=appointment.visit_code,
+                          visit_code_sequence=appointment.visit_code_sequence,
+                          schedule_name=appointment.schedule_name):
+            self.assertEqual(
+                self.sequence(VisitSequence(appointment=appointment)),
+                self.sequence(BaselineVisitSequence(appointment=appointment)))
+
+    def assertAllMatchBaseline(self):
+        for appointment in Appointment.objects.filter(
+                subject_identifier=self.subject_identifier).order_by(
+                    'appt_datetime', 'visit_code_sequence'):
+            self.assertMatchesBaseline(appointment)
+
+    def make_visit(self, appointment, reason=SCHEDULED):
+        return mommy.make_recipe(
+            'flourish_child.childvisit',
+            appointment=appointment,
+            report_datetime=appointment.appt_datetime,
+            reason=reason)
+
+    def put_on_schedule(self, cohort, base_appt_datetime):
+        cohort_schedule = cohort_schedule_registry.get(cohort)
+        if not cohort_schedule.schedule.is_onschedule(
+                subject_identifier=self.subject_identifier,
+                report_datetime=base_appt_datetime):
+            cohort_schedule.schedule.put_on_schedule(
+                subject_identifier=self.subject_identifier,
+                onschedule_datetime=base_appt_datetime,
+                schedule_name=cohort_schedule.schedule_name,
+                base_appt_datetime=base_appt_datetime)
+        return Appointment.objects.filter(
+            subject_identifier=self.subject_identifier,
+            schedule_name=cohort_schedule.schedule_name).order_by('timepoint')
+
+    def test_first_visit(self):
+        visit_sequence = VisitSequence(appointment=self.enrol_appointment)
+        self.assertIsNone(visit_sequence.previous_appointment)
+        self.assertIsNone(visit_sequence.previous_visit)
+        self.assertMatchesBaseline(self.enrol_appointment)
+
+    def test_unscheduled_visit_code_sequence(self):
+        self.make_visit(self.enrol_appointment)
+        unscheduled = mommy.make(
+            Appointment,
+            subject_identifier=self.subject_identifier,
+            visit_schedule_name=self.enrol_appointment.visit_schedule_name,
+            schedule_name=self.enrol_appointment.schedule_name,
+            visit_code=self.enrol_appointment.visit_code,
+            visit_code_sequence=1,
+            timepoint=self.enrol_appointment.timepoint,
+            timepoint_datetime=self.enrol_appointment.timepoint_datetime,
+            appt_datetime=self.enrol_appointment.appt_datetime + relativedelta(days=1),
+            facility_name=self.enrol_appointment.facility_name)
+        self.assertMatchesBaseline(unscheduled)
+        self.make_visit(unscheduled, reason=UNSCHEDULED)
+        self.assertAllMatchBaseline()
+
+    def test_sec_visit_codes(self):
+        cohort_schedules = [
+            cohort_schedule_registry.get(cohort)
+            for cohort in cohort_schedule_registry.cohort_keys
+            if '2002S' in cohort_schedule_registry.get(cohort).schedule.visits]
+        self.assertTrue(cohort_schedules, 'No schedule has a 2002S visit.')
+        cohort_schedule = cohort_schedules[0]
+        self.make_visit(self.enrol_appointment)
+        appointments = self.put_on_schedule(
+            cohort_schedule.cohort,
+            self.enrol_appointment.appt_datetime + relativedelta(days=2))
+        for appointment in appointments:
+            self.assertMatchesBaseline(appointment)
+            if appointment.visit_code == '2002S':
+                break
+            self.make_visit(appointment)
+        self.assertAllMatchBaseline()
+
+    def test_previous_by_timepoint_across_schedules(self):
+        """ Assert an appointment with no earlier appointment by date falls
+            back to the previous appointment by timepoint of any schedule.
+        """
+        cohort = cohort_schedule_registry.quarterly_cohort(
+            self.enrol_appointment.schedule_name)
+        appointments = self.put_on_schedule(
+            cohort, self.enrol_appointment.appt_datetime - relativedelta(years=1))
+        earliest = Appointment.objects.filter(
+            subject_identifier=self.subject_identifier,
+            visit_code_sequence=0).order_by('appt_datetime').first()
+        self.assertIn(earliest, appointments)
+
+        visit_sequence = VisitSequence(appointment=earliest)
+        self.assertEqual(
+            getattr(visit_sequence.previous_appointment, 'id', None),
+            getattr(earliest.previous_by_timepoint, 'id', None))
+        self.assertAllMatchBaseline()
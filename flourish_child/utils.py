@@ -1,9 +1,16 @@
+import calendar
 import logging
+from decimal import Decimal
+
+import numpy as np
 from celery.app import shared_task
 from celery.signals import worker_process_init
 from django.utils import timezone
 
-from flourish_caregiver.helper_classes.cohort import Cohort
+from flourish_child.helper_classes.child_fu_booking_optimizer import \
+    ChildFollowUpBookingOptimizer
+from flourish_child.helper_classes.ultrasound_consent_sync import \
+    UltrasoundConsentSync
 from flourish_child.models import ChildDataset
 
 logger = logging.getLogger(__name__)
@@ -15,15 +22,71 @@ def configure_workers(sender=None, conf=None, **kwargs):
     Random.atfork()
 
 
+def ages_in_years_months(dobs=[], check_date=None):
+    """Returns the ages on `check_date` for an array of dates of birth in
+    the `years.months` form of `Cohort().age_at_enrollment`, e.g. 4 years
+    11 months is 4.11. Ages are computed for all dates in one vectorized
+    pass, with the same month borrowing as `relativedelta`. A missing dob
+    gives 0.
+    """
+    dobs = np.array([np.datetime64(dob, 'D') if dob else np.datetime64('NaT')
+                     for dob in dobs], dtype='datetime64[D]')
+    missing = np.isnat(dobs)
+    dobs = np.where(missing, np.datetime64(check_date, 'D'), dobs)
+
+    dob_months = dobs.astype('datetime64[M]')
+    dob_days = (dobs - dob_months).astype(int) + 1
+    check_month = np.datetime64(check_date, 'M')
+    last_day = calendar.monthrange(check_date.year, check_date.month)[1]
+
+    months = (check_month - dob_months).astype(int)
+    months -= (check_date.day < np.minimum(dob_days, last_day)).astype(int)
+    years, months = np.divmod(months, 12)
+    ages = years + np.where(months < 10, months / 10, months / 100)
+    return np.where(missing, 0, ages)
+
+
+@shared_task
+def over_age_limit(chunk_size=2000):
+    """Sets age today on a child dataset. Ages are computed per chunk of
+    (id, dob) rows and only changed ages are written, with `bulk_update`,
+    so `age_calculation_date` is the date the age last changed.
+    """
+    today = timezone.now().date()
+    rows = ChildDataset.objects.values_list('id', 'dob', 'age_today').order_by(
+        'id').iterator(chunk_size=chunk_size)
+
+    updated = 0
+    while True:
+        chunk = [row for _, row in zip(range(chunk_size), rows)]
+        if not chunk:
+            break
+        ids, dobs, current_ages = zip(*chunk)
+        ages = ages_in_years_months(dobs, today)
+        changed = [
+            ChildDataset(id=obj_id, age_today=age, age_calculation_date=today)
+            for obj_id, current_age, age in zip(
+                ids, current_ages,
+                (Decimal(f'{age:.2f}') for age in ages.tolist()))
+            if current_age != age]
+        ChildDataset.objects.bulk_update(
+            changed, ['age_today', 'age_calculation_date'], batch_size=chunk_size)
+        updated += len(changed)
+
+    logger.info(f'Child dataset ages: {updated} updated.')
+
+
+@shared_task
+def optimize_fu_bookings():
+    """Books all unbooked children for follow up in one batch.
+    """
+    diff = ChildFollowUpBookingOptimizer().apply()
+    logger.info(f'Follow up bookings: {len(diff.get("created"))} created, '
+                f'{len(diff.get("moved"))} moved.')
+
+
 @shared_task
-def over_age_limit():
-    """Sets age today on a child dataset.
+def sync_ultrasound_consents():
+    """Mirrors the ultrasound consents changed on REDCap since the last sync.
     """
-    child_data = ChildDataset.objects.all()
-    over_age_limit = []
-    for child in child_data:
-        age = Cohort().age_at_enrollment(
-            child_dob=child.dob, check_date=timezone.now().date())
-        child.age_today = age
-        child.age_calculation_date = timezone.now().date()
-        child.save()
+    UltrasoundConsentSync().sync()
@@ -1,10 +1,69 @@
-from django.core.exceptions import MultipleObjectsReturned
-from django.db import transaction
-from django.db.models import Q
+from collections import namedtuple
+
+from django.db.models import Exists, F, OuterRef, Q
 from edc_visit_tracking.visit_sequence import VisitSequence, VisitSequenceError
 
 from .helper_classes.utils import child_utils
 
+VisitLink = namedtuple('VisitLink', [
+    'id', 'visit_code', 'visit_code_sequence', 'schedule_name', 'appt_datetime',
+    'timepoint', 'onschedule', 'visit_id', 'visit_visit_schedule_name',
+    'visit_schedule_name', 'visit_visit_code'])
+
+
+class VisitChain:
+    """ A per-subject snapshot of appointments and their visit reports,
+        loaded with a single query, used to resolve the previous
+        appointment and visit in memory.
+    """
+
+    def __init__(self, appointment_model_cls=None, subject_identifier=None):
+        visit_attr = appointment_model_cls.related_visit_model_attr()
+        onschedule = child_utils.subject_schedule_history_cls.objects.filter(
+            subject_identifier=OuterRef('subject_identifier'),
+            schedule_name=OuterRef('schedule_name')).exclude(
+                Q(schedule_name__icontains='tb') | Q(schedule_name__icontains='facet'))
+        appointments = appointment_model_cls.objects.filter(
+            subject_identifier=subject_identifier).annotate(
+                onschedule=Exists(onschedule)).values(
+                    'id', 'visit_code', 'visit_code_sequence', 'schedule_name',
+                    'appt_datetime', 'timepoint', 'onschedule',
+                    visit_id=F(f'{visit_attr}__id'),
+                    visit_visit_schedule_name=F(f'{visit_attr}__visit_schedule_name'),
+                    visit_schedule_name=F(f'{visit_attr}__schedule_name'),
+                    visit_visit_code=F(f'{visit_attr}__visit_code'))
+        self.links = [VisitLink(**appt) for appt in appointments]
+
+    def previous_appointment(self, appointment):
+        """Mirrors `child_utils.get_previous_appt_instance`, falling back to
+        the previous appointment by timepoint.
+        """
+        previous = [link for link in self.links
+                    if link.onschedule and link.visit_code_sequence == 0
+                    and link.appt_datetime < appointment.appt_datetime]
+        if previous:
+            return max(previous, key=lambda link: link.appt_datetime)
+        previous = [link for link in self.links
+                    if link.visit_code_sequence == 0
+                    and link.timepoint < appointment.timepoint]
+        if previous:
+            return max(previous, key=lambda link: link.timepoint)
+        return None
+
+    def visits(self, visit_schedule_name=None, schedule_name=None, visit_code=None):
+        return [link for link in self.links
+                if link.visit_id
+                and link.visit_visit_schedule_name == visit_schedule_name
+                and link.visit_schedule_name == schedule_name
+                and link.visit_visit_code == visit_code]
+
+    def appointments(self, visit_code=None, visit_code_sequence=None):
+        appointments = [
+            link for link in self.links if link.visit_code == visit_code and (
+                visit_code_sequence is None
+                or link.visit_code_sequence == visit_code_sequence)]
+        return sorted(appointments, key=lambda link: -link.visit_code_sequence)
+
 
 class VisitSequence(VisitSequence):
     """ Override property for previous_visit for sequential enrollment
@@ -12,6 +71,8 @@ class VisitSequence(VisitSequence):
         where the previous onschedule appts were last done.
     """
 
+    visit_chain_cls = VisitChain
+
     def __init__(self, appointment=None):
         self.appointment = appointment
         self.appointment_model_cls = self.appointment.__class__
@@ -22,57 +83,62 @@ class VisitSequence(VisitSequence):
         self.subject_identifier = self.appointment.subject_identifier
         self.visit_schedule_name = self.appointment.visit_schedule_name
         self.visit_code = self.appointment.visit_code
+        self.visit_chain = self.visit_chain_cls(
+            appointment_model_cls=self.appointment_model_cls,
+            subject_identifier=self.subject_identifier)
         previous_visit = self.appointment.schedule.visits.previous(
             self.visit_code)
-        self.previous_appointment = child_utils.get_previous_appt_instance(
+        self.previous_appointment = self.visit_chain.previous_appointment(
             self.appointment)
         try:
             self.previous_visit_code = getattr(
                 self.previous_appointment, 'visit_code', None) or previous_visit.code
         except AttributeError:
             self.previous_visit_code = None
-        self.sequence_query = Q()
+        self.previous_visit_code_sequence = None
         if self.visit_code == self.previous_visit_code:
-            previous_visit_code_sequence = getattr(
+            self.previous_visit_code_sequence = getattr(
                 self.previous_appointment, 'visit_code_sequence', 0)
-            self.sequence_query = Q(visit_code_sequence=previous_visit_code_sequence)
-        self.previous_visit_missing = self.previous_visit_code and not self.previous_visit
+        self.previous_visit_id = self.get_previous_visit_id()
+        self.previous_visit_missing = (
+            self.previous_visit_code and not self.previous_visit_id)
 
     @property
     def previous_visit(self):
         """Returns the previous visit model instance if it exists.
         """
-        previous_visit = None
+        if self.previous_visit_id:
+            return self.model_cls.objects.get(pk=self.previous_visit_id)
+        return None
+
+    def get_previous_visit_id(self):
+        """Returns the id of the previous visit resolved from the visit
+        chain, or None.
+        """
+        previous_visit_id = None
         if self.previous_visit_code:
-            with transaction.atomic():
-                try:
-                    previous_visit = self.model_cls.objects.get(
-                        appointment__subject_identifier=self.subject_identifier,
-                        visit_schedule_name=self.visit_schedule_name,
-                        schedule_name=self.appointment.schedule_name,
-                        visit_code=self.previous_visit_code)
-                except (self.model_cls.DoesNotExist, MultipleObjectsReturned):
-                    previous_visit = self.get_previous_visit_by_appt()
-        return previous_visit
-
-    def get_previous_visit_by_appt(self):
-        previous_visit = None
+            visits = self.visit_chain.visits(
+                visit_schedule_name=self.visit_schedule_name,
+                schedule_name=self.appointment.schedule_name,
+                visit_code=self.previous_visit_code)
+            if len(visits) == 1:
+                previous_visit_id = visits[0].visit_id
+            else:
+                previous_visit_id = self.get_previous_visit_id_by_appt()
+        return previous_visit_id
+
+    def get_previous_visit_id_by_appt(self):
+        previous_visit_id = None
         if self.visit_code not in self.exclude_visit_codes:
-            previous_appointment = self.appointment_model_cls.objects.filter(
-                self.sequence_query,
-                subject_identifier=self.subject_identifier,
-                visit_code=self.previous_visit_code).order_by(
-                    '-visit_code_sequence').first()
-            if previous_appointment:
-                try:
-                    previous_visit = self.model_cls.objects.get(
-                        appointment=previous_appointment)
-                except self.model_cls.DoesNotExist:
-                    pass
+            previous_appointments = self.visit_chain.appointments(
+                visit_code=self.previous_visit_code,
+                visit_code_sequence=self.previous_visit_code_sequence)
+            if previous_appointments:
+                previous_visit_id = previous_appointments[0].visit_id
             else:
-                previous_visit = getattr(
-                    self.previous_appointment, self.model_cls._meta.model_name, None)
-        return previous_visit
+                previous_visit_id = getattr(
+                    self.previous_appointment, 'visit_id', None)
+        return previous_visit_id
 
     @property
     def exclude_visit_codes(self):